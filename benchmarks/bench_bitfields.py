@@ -0,0 +1,142 @@
+"""
+Microbenchmark for bitfield packing and unpacking.
+
+Compares the integer shift/mask bitfield engine against the previous list-of-bits
+implementation when decoding ZCL headers and ZDO neighbor table entries.
+
+Usage: python benchmarks/bench_bitfields.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+
+import zigpy.types as t
+from zigpy.zcl import foundation
+import zigpy.zdo.types as zdo_t
+
+ZCL_HEADER = b"\x18\x05\x0a"
+NEIGHBOR = (
+    b"\x11\x00\xff\xee\xdd\xcc\xbb\xaa\x08\x07\x06"
+    b"\x05\x04\x03\x02\x01\x00\x00\x24\x02\x00\x7c"
+)
+
+
+def legacy_bits_deserialize(data: bytes) -> list[int]:
+    bits: list[int] = []
+
+    for byte in data:
+        bits.extend((byte >> i) & 1 for i in range(7, -1, -1))
+
+    return bits
+
+
+def legacy_from_bits(cls, bits: list[int]) -> tuple[t.FixedIntType, list[int]]:
+    n = 0
+
+    for bit in bits[-cls._bits :]:
+        n <<= 1
+        n |= bit & 1
+
+    if cls._signed and n >= 2 ** (cls._bits - 1):
+        n -= 2**cls._bits
+
+    return cls(n), bits[: -cls._bits]
+
+
+def legacy_unpack(data: bytes, types: list[type]) -> list[t.FixedIntType]:
+    bits = legacy_bits_deserialize(data)
+    values = []
+
+    for type_ in types:
+        value, bits = legacy_from_bits(type_, bits)
+        values.append(value)
+
+    return values
+
+
+def legacy_pack(values: list[t.FixedIntType]) -> bytes:
+    bits = []
+
+    for value in values[::-1]:
+        bits.extend((value >> n) & 0b1 for n in range(value._bits - 1, -1, -1))
+
+    result = []
+
+    for index in range(0, len(bits), 8):
+        byte = 0x00
+
+        for bit in bits[index : index + 8]:
+            byte <<= 1
+            byte |= bit
+
+        result.append(byte)
+
+    return bytes(result)
+
+
+def integer_unpack(data: bytes, types: list[type]) -> list[t.FixedIntType]:
+    return t.unpack_bitfields(int.from_bytes(data, "big"), types)
+
+
+def integer_pack(values: list[t.FixedIntType]) -> bytes:
+    n, size = t.pack_bitfields(values)
+    return n.to_bytes(size // 8, "big")
+
+
+def bench(name: str, func, number: int) -> float:
+    usec = timeit.timeit(func, number=number) / number * 1e6
+    print(f"  {name:<40} {usec:8.2f} us")
+
+    return usec
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    frame_control_types = [f.type for f in foundation.FrameControl.fields]
+    neighbor_segment_types = [
+        zdo_t.Neighbor.DeviceType,
+        zdo_t.Neighbor.RxOnWhenIdle,
+        zdo_t.Neighbor.RelationShip,
+        t.uint1_t,
+    ]
+    frame_control = integer_unpack(ZCL_HEADER[:1], frame_control_types)
+    neighbor_segment = integer_unpack(NEIGHBOR[18:19], neighbor_segment_types)
+
+    assert legacy_unpack(ZCL_HEADER[:1], frame_control_types) == frame_control
+    assert legacy_pack(frame_control) == integer_pack(frame_control)
+    assert legacy_pack(neighbor_segment) == integer_pack(neighbor_segment)
+
+    for name, data, types, values in [
+        ("FrameControl", ZCL_HEADER[:1], frame_control_types, frame_control),
+        ("Neighbor segment", NEIGHBOR[18:19], neighbor_segment_types, neighbor_segment),
+    ]:
+        print(f"{name} bitfields:")
+        old = bench(
+            "list of bits unpack", lambda: legacy_unpack(data, types), args.number
+        )
+        new = bench("integer unpack", lambda: integer_unpack(data, types), args.number)
+        print(f"  {'speedup':<40} {old / new:8.2f}x")
+        old = bench("list of bits pack", lambda: legacy_pack(values), args.number)
+        new = bench("integer pack", lambda: integer_pack(values), args.number)
+        print(f"  {'speedup':<40} {old / new:8.2f}x")
+
+    print("Full decoding:")
+    bench(
+        "ZCLHeader.deserialize",
+        lambda: foundation.ZCLHeader.deserialize(ZCL_HEADER),
+        args.number,
+    )
+    bench(
+        "Neighbor.deserialize",
+        lambda: zdo_t.Neighbor.deserialize(NEIGHBOR),
+        args.number,
+    )
+
+
+if __name__ == "__main__":
+    main()
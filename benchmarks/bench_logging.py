@@ -0,0 +1,134 @@
+"""
+Logging overhead benchmark for frame ingest.
+
+Feeds the frame corpus of `bench_serialization.py` through `Device.handle_message`
+with the `zigpy` loggers at WARNING. Debug logging on the ingest path must then be
+free: no log record may be created and none of the `log` methods of devices,
+endpoints, clusters and the ZDO may be called, as they allocate the prefixed message
+and its arguments.
+
+The same frames are then ingested with logging at DEBUG to show the cost that the
+guard avoids. The script exits with a non-zero status if ingest at WARNING creates
+any of these log objects.
+
+Usage: python benchmarks/bench_logging.py [--number N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import sys
+import timeit
+from typing import Callable
+from unittest.mock import MagicMock
+
+from bench_serialization import FRAME_CORPUS
+
+import zigpy.device
+import zigpy.endpoint
+import zigpy.types as t
+from zigpy.zcl import Cluster
+import zigpy.zdo
+
+# ZDO Device_annce
+ZDO_FRAME = (0x0013, "01341277665544332211008e")
+
+LOG_CODE = {
+    zigpy.device.Device.log.__code__,
+    zigpy.endpoint.Endpoint.log.__code__,
+    Cluster.log.__code__,
+    zigpy.zdo.ZDO.log.__code__,
+}
+
+
+def make_ingest() -> Callable[[], None]:
+    app = MagicMock()
+    ieee = t.EUI64.convert("00:11:22:33:44:55:66:77")
+    device = zigpy.device.Device(app, ieee, 0x1234)
+    endpoint = device.add_endpoint(1)
+    endpoint.status = zigpy.endpoint.Status.ZDO_INIT
+    messages = []
+
+    for cluster_id, frame in FRAME_CORPUS.values():
+        if cluster_id not in endpoint.in_clusters:
+            endpoint.add_input_cluster(cluster_id)
+
+        messages.append((0x0104, cluster_id, 1, 1, bytes.fromhex(frame)))
+
+    cluster_id, frame = ZDO_FRAME
+    messages.append((0x0000, cluster_id, 0, 0, bytes.fromhex(frame)))
+
+    def ingest() -> None:
+        for message in messages:
+            device.handle_message(*message)
+
+    return ingest
+
+
+def log_allocations(ingest: Callable[[], None]) -> tuple[int, int]:
+    """Log records created and `log` method calls made during one ingest."""
+
+    records = 0
+    calls = 0
+    factory = logging.getLogRecordFactory()
+
+    def counting_factory(*args, **kwargs):
+        nonlocal records
+        records += 1
+
+        return factory(*args, **kwargs)
+
+    def profile(frame, event, arg) -> None:
+        nonlocal calls
+
+        if event == "call" and frame.f_code in LOG_CODE:
+            calls += 1
+
+    logging.setLogRecordFactory(counting_factory)
+    sys.setprofile(profile)
+
+    try:
+        ingest()
+    finally:
+        sys.setprofile(None)
+        logging.setLogRecordFactory(factory)
+
+    return records, calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args()
+
+    # Handlers may schedule replies, keep their tasks on a loop that is never run
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    logger = logging.getLogger("zigpy")
+    ingest = make_ingest()
+    ingest()
+
+    frames = len(FRAME_CORPUS) + 1
+    results = {}
+
+    for level in (logging.WARNING, logging.DEBUG):
+        logger.setLevel(level)
+        # Discard the formatted messages without writing them anywhere
+        logger.propagate = level != logging.DEBUG
+        records, calls = log_allocations(ingest)
+        usec = timeit.timeit(ingest, number=args.number) / args.number / frames * 1e6
+        results[level] = records, calls
+
+        print(
+            f"  {logging.getLevelName(level):<8} {usec:8.2f} us/frame"
+            f" {records:>6} log records {calls:>6} log calls"
+        )
+
+    if results[logging.WARNING] != (0, 0):
+        print("Ingest at WARNING allocated log objects")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""
+Serialization benchmark for ZCL data types, command schemas and frames.
+
+Round-trips every `foundation.DATA_TYPES` entry, every `GENERAL_COMMANDS` schema,
+every command schema of the clusters registered in `zigpy.zcl.clusters` and a
+corpus of realistic ZCL frames. For every case, deserialize and serialize
+throughput (ops/sec) is reported together with the memory blocks retained by a
+single decoded value and the peak memory used while decoding it.
+
+Results are compared against a stored JSON baseline. Cases whose throughput falls
+below `--threshold` of the baseline are reported as regressions and make the script
+exit with a non-zero status. Throughput depends on the machine, so regenerate the
+baseline with `--update-baseline` on the machine used for comparisons.
+
+Usage: python benchmarks/bench_serialization.py [--number N] [--repeat N]
+                                                [--filter TEXT]
+                                                [--baseline PATH] [--update-baseline]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import pathlib
+import sys
+import timeit
+import tracemalloc
+import types
+from typing import Any, Callable, NamedTuple
+
+from zigpy.zcl import Cluster, foundation
+import zigpy.zcl.clusters  # noqa: F401
+
+BASELINE = pathlib.Path(__file__).with_name("bench_serialization_baseline.json")
+ALLOCATION_ROUNDS = 100
+
+# (cluster ID, frame) pairs captured from common devices
+FRAME_CORPUS = {
+    "OnOff attribute report": (0x0006, "18010a00001001"),
+    "Temperature attribute report": (0x0402, "18020a0000292c08"),
+    "Humidity attribute report": (0x0405, "18030a000021b80b"),
+    "Basic read attributes response": (
+        0x0000,
+        "180401040000420e4c554d492e73656e736f725f687405000042044c554d49",
+    ),
+    "Default response": (0x0006, "18050b0100"),
+    "IasZone status change notification": (0x0500, "090600210000010000"),
+    "LevelControl move to level with on/off": (0x0008, "010704fe0a00"),
+    "Color move to color temperature": (0x0300, "01080a99010a00"),
+    "Metering attribute report": (
+        0x0702,
+        "18090a000025a08601000000" + "00042a102700",
+    ),
+    "ElectricalMeasurement attribute report": (
+        0x0B04,
+        "180a0a0b0529e803" + "080521f000",
+    ),
+    "Configure reporting response": (0x0006, "180b0700"),
+    "Read attributes request": (0x0000, "100c0004000500"),
+}
+
+
+class Case(NamedTuple):
+    name: str
+    decode: Callable[[], Any]
+    encode: Callable[[], Any]
+
+
+def make_sample(type_: type) -> bytes:
+    """Build a valid serialized sample of `type_` from repeating filler bytes."""
+
+    # 0x20 is also the `uint8_t` type ID, so attribute values decode as well
+    for filler in (b"\x20", b"\x02", b"\x01", b"\x00"):
+        # Trailing lists consume all remaining data so look for an exact fit
+        for size in range(64, -1, -1):
+            try:
+                value, rest = type_.deserialize(filler * size)
+                data = value.serialize()
+                decoded, remaining = type_.deserialize(data)
+            except Exception:  # any decoding failure means this size does not fit
+                continue
+
+            if not rest and not remaining and decoded.serialize() == data:
+                return data
+
+    raise ValueError(f"Cannot build a sample for {type_!r}")
+
+
+def type_case(name: str, type_: type) -> Case:
+    data = make_sample(type_)
+    value, _ = type_.deserialize(data)
+
+    return Case(name, lambda: type_.deserialize(data), value.serialize)
+
+
+def frame_case(name: str, cluster_id: int, frame: str) -> Case:
+    device = types.SimpleNamespace(name="bench")
+    endpoint = types.SimpleNamespace(device=device, endpoint_id=1)
+    cluster = Cluster.from_id(endpoint, cluster_id)
+    data = bytes.fromhex(frame)
+
+    hdr, response = cluster.deserialize(data)
+    assert response.serialize() == data[len(hdr.serialize()) :], name
+
+    return Case(
+        name,
+        lambda: cluster.deserialize(data),
+        lambda: hdr.serialize() + response.serialize(),
+    )
+
+
+def collect_cases() -> dict[str, list[Case]]:
+    groups: dict[str, list[Case]] = {
+        "DATA_TYPES": [
+            type_case(f"0x{type_id:02X} {type_.__name__}", type_)
+            for type_id, (_, type_, _) in foundation.DATA_TYPES.items()
+        ],
+        "GENERAL_COMMANDS": [
+            type_case(command.name, command.schema)
+            for command in foundation.GENERAL_COMMANDS.values()
+        ],
+        "Cluster commands": [],
+        "Frames": [
+            frame_case(name, cluster_id, frame)
+            for name, (cluster_id, frame) in FRAME_CORPUS.items()
+        ],
+    }
+
+    clusters = [*Cluster._registry.values(), *Cluster._registry_range.values()]
+
+    for cluster in clusters:
+        for direction, commands in [
+            ("server", cluster.server_commands),
+            ("client", cluster.client_commands),
+        ]:
+            for command in commands.values():
+                name = f"{cluster.__name__}.{direction}.{command.name}"
+                groups["Cluster commands"].append(type_case(name, command.schema))
+
+    return groups
+
+
+def ops_per_sec(func: Callable[[], Any], number: int, repeat: int) -> float:
+    # The fastest run is the least disturbed by the rest of the system
+    return number / min(timeit.repeat(func, number=number, repeat=repeat))
+
+
+def allocations(func: Callable[[], Any]) -> tuple[float, int]:
+    """Memory blocks retained by one result and peak bytes used to produce it."""
+
+    results = [None] * ALLOCATION_ROUNDS
+    func()
+
+    gc.disable()
+
+    try:
+        before = sys.getallocatedblocks()
+
+        for i in range(ALLOCATION_ROUNDS):
+            results[i] = func()
+
+        blocks = (sys.getallocatedblocks() - before) / ALLOCATION_ROUNDS
+
+        tracemalloc.start()
+
+        try:
+            func()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        gc.enable()
+
+    return blocks, peak
+
+
+def run_case(case: Case, number: int, repeat: int) -> dict[str, float]:
+    blocks, peak = allocations(case.decode)
+
+    return {
+        "deserialize_ops": round(ops_per_sec(case.decode, number, repeat)),
+        "serialize_ops": round(ops_per_sec(case.encode, number, repeat)),
+        "blocks": round(blocks, 2),
+        "peak_bytes": peak,
+    }
+
+
+def compare(result: dict[str, float], baseline: dict[str, float] | None) -> str:
+    if baseline is None:
+        return "new"
+
+    return "  ".join(
+        f"{result[key] / baseline[key]:6.2f}x"
+        for key in ("deserialize_ops", "serialize_ops")
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--filter", default="", help="only run matching cases")
+    parser.add_argument("--baseline", type=pathlib.Path, default=BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.8,
+        help="minimum fraction of the baseline throughput",
+    )
+    args = parser.parse_args()
+
+    baseline: dict[str, dict[str, float]] = {}
+
+    if args.baseline.exists():
+        baseline = json.loads(args.baseline.read_text())
+
+    results: dict[str, dict[str, float]] = {}
+    regressions: list[str] = []
+
+    for group, cases in collect_cases().items():
+        cases = [case for case in cases if args.filter in case.name]
+
+        if not cases:
+            continue
+
+        print(f"{group}:")
+        print(
+            f"  {'case':<56} {'decode/s':>10} {'encode/s':>10}"
+            f" {'blocks':>7} {'peak':>7}  vs baseline (decode, encode)"
+        )
+
+        for case in cases:
+            key = f"{group}/{case.name}"
+            result = results[key] = run_case(case, args.number, args.repeat)
+            previous = baseline.get(key)
+
+            print(
+                f"  {case.name[:56]:<56}"
+                f" {result['deserialize_ops']:>10}"
+                f" {result['serialize_ops']:>10}"
+                f" {result['blocks']:>7.1f}"
+                f" {result['peak_bytes']:>7}"
+                f"  {compare(result, previous)}"
+            )
+
+            if previous is not None and any(
+                result[k] < previous[k] * args.threshold
+                for k in ("deserialize_ops", "serialize_ops")
+            ):
+                regressions.append(key)
+
+        group_results = [results[f"{group}/{case.name}"] for case in cases]
+        total_ops = sum(r["deserialize_ops"] for r in group_results)
+        print(f"  {'mean decode ops/sec':<56} {total_ops / len(cases):>10.0f}")
+
+    if args.update_baseline:
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"Baseline written to {args.baseline}")
+    elif regressions:
+        print(f"{len(regressions)} case(s) regressed below {args.threshold:.0%}:")
+
+        for key in regressions:
+            print(f"  {key}")
+
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -618,6 +618,67 @@ async def test_stopped_appdb_listener(tmpdir):
         assert mock_attr_save.call_count == 3
 
 
+@patch("zigpy.device.Device.schedule_initialize", new=mock_dev_init(True))
+async def test_coalesced_attribute_updates(tmpdir):
+    db = os.path.join(str(tmpdir), "test.db")
+    app = await make_app(db)
+    ieee = make_ieee()
+    app.handle_join(99, ieee, 0)
+
+    dev = app.get_device(ieee)
+    ep = dev.add_endpoint(1)
+    ep.status = zigpy.endpoint.Status.ZDO_INIT
+    ep.profile_id = 260
+    ep.device_type = profiles.zha.DeviceType.PUMP
+    clus = ep.add_input_cluster(0)
+    app.device_initialized(dev)
+
+    clus.attribute_coalescing_window = 0.01
+
+    with patch.object(
+        app._dblistener,
+        "_save_attributes",
+        wraps=app._dblistener._save_attributes,
+    ) as mock_save:
+        clus._update_attribute(4, "Custom")
+        clus._update_attribute(5, "Model")
+        clus._update_attribute(5, "Model 2")
+        await asyncio.sleep(0.05)
+        await app.pre_shutdown()
+
+    assert mock_save.call_count == 1
+
+    app2 = await make_app(db)
+    dev = app2.get_device(ieee)
+    assert dev.endpoints[1].in_clusters[0]._attr_cache[4] == "Custom"
+    assert dev.endpoints[1].in_clusters[0]._attr_cache[5] == "Model 2"
+    await app2.pre_shutdown()
+
+
+async def test_attribute_last_updated(tmpdir):
+    db = os.path.join(str(tmpdir), "test.db")
+    app = await make_app(db)
+    ieee = make_ieee()
+    app.handle_join(99, ieee, 0)
+
+    dev = app.get_device(ieee)
+    ep = dev.add_endpoint(1)
+    ep.status = zigpy.endpoint.Status.ZDO_INIT
+    ep.profile_id = 260
+    ep.device_type = profiles.zha.DeviceType.PUMP
+    clus = ep.add_input_cluster(0)
+    clus._update_attribute(4, "Custom")
+    app.device_initialized(dev)
+
+    clus._update_attribute(5, "Model")
+    await app.pre_shutdown()
+
+    app2 = await make_app(db)
+    clus2 = app2.get_device(ieee).endpoints[1].in_clusters[0]
+    assert clus2._attr_last_updated == clus._attr_last_updated
+    await app2.pre_shutdown()
+
+
 @patch.object(Device, "schedule_initialize", new=mock_dev_init(True))
 async def test_invalid_node_desc(tmpdir):
     """devices without a valid node descriptor should not save the node descriptor."""
@@ -457,3 +457,29 @@ async def test_v5_to_v7_migration(test_db):
 
     app = await make_app(test_db_v5)
     await app.pre_shutdown()
+
+
+async def test_v7_to_v8_migration(test_db):
+    test_db_v7 = test_db("simple_v7.sql")
+
+    with sqlite3.connect(test_db_v7) as conn:
+        cur = conn.cursor()
+        attributes_before = list(cur.execute("SELECT * FROM attributes_cache_v7"))
+
+    app = await make_app(test_db_v7)
+    dev = app.get_device(ieee=t.EUI64.convert("00:0d:6f:ff:fe:a6:11:7a"))
+    basic = dev.endpoints[1].in_clusters[0]
+
+    # Cached attributes migrated from older databases are of unknown age
+    assert basic._attr_cache[5] == "TRADFRI control outlet"
+    assert basic._attr_last_updated[5] == 0
+    await app.pre_shutdown()
+
+    with sqlite3.connect(test_db_v7) as conn:
+        cur = conn.cursor()
+        cur.execute("PRAGMA user_version")
+        assert cur.fetchone() == (8,)
+
+        attributes_after = list(cur.execute("SELECT * FROM attributes_cache_v8"))
+
+    assert attributes_after == [row + (0,) for row in attributes_before]
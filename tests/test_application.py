@@ -10,13 +10,18 @@ from zigpy.config import (
     CONF_DATABASE,
     CONF_DEVICE,
     CONF_DEVICE_PATH,
+    CONF_INTERVIEW_TEMPLATES,
+    CONF_MAX_CONCURRENT_REQUESTS,
+    CONF_MAX_ZCL_FRAME_SIZE,
     CONF_OTA,
     CONF_OTA_IKEA,
     ZIGPY_SCHEMA,
 )
+import zigpy.device
 from zigpy.exceptions import DeliveryError
 import zigpy.ota
 import zigpy.quirks
+import zigpy.scheduler
 import zigpy.state as app_state
 import zigpy.types as t
 import zigpy.zdo.types as zdo_t
@@ -353,11 +358,168 @@ def test_add_device(app, ieee):
     assert app.get_device(ieee).nwk == 9
 
 
+async def test_get_sequence(app, ieee):
+    dev1 = app.add_device(ieee, 8)
+    dev2 = app.add_device(t.EUI64.convert("aa:bb:cc:dd:11:22:33:44"), 9)
+    assert app.get_sequence() == 1
+
+    # TSNs of requests still pending on any device are skipped
+    with dev1._pending.new(2), dev2._pending.new(3):
+        assert app.get_sequence() == 4
+
+    assert app.get_sequence() == 5
+    assert not app._tsns_in_flight
+
+    counters = app.state.counters["tsn"]
+    assert counters["allocated"] == 5
+    assert counters["in_flight_skipped"] == 2
+    assert counters["max_in_flight"] == 2
+    assert counters["exhausted"] == 0
+
+    for tsn in range(256):
+        dev1._pending[tsn] = sentinel.request
+
+    app.get_sequence()
+    assert counters["exhausted"] == 1
+
+
+async def test_group_cluster_command(app):
+    app.mrequest = AsyncMock(return_value=(0, "sent"))
+    group = app.groups.add_group(0x1234, "Test group")
+
+    with app.add_device(t.EUI64.convert("aa:bb:cc:dd:11:22:33:44"), 9)._pending.new(1):
+        await group.endpoint.on_off.on()
+
+    # Groups have no pending requests of their own, TSNs come from the shared counter
+    assert app.mrequest.await_count == 1
+    assert app.mrequest.call_args[0][0] == 0x1234
+    assert app.mrequest.call_args[0][4] == 2
+
+
+def test_max_zcl_frame_size(app):
+    # Requests are only split when the radio or the configuration set a limit
+    assert app.max_zcl_frame_size is None
+
+    app.update_config({CONF_MAX_ZCL_FRAME_SIZE: 82})
+    assert app.max_zcl_frame_size == 82
+
+
+async def test_send_methods_admitted(app, ieee):
+    class RadioApp(type(app)):
+        async def request(self, device, profile, cluster, *args, **kwargs):
+            assert self.transmit_scheduler._in_flight == 1
+            return await super().request(device, profile, cluster, *args, **kwargs)
+
+        async def mrequest(self, group_id, profile, cluster, src_ep, sequence, data):
+            assert self.transmit_scheduler._in_flight == 1
+            return await self.request(
+                None, profile, cluster, src_ep, src_ep, sequence, data
+            )
+
+        async def broadcast(self, profile, cluster, *args, **kwargs):
+            assert self.transmit_scheduler._in_flight == 1
+
+    radio_app = RadioApp({**app.config, CONF_MAX_CONCURRENT_REQUESTS: 1})
+    dev = radio_app.add_device(ieee, 8)
+    counters = radio_app.state.counters["transmit"]
+
+    # Nested calls to the send methods do not wait for a second slot
+    await asyncio.wait_for(
+        radio_app.request(dev, 260, 6, 1, 1, 1, b"", expect_reply=False), 1
+    )
+    await asyncio.wait_for(radio_app.mrequest(0x1234, 260, 6, 1, 2, b""), 1)
+    await asyncio.wait_for(
+        radio_app.broadcast(
+            260,
+            0x0019,
+            1,
+            1,
+            0,
+            0,
+            3,
+            b"",
+            broadcast_address=t.BroadcastAddress.ALL_DEVICES,
+        ),
+        1,
+    )
+
+    assert counters["interactive_requests"].value == 2
+    assert counters["ota_requests"].value == 1
+    assert radio_app.transmit_scheduler._in_flight == 0
+
+
 def test_get_device_nwk(app, ieee):
     dev = app.add_device(ieee, 8)
     assert app.get_device(nwk=8) is dev
 
 
+def test_get_device_nwk_index(app, ieee):
+    dev = app.add_device(ieee, 8)
+    with patch.object(dev, "schedule_initialize"):
+        app.handle_join(9, ieee, 0)
+
+    assert app._nwk_index == {9: dev}
+    assert app.get_device(nwk=9) is dev
+
+    with pytest.raises(KeyError):
+        app.get_device(nwk=8)
+
+    # Devices re-addressed directly are still found
+    dev.nwk = 10
+    assert app.get_device(nwk=10) is dev
+    assert app._nwk_index[10] is dev
+
+    quirked = MagicMock(ieee=ieee, nwk=10)
+    with patch("zigpy.quirks.get_device", return_value=quirked):
+        app.device_initialized(dev)
+
+    assert app.get_device(nwk=10) is quirked
+
+
+def test_get_device_nwk_conflict(app):
+    listener = MagicMock()
+    app.add_listener(listener)
+
+    ieee1 = t.EUI64.convert("00:11:22:33:44:55:66:77")
+    ieee2 = t.EUI64.convert("00:11:22:33:44:55:66:88")
+    dev1 = app.add_device(ieee1, 8)
+    dev2 = app.add_device(ieee2, 8)
+
+    listener.nwk_address_conflict.assert_called_once_with(8, dev1, dev2)
+    assert app.get_device(nwk=8) is dev2
+
+
+async def test_get_device_nwk_removed(app, ieee):
+    dev = app.add_device(ieee, 8)
+    dev.zdo.leave = AsyncMock()
+    await app._remove_device(dev)
+
+    assert app._nwk_index == {}
+    with pytest.raises(KeyError):
+        app.get_device(nwk=8)
+
+
+@pytest.mark.parametrize("enabled", [False, True])
+async def test_interview_templates_config(app, ieee, enabled):
+    app.update_config({CONF_INTERVIEW_TEMPLATES: enabled})
+    dev = app.add_device(ieee, 8)
+
+    with patch.object(
+        app,
+        "_interview_templates",
+        MagicMock(spec_set=zigpy.device.InterviewTemplates),
+    ) as templates:
+        app.device_initialized(dev)
+        await app.apply_interview_template(dev)
+
+    if enabled:
+        templates.add_device.assert_called_once_with(dev)
+        templates.apply.assert_awaited_once_with(dev)
+    else:
+        assert templates.add_device.call_count == 0
+        assert templates.apply.await_count == 0
+
+
 def test_get_device_ieee(app, ieee):
     dev = app.add_device(ieee, 8)
     assert app.get_device(ieee=ieee) is dev
@@ -669,7 +831,9 @@ async def test_device_join_rejoin(is_init_mock, group_scan_mock, init_mock, app,
     app.handle_join(0x0001, ieee, None)
     app.listener_event.assert_called_once_with("device_joined", ANY)
     app.listener_event.reset_mock()
-    init_mock.assert_called_once()
+    init_mock.assert_called_once_with()
+    dev = app.get_device(ieee)
+    assert dev._interview_priority == zigpy.scheduler.InterviewPriority.JOIN
     init_mock.reset_mock()
 
     # Second join with the same NWK is just a reset, not a join
@@ -678,7 +842,7 @@ async def test_device_join_rejoin(is_init_mock, group_scan_mock, init_mock, app,
     group_scan_mock.assert_not_called()
 
     # Since the device is still partially initialized, re-initialize it
-    init_mock.assert_called_once()
+    init_mock.assert_called_once_with()
     init_mock.reset_mock()
 
     # Another join with the same NWK but initialized will trigger a group re-scan
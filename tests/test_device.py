@@ -7,6 +7,7 @@ from zigpy import device, endpoint
 import zigpy.application
 import zigpy.exceptions
 from zigpy.profiles import zha
+import zigpy.scheduler
 import zigpy.state
 import zigpy.types as t
 from zigpy.zdo import types as zdo_t
@@ -67,6 +68,178 @@ async def test_initialize(monkeypatch, dev):
     assert dev._application.device_initialized.call_count == 3
 
 
+async def test_schedule_initialize_priority(dev):
+    dev._scheduled_initialize = AsyncMock()
+
+    # The priority set when the device joined only applies to its next interview
+    dev._interview_priority = zigpy.scheduler.InterviewPriority.JOIN
+    await dev.schedule_initialize()
+    dev._scheduled_initialize.assert_called_once_with(
+        zigpy.scheduler.InterviewPriority.JOIN
+    )
+
+    dev._scheduled_initialize.reset_mock()
+    await dev.schedule_initialize()
+    dev._scheduled_initialize.assert_called_once_with(
+        zigpy.scheduler.InterviewPriority.RESUME
+    )
+
+
+async def test_initialize_endpoints_concurrently(monkeypatch, dev):
+    running = 0
+    max_running = 0
+
+    async def mockrequest(nwk, tries=None, delay=None):
+        return [0, None, [1, 2, 3, 4, 5]]
+
+    async def mockepinit(self, *args, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+        self.status = endpoint.Status.ZDO_INIT
+
+    async def mock_ep_get_model_info(self):
+        return "Model", "Manufacturer"
+
+    monkeypatch.setattr(endpoint.Endpoint, "initialize", mockepinit)
+    monkeypatch.setattr(endpoint.Endpoint, "get_model_info", mock_ep_get_model_info)
+    dev.zdo.Active_EP_req = mockrequest
+    await dev.initialize()
+
+    assert dev.is_initialized
+    assert max_running == device.MAX_CONCURRENT_ENDPOINT_REQUESTS
+
+
+async def test_initialize_endpoints_first_error(monkeypatch, dev):
+    async def mockrequest(nwk, tries=None, delay=None):
+        return [0, None, [1, 2, 3]]
+
+    async def mockepinit(self, *args, **kwargs):
+        if self.endpoint_id == 1:
+            await asyncio.sleep(0.01)
+            raise AttributeError
+        elif self.endpoint_id == 2:
+            raise KeyError
+
+        self.status = endpoint.Status.ZDO_INIT
+
+    monkeypatch.setattr(endpoint.Endpoint, "initialize", mockepinit)
+    dev.zdo.Active_EP_req = mockrequest
+
+    # The error of the first endpoint is raised, even if it was not the first to fail
+    with pytest.raises(AttributeError):
+        await dev._initialize()
+
+    # Endpoints that did not fail are still initialized
+    assert dev.endpoints[3].status == endpoint.Status.ZDO_INIT
+
+
+def _template_device(app, ieee, node_desc):
+    dev = device.Device(app, t.EUI64.convert(ieee), 0x1234)
+    dev.node_desc = node_desc
+
+    for endpoint_id in (1, 2):
+        dev.add_endpoint(endpoint_id)
+
+    return dev
+
+
+async def test_interview_templates(app_mock):
+    node_desc = zdo_t.NodeDescriptor(1, 64, 142, 4388, 82, 255, 0, 255, 0)
+    templates = device.InterviewTemplates()
+
+    known = _template_device(app_mock, "00:11:22:33:44:55:66:77", node_desc)
+    known.model = "Model"
+    known.manufacturer = "Manufacturer"
+
+    for ep in known.non_zdo_endpoints:
+        ep.profile_id = zha.PROFILE_ID
+        ep.device_type = zha.DeviceType.ON_OFF_LIGHT
+        ep.add_input_cluster(0x0000)
+        ep.add_input_cluster(0x0006 + ep.endpoint_id)
+        ep.add_output_cluster(0x0019)
+        ep.status = endpoint.Status.ZDO_INIT
+
+    templates.add_device(known)
+
+    async def simple_desc_req(nwk, endpoint_id, tries=None, delay=None):
+        sd = zdo_t.SimpleDescriptor()
+        sd.endpoint = endpoint_id
+        sd.profile = zha.PROFILE_ID
+        sd.device_type = zha.DeviceType.ON_OFF_LIGHT
+        sd.input_clusters = [0x0000, 0x0007]
+        sd.output_clusters = [0x0019]
+        return [0, None, sd]
+
+    async def get_model_info(self):
+        return "Model", "Manufacturer"
+
+    new = _template_device(app_mock, "00:11:22:33:44:55:66:88", node_desc)
+    new.zdo.Simple_Desc_req = AsyncMock(side_effect=simple_desc_req)
+
+    with patch.object(endpoint.Endpoint, "get_model_info", get_model_info):
+        assert await templates.apply(new)
+
+    # Only the first endpoint is interviewed, the rest is cloned
+    assert new.zdo.Simple_Desc_req.await_count == 1
+    assert new.all_endpoints_init
+    assert new.model == "Model"
+    assert new.manufacturer == "Manufacturer"
+    assert new.get_signature() == known.get_signature()
+
+    # Devices that do not match the verified endpoint are interviewed normally
+    other = _template_device(app_mock, "00:11:22:33:44:55:66:99", node_desc)
+    other.zdo.Simple_Desc_req = AsyncMock(side_effect=simple_desc_req)
+
+    with patch.object(endpoint.Endpoint, "get_model_info", get_model_info):
+        with patch.object(
+            device.EndpointTemplate, "from_endpoint", return_value=sentinel.other
+        ):
+            assert not await templates.apply(other)
+
+    assert not other.all_endpoints_init
+
+    # Model info read while verifying is kept, even if no template matches
+    async def get_other_model_info(self):
+        return "Other model", "Manufacturer"
+
+    other = _template_device(app_mock, "00:11:22:33:44:55:66:99", node_desc)
+    other.zdo.Simple_Desc_req = AsyncMock(side_effect=simple_desc_req)
+
+    with patch.object(endpoint.Endpoint, "get_model_info", get_other_model_info):
+        assert not await templates.apply(other)
+
+    assert not other.all_endpoints_init
+    assert other.model == "Other model"
+    assert other.manufacturer == "Manufacturer"
+
+    # Incomplete node descriptors are ignored
+    partial = _template_device(
+        app_mock,
+        "00:11:22:33:44:55:66:bb",
+        zdo_t.NodeDescriptor(logical_type=zdo_t.LogicalType.Router),
+    )
+    partial.model = "Model"
+    partial.manufacturer = "Manufacturer"
+    partial.zdo.Simple_Desc_req = AsyncMock()
+    templates.add_device(partial)
+    assert not await templates.apply(partial)
+    assert partial.zdo.Simple_Desc_req.await_count == 0
+
+    # Devices with a different node descriptor are not interviewed at all
+    unknown = _template_device(
+        app_mock,
+        "00:11:22:33:44:55:66:aa",
+        zdo_t.NodeDescriptor(2, 64, 142, 4388, 82, 255, 0, 255, 0),
+    )
+    unknown.zdo.Simple_Desc_req = AsyncMock()
+    assert not await templates.apply(unknown)
+    assert unknown.zdo.Simple_Desc_req.await_count == 0
+
+
 async def test_initialize_fail(dev):
     async def mockrequest(nwk, tries=None, delay=None):
         return [1, dev.nwk, []]
@@ -273,6 +446,32 @@ async def test_handle_message_deserialize_error(dev):
     assert ep.handle_message.call_count == 0
 
 
+async def test_handle_message_frame(dev):
+    ep = dev.add_endpoint(3)
+    ep.add_input_cluster(0x0003)
+    ep.handle_frame = MagicMock()
+    dev.handle_message(0x0104, 0x0003, 3, 3, b"\x01\x01\x00\x05\x00")
+
+    # Frames that are not replies are passed on without decoding their payload
+    assert ep.handle_frame.call_count == 1
+    frame = ep.handle_frame.call_args[0][2]
+    assert frame.hdr.tsn == 1
+    assert not frame.is_decoded
+
+
+async def test_handle_message_dispatch(dev):
+    ep = dev.add_endpoint(3)
+    cluster = ep.add_input_cluster(0x0006)
+    cluster._handle_cluster_command = MagicMock()
+    dev.handle_message(0x0104, 0x0006, 3, 3, b"\x01\x01\x01")
+
+    # Frames reach the handler from the cluster's dispatch table
+    assert cluster._handle_cluster_command.call_count == 1
+    hdr, args = cluster._handle_cluster_command.call_args[0]
+    assert hdr.command_id == 0x01
+    assert args == cluster.server_commands[0x01].schema()
+
+
 def test_endpoint_getitem(dev):
     ep = dev.add_endpoint(3)
     assert dev[3] is ep
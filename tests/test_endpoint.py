@@ -146,6 +146,36 @@ def test_handle_message_output(ep):
     )
 
 
+def test_handle_frame(ep):
+    c = ep.add_input_cluster(0)
+    c.handle_frame = MagicMock()
+    ep.handle_frame(sentinel.profile, 0, sentinel.frame)
+    c.handle_frame.assert_called_once_with(sentinel.frame, dst_addressing=None)
+
+
+def test_handle_frame_handle_message_overridden(ep):
+    ep.add_input_cluster(0)
+    ep.handle_message = MagicMock()
+    frame = ep.deserialize_frame(0, b"\x18\x01\x0a\x00\x00\x10\x01")
+    ep.handle_frame(sentinel.profile, 0, frame)
+
+    # Endpoints overriding `handle_message` receive decoded payloads
+    assert frame.is_decoded
+    ep.handle_message.assert_called_once_with(
+        sentinel.profile, 0, frame.hdr, frame.payload, dst_addressing=None
+    )
+
+
+def test_deserialize_frame_deserialize_overridden(ep):
+    ep.add_input_cluster(0)
+    ep.deserialize = MagicMock(return_value=(sentinel.hdr, sentinel.args))
+    frame = ep.deserialize_frame(0, b"\x18\x01\x0a\x00\x00\x10\x01")
+
+    assert frame.is_decoded
+    assert frame.hdr is sentinel.hdr
+    assert frame.payload is sentinel.args
+
+
 def test_handle_request_unknown(ep):
     hdr = MagicMock()
     hdr.command_id = sentinel.command_id
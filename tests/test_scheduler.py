@@ -0,0 +1,176 @@
+import asyncio
+
+import pytest
+
+import zigpy.scheduler
+from zigpy.scheduler import (
+    InterviewPriority,
+    InterviewScheduler,
+    Priority,
+    TransmitScheduler,
+    get_priority,
+    transmit_priority,
+)
+import zigpy.types as t
+
+from .async_mock import MagicMock, patch
+
+
+def test_get_priority():
+    assert get_priority(0x0104, 0x0006) == Priority.INTERACTIVE
+    assert get_priority(0x0104, 0x0019) == Priority.OTA
+    assert get_priority(0x0104, 0x0500) == Priority.SECURITY
+    assert get_priority(0x0000, 0x0019) == Priority.INTERACTIVE
+
+    with transmit_priority(Priority.MAINTENANCE):
+        assert get_priority(0x0104, 0x0006) == Priority.MAINTENANCE
+        assert get_priority(0x0104, 0x0019) == Priority.MAINTENANCE
+
+    assert get_priority(0x0104, 0x0006) == Priority.INTERACTIVE
+
+
+async def test_admission_order():
+    scheduler = TransmitScheduler(max_in_flight=1)
+    sent = []
+
+    async def send(priority, name):
+        async with scheduler.admit(priority):
+            sent.append(name)
+            await asyncio.sleep(0)
+
+    tasks = [
+        asyncio.create_task(send(Priority.OTA, "ota1")),
+        asyncio.create_task(send(Priority.OTA, "ota2")),
+        asyncio.create_task(send(Priority.MAINTENANCE, "maintenance")),
+        asyncio.create_task(send(Priority.INTERACTIVE, "interactive")),
+    ]
+    await asyncio.sleep(0)
+
+    assert scheduler.in_flight == 1
+    assert scheduler.queue_depth == {
+        Priority.INTERACTIVE: 1,
+        Priority.SECURITY: 0,
+        Priority.MAINTENANCE: 1,
+        Priority.OTA: 1,
+    }
+
+    await asyncio.gather(*tasks)
+
+    assert sent == ["ota1", "interactive", "maintenance", "ota2"]
+    assert scheduler.in_flight == 0
+    assert scheduler.counters["ota_requests"] == 2
+    assert scheduler.counters["ota_queued"] == 1
+    assert scheduler.counters["interactive_queued"] == 1
+    assert scheduler.counters["max_queue_depth"] == 3
+
+
+async def test_admission_window():
+    scheduler = TransmitScheduler(max_in_flight=2)
+    release = asyncio.Event()
+
+    async def send():
+        async with scheduler.admit(Priority.INTERACTIVE):
+            await release.wait()
+
+    tasks = [asyncio.create_task(send()) for _ in range(5)]
+    await asyncio.sleep(0)
+
+    assert scheduler.in_flight == 2
+    assert scheduler.queue_depth[Priority.INTERACTIVE] == 3
+
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert scheduler.in_flight == 0
+
+
+async def test_admission_cancelled():
+    scheduler = TransmitScheduler(max_in_flight=1)
+    release = asyncio.Event()
+
+    async def send():
+        async with scheduler.admit(Priority.INTERACTIVE):
+            await release.wait()
+
+    task1 = asyncio.create_task(send())
+    task2 = asyncio.create_task(send())
+    await asyncio.sleep(0)
+
+    # Cancelled waiters give up their place in the queue
+    task2.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await task2
+
+    assert scheduler.queue_depth[Priority.INTERACTIVE] == 0
+
+    release.set()
+    await task1
+
+    assert scheduler.in_flight == 0
+
+    async with scheduler.admit(Priority.INTERACTIVE):
+        assert scheduler.in_flight == 1
+
+
+def test_interview_backoff():
+    scheduler = InterviewScheduler(max_in_flight=1)
+    dev = MagicMock(ieee=t.EUI64.convert("00:11:22:33:44:55:66:77"))
+    assert scheduler.backoff_delay(dev.ieee) == 0
+
+    with patch("time.monotonic", return_value=1000):
+        scheduler.device_init_failure(dev)
+        assert scheduler.backoff_delay(dev.ieee) == 5
+
+        scheduler.device_init_failure(dev)
+        assert scheduler.backoff_delay(dev.ieee) == 10
+
+        for _ in range(10):
+            scheduler.device_init_failure(dev)
+
+        assert (
+            scheduler.backoff_delay(dev.ieee) == zigpy.scheduler.INTERVIEW_BACKOFF_MAX
+        )
+
+    with patch("time.monotonic", return_value=1004):
+        assert scheduler.backoff_delay(dev.ieee) == (
+            zigpy.scheduler.INTERVIEW_BACKOFF_MAX - 4
+        )
+
+    scheduler.device_initialized(dev)
+    assert scheduler.backoff_delay(dev.ieee) == 0
+    assert scheduler.counters["failed"] == 12
+    assert scheduler.counters["initialized"] == 1
+
+
+async def test_interview_order():
+    scheduler = InterviewScheduler(max_in_flight=1)
+    interviewed = []
+
+    async def interview(name, priority):
+        dev = MagicMock(ieee=t.EUI64.convert("00:11:22:33:44:55:66:77"))
+
+        async with scheduler.interview(dev, priority):
+            interviewed.append(name)
+            await asyncio.sleep(0)
+
+    await asyncio.gather(
+        interview("resume1", InterviewPriority.RESUME),
+        interview("resume2", InterviewPriority.RESUME),
+        interview("join", InterviewPriority.JOIN),
+    )
+
+    assert interviewed == ["resume1", "join", "resume2"]
+
+
+async def test_interview_backoff_delay():
+    scheduler = InterviewScheduler(max_in_flight=1)
+    dev = MagicMock(ieee=t.EUI64.convert("00:11:22:33:44:55:66:77"))
+    scheduler.device_init_failure(dev)
+
+    with patch("asyncio.sleep") as sleep:
+        async with scheduler.interview(dev, InterviewPriority.RESUME):
+            pass
+
+    assert 0 < sleep.call_args[0][0] <= 5
+    assert scheduler.counters["backoff"] == 1
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import enum
+import struct
 from unittest import mock
 
 import pytest
@@ -774,3 +775,175 @@ def test_struct_field_repr():
     s1 = TestStruct(foo=1, bar=2, baz="asd")
 
     assert repr(s1) == "TestStruct(foo=2, bar=bar, baz=baz)"
+
+
+def test_compiled_codec_layout():
+    class TestStruct(t.Struct):
+        foo: t.uint8_t
+        bar: t.int16s
+        baz: t.uint24_t
+        asd: t.uint4_t
+        qux: Status
+        zxc: t.uint4_t
+        tail: t.LVBytes
+
+    assert TestStruct._codec is not None
+
+    s = TestStruct(
+        foo=1,
+        bar=-2,
+        baz=0x030201,
+        asd=0b1010,
+        qux=Status.FAILURE,
+        zxc=0b0101,
+        tail=b"x",
+    )
+    assert s.serialize() == (
+        b"\x01\xFE\xFF\x01\x02\x03" + bytes([0b0101_0000, 0b0001_1010]) + b"\x01x"
+    )
+    assert TestStruct.deserialize(s.serialize() + b"asd") == (s, b"asd")
+
+
+def test_compiled_codec_floats(monkeypatch):
+    class TestStruct(t.Struct):
+        x: t.Single
+        y: t.Single
+        z: t.Half
+        status: t.uint8_t
+
+    # Consecutive floats of the same type are packed together
+    steps = TestStruct._codec.steps
+    assert [[f.name for f in step.fields] for step in steps] == [
+        ["x", "y"],
+        ["z"],
+        ["status"],
+    ]
+
+    s = TestStruct(x=1.5, y=-2, z=0.5, status=1)
+    data = struct.pack("<ffeB", 1.5, -2, 0.5, 1)
+    assert s.serialize() == data
+    assert TestStruct.deserialize(data + b"asd") == (s, b"asd")
+    assert type(TestStruct.deserialize(data)[0].y) is t.Single
+
+    with pytest.raises(ValueError):
+        TestStruct.deserialize(data[:6])
+
+    monkeypatch.setattr(TestStruct, "_codec", None)
+    assert s.serialize() == data
+    assert TestStruct.deserialize(data + b"asd") == (s, b"asd")
+
+
+def test_compiled_codec_dynamic_bitfields():
+    class TestStruct(t.Struct):
+        foo: t.uint4_t
+        bar: t.uint8_t = t.StructField(requires=lambda s: s.foo == 0x01)
+        baz: t.uint4_t
+
+    # Bitfield segments that depend on other fields cannot be compiled
+    assert TestStruct._codec is None
+
+    assert TestStruct(foo=1, bar=0x23, baz=4).serialize() == b"\x42\x31"
+    assert TestStruct(foo=2, baz=3).serialize() == b"\x32"
+
+
+@pytest.mark.parametrize(
+    "struct_type, data",
+    [
+        (zdo_t.Neighbor, b"\x11\x00\xff\xee\xdd\xcc\xbb\xaa\x08\x07\x06\x05"),
+        (zdo_t.Neighbor, b"\x11\x00\xff\xee\xdd\xcc\xbb\xaa\x08\x07\x06\x05" * 2),
+        (zdo_t.NodeDescriptor, b"\x01\x40\x8e\x5f\x10\x52\x52\x00\x41\x2c\x52\x00\x00"),
+        (zdo_t.NodeDescriptor, b"\x01\x40\x8e\x5f"),
+        (zdo_t.MultiAddress, b"\x03\x01\x02\x03\x04\x05\x06\x07\x08\x01"),
+        (zdo_t.NwkUpdate, b"\x00\xf8\xff\x07\xfe\x01"),
+        (zdo_t.NwkUpdate, b"\x00\xf8\xff\x07\xff\x01\x34\x12"),
+    ],
+)
+def test_compiled_codec_matches_generic(struct_type, data, monkeypatch):
+    def roundtrip():
+        try:
+            instance, remaining = struct_type.deserialize(data)
+        except ValueError as e:
+            return repr(e)
+
+        return instance.as_dict(), remaining, instance.serialize()
+
+    assert struct_type._codec is not None
+    compiled = roundtrip()
+
+    monkeypatch.setattr(struct_type, "_codec", None)
+    assert roundtrip() == compiled
+
+
+def test_struct_slots():
+    class TestStruct(t.Struct):
+        foo: t.uint8_t
+        bar: t.uint16_t = t.StructField(requires=lambda s: s.foo == 1)
+        CONSTANT: int = 3
+
+    class SubStruct(TestStruct):
+        foo: t.uint8_t = t.StructField(repr=hex)
+        baz: t.uint8_t
+
+    assert TestStruct.__slots__ == ("foo", "bar")
+    assert SubStruct.__slots__ == ("baz",)
+    assert TestStruct.CONSTANT == 3
+
+    # Field definitions survive being moved out of the class namespace
+    assert TestStruct.fields.bar.requires(TestStruct(foo=1))
+    assert [f.name for f in SubStruct.fields] == ["foo", "bar", "baz"]
+    assert SubStruct.fields.foo.repr is hex
+    assert repr(SubStruct(foo=1, bar=2, baz=3)) == "SubStruct(foo=0x1, bar=2, baz=3)"
+
+    s = TestStruct(foo=1, bar=2)
+    assert not hasattr(s, "__dict__")
+
+    with pytest.raises(AttributeError):
+        s.unknown = 1
+
+    # Integral structs and tuple-like structs cannot have slots
+    class IntStruct(t.Struct, t.uint8_t):
+        foo: t.uint4_t
+        bar: t.uint4_t
+
+    assert "__slots__" not in vars(IntStruct)
+    assert IntStruct(0x21) == IntStruct(foo=1, bar=2)
+
+
+def test_struct_generated_constructor():
+    class TestStruct(t.Struct):
+        foo: t.uint8_t
+        self: t.uint16_t
+
+    s = TestStruct(1, self=2)
+    assert s.as_dict() == {"foo": 1, "self": 2}
+    assert type(s.foo) is t.uint8_t
+    assert type(s.self) is t.uint16_t
+    assert TestStruct().as_dict() == {"foo": None, "self": None}
+
+    # Copy constructor
+    s2 = TestStruct(s)
+    assert s2 == s and s2 is not s
+
+    with pytest.raises(TypeError):
+        TestStruct(1, 2, 3)
+
+    with pytest.raises(TypeError):
+        TestStruct(1, foo=1)
+
+    with pytest.raises(TypeError):
+        TestStruct(unknown=1)
+
+    with pytest.raises(ValueError):
+        TestStruct(foo=-1)
+
+
+def test_struct_field_shadowing_builtin():
+    class TestStruct(t.Struct):
+        type: t.uint8_t
+        value: t.uint16_t
+
+    assert TestStruct(type=None, value=2).as_dict() == {"type": None, "value": 2}
+
+    s = TestStruct(type=1, value=2)
+    assert type(s.type) is t.uint8_t
+    assert TestStruct.deserialize(s.serialize()) == (s, b"")
@@ -1,5 +1,7 @@
+import gc
 import itertools
 import math
+import pickle
 import struct
 
 import pytest
@@ -34,6 +36,136 @@ def test_int_out_of_bounds():
         t.uint8_t(0xFF + 1)
 
 
+def test_int_bounds():
+    assert (t.uint8_t._min_value, t.uint8_t._max_value) == (0, 0xFF)
+    assert (t.int8s._min_value, t.int8s._max_value) == (-128, 127)
+    assert (t.uint3_t._min_value, t.uint3_t._max_value) == (0, 0b111)
+    assert t.uint_t._min_value is None
+
+    t.int16s(-(2**15))
+    t.int16s(2**15 - 1)
+
+    with pytest.raises(ValueError, match="is not a signed 16 bit integer"):
+        t.int16s(2**15)
+
+    with pytest.raises(ValueError, match="is not an unsigned 16 bit integer"):
+        t.uint16_t(-1)
+
+
+def test_int_small_value_cache():
+    # Small types share their instances
+    assert t.uint8_t(5) is t.uint8_t(5)
+    assert t.uint8_t.deserialize(b"\x05")[0] is t.uint8_t(5)
+    assert t.int8s(-1) is t.int8s.deserialize(b"\xFF")[0]
+    assert t.uint1_t(1) is t.uint1_t(1)
+    assert type(t.uint8_t(5)) is t.uint8_t
+    assert type(t.int8s(-1)) is t.int8s
+    assert t.uint16_t._cache is None
+
+    # Only plain integers use the cache
+    assert t.uint8_t("5") == 5
+    assert t.uint8_t("ff", base=16) == 0xFF
+    assert t.uint8_t(5.0) == 5
+
+    class SubInt(t.uint8_t):
+        pass
+
+    class CustomInt(t.uint8_t):
+        def __new__(cls, value):
+            return super().__new__(cls, value)
+
+    assert type(SubInt(1)) is SubInt
+    assert SubInt(1) is SubInt(1)
+    assert CustomInt._cache is None
+    assert CustomInt(1) is not CustomInt(1)
+    assert t.enum8._cache is None
+
+
+def test_from_byte_array():
+    values = t.uint8_t.from_byte_array(b"\x00\x7F\xFF")
+    assert values == [0x00, 0x7F, 0xFF]
+    assert all(type(v) is t.uint8_t for v in values)
+    assert t.uint8_t.from_byte_array(memoryview(b"\x01")) == [1]
+
+    with pytest.raises(TypeError):
+        t.uint16_t.from_byte_array(b"\x00\x00")
+
+    with pytest.raises(TypeError):
+        t.int8s.from_byte_array(b"\x00")
+
+
+def test_byte_lists():
+    lst, rest = t.data24.deserialize(b"\x01\x02\x03\x04")
+    assert lst == [1, 2, 3]
+    assert type(lst) is t.data24
+    assert type(lst[0]) is t.uint8_t
+    assert rest == b"\x04"
+
+    with pytest.raises(ValueError):
+        t.data24.deserialize(b"\x01\x02")
+
+    lst, rest = t.LVList[t.uint8_t].deserialize(b"\x02\x01\x02\x03")
+    assert lst == [1, 2]
+    assert rest == b"\x03"
+
+    with pytest.raises(ValueError):
+        t.LVList[t.uint8_t].deserialize(b"\x02\x01")
+
+    assert t.List[t.uint8_t].deserialize(b"\x01\x02") == ([1, 2], b"")
+
+    # Items that are not integers are still converted by the item type
+    assert t.data24([1, "2", 3.0]).serialize() == b"\x01\x02\x03"
+    assert t.LVList[t.uint8_t]([1, 2]).serialize() == b"\x02\x01\x02"
+    assert t.List[t.uint8_t]([0xFF]).serialize() == b"\xFF"
+
+    with pytest.raises(ValueError):
+        t.data24([1, 2, 256]).serialize()
+
+    with pytest.raises(ValueError):
+        t.data24([1, 2, "256"]).serialize()
+
+
+def test_vectorized_lists():
+    # Fixed-width integer items are packed in bulk
+    assert t.LVList[t.uint16_t]._item_format == "H"
+    assert t.FixedList[t.int32s, 2]._item_format == "i"
+    assert t.List[t.enum8]._item_format == "B"
+    assert t.Relays._item_format == "H"
+    assert t.LVList[t.uint24_t]._item_format is None
+    assert t.LVList[t.LVBytes]._item_format is None
+    assert t.LVList[t.Optional(t.uint8_t)]._item_format is None
+
+    relays, rest = t.Relays.deserialize(b"\x02\x34\x12\xff\xffextra")
+    assert relays == [0x1234, 0xFFFF]
+    assert type(relays) is t.Relays
+    assert all(type(nwk) is t.NWK for nwk in relays)
+    assert rest == b"extra"
+    assert relays.serialize() == b"\x02\x34\x12\xff\xff"
+
+    with pytest.raises(ValueError):
+        t.Relays.deserialize(b"\x02\x34\x12\xff")
+
+    lst, rest = t.FixedList[t.int16s, 2].deserialize(b"\xff\xff\x01\x00\x02")
+    assert lst == [-1, 1]
+    assert rest == b"\x02"
+
+    lst, rest = t.List[t.enum8].deserialize(b"\x00\x01")
+    assert lst == [t.enum8(0x00), t.enum8(0x01)]
+    assert all(type(v) is t.enum8 for v in lst)
+
+    with pytest.raises(ValueError):
+        t.List[t.uint16_t].deserialize(b"\x00\x01\x02")
+
+    # Out of range and unusual values fall back to the item type
+    assert t.LVList[t.uint16_t](["1", 2.0]).serialize() == b"\x02\x01\x00\x02\x00"
+
+    with pytest.raises(ValueError):
+        t.LVList[t.uint16_t]([0x10000]).serialize()
+
+    with pytest.raises(ValueError):
+        t.LVList[t.int8s]([-129]).serialize()
+
+
 def test_int_too_short():
     with pytest.raises(ValueError):
         t.uint8_t.deserialize(b"")
@@ -148,6 +280,33 @@ def test_bits():
         assert bits.serialize()
 
 
+def test_bits_from_bitfields():
+    fields = [t.uint2_t(0b11), t.uint4_t(0b1000), t.uint2_t(0b00)]
+
+    assert t.Bits.from_bitfields(fields) == [0, 0, 1, 0, 0, 0, 1, 1]
+    assert t.Bits.from_bitfields(fields).serialize() == bytes([0b00_1000_11])
+    assert t.Bits.from_bitfields([]) == []
+    assert t.Bits([1, 0, 1]).to_int() == 0b101
+    assert t.Bits().to_int() == 0
+
+
+def test_pack_unpack_bitfields():
+    int5s = type("int5s", (t.int_t,), {}, bits=5)
+    types = [t.uint1_t, int5s, t.enum2, t.uint8_t]
+    values = [t.uint1_t(1), int5s(-3), t.enum2(2), t.uint8_t(0xAB)]
+
+    n, size = t.pack_bitfields(values)
+    assert size == 16
+    assert n == 0b10101011_10_11101_1
+
+    unpacked = t.unpack_bitfields(n, types)
+    assert unpacked == values
+    assert [type(v) for v in unpacked] == types
+
+    # The integer engine is identical to the list of bits representation
+    assert t.Bits.from_int(n, size) == t.Bits.from_bitfields(values)
+
+
 def compare_with_nan(v1, v2):
     if not math.isnan(v1) ^ math.isnan(v2):
         return True
@@ -223,6 +382,108 @@ def test_float_parsing_errors():
         t.Half.deserialize(b"\x00")
 
 
+def converter_serialize(float_type, value):
+    n = int.from_bytes(struct.pack("<d", value), "little")
+    n = t.BaseFloat._convert_format(src=t.Double, dst=float_type, n=n)
+
+    return n.to_bytes(float_type._size, "little")
+
+
+def converter_deserialize(float_type, data):
+    n = int.from_bytes(data[: float_type._size], "little")
+    n = t.BaseFloat._convert_format(src=float_type, dst=t.Double, n=n)
+
+    return struct.unpack("<d", n.to_bytes(8, "little"))[0]
+
+
+def test_half_native_codec_matches_converter():
+    # Every possible half precision value
+    for n in range(2**16):
+        data = n.to_bytes(2, "little")
+        value, rest = t.Half.deserialize(data)
+        assert rest == b""
+
+        assert struct.pack("<d", value) == struct.pack(
+            "<d", converter_deserialize(t.Half, data)
+        )
+        assert value.serialize() == converter_serialize(t.Half, value)
+
+
+@pytest.mark.parametrize("float_type", [t.Half, t.Single, t.Double])
+@pytest.mark.parametrize(
+    "value",
+    [
+        0.0,
+        -0.0,
+        1.0,
+        -1.25,
+        0.1,
+        1 / 3,
+        21.37,
+        -21.37,
+        1 - 2**-60,
+        65504.0,
+        65519.0,
+        3.4028235e38,
+        3.4028235e38 * (1 + 2**-30),
+        65520.0,
+        1e30,
+        -1e300,
+        2.0**-14,
+        2.0**-13,
+        2.0**-24,
+        2.0**-126,
+        2.0**-125,
+        2.0**-1022,
+        2.0**-1021,
+        5e-324,
+        float("inf"),
+        float("-inf"),
+        float("nan"),
+        struct.unpack("<d", b"\x01\x00\x00\x00\x00\x00\xf0\x7f")[0],  # Signaling NaN
+    ],
+)
+def test_float_native_codec_matches_converter(float_type, value):
+    # The native `struct` codec must be bit-exact with the original converter
+    try:
+        expected = converter_serialize(float_type, value)
+    except OverflowError:
+        with pytest.raises(OverflowError):
+            float_type(value).serialize()
+    else:
+        assert float_type(value).serialize() == expected
+        assert float_type.serialize_array([value, value]) == expected * 2
+
+    for data in (
+        struct.pack("<d", value)[-float_type._size :],
+        struct.pack("<d", value)[: float_type._size],
+    ):
+        expected = struct.pack("<d", converter_deserialize(float_type, data))
+
+        assert struct.pack("<d", float_type.deserialize(data)[0]) == expected
+
+        values, rest = float_type.deserialize_array(data * 2 + b"extra", 2)
+        assert rest == b"extra"
+        assert [struct.pack("<d", v) for v in values] == [expected, expected]
+        assert all(type(v) is float_type for v in values)
+
+
+def test_float_arrays():
+    assert t.Single.serialize_array([1, "2.5", 3.0]) == struct.pack("<3f", 1, 2.5, 3)
+    assert t.Double.serialize_array([]) == b""
+
+    with pytest.raises(ValueError):
+        t.Single.deserialize_array(b"\x00" * 7, 2)
+
+    lst, rest = t.LVList[t.Single].deserialize(b"\x02" + struct.pack("<2f", 1.5, -2))
+    assert lst == [1.5, -2.0]
+    assert all(type(v) is t.Single for v in lst)
+    assert rest == b""
+    assert lst.serialize() == b"\x02" + struct.pack("<2f", 1.5, -2)
+    assert t.LVList[t.Single]._item_format == "f"
+    assert t.List[t.Half]._item_format == "e"
+
+
 def test_lvbytes():
     d, r = t.LVBytes.deserialize(b"\x0412345")
     assert r == b"5"
@@ -473,6 +734,48 @@ def test_lvlist_types():
     assert not isinstance(NewList(), t.LVList[t.uint16_t, t.uint8_t])
 
 
+def test_zero_copy_deserialize():
+    lst_type = t.LVList[t.uint16_t]
+    data = b"\x02\x01\x00\x02\x00extra"
+
+    # Bytes in, bytes out
+    lst, rest = lst_type.deserialize(data)
+    assert lst == [1, 2]
+    assert type(rest) is bytes
+    assert rest == b"extra"
+
+    # Views are passed through untouched
+    lst, rest = lst_type.deserialize(memoryview(data))
+    assert lst == [1, 2]
+    assert type(rest) is memoryview
+    assert rest.obj is data
+    assert rest == b"extra"
+
+    lst, rest = t.deserialize(data, [lst_type, t.uint8_t])
+    assert lst == [[1, 2], 0x65]
+    assert type(rest) is bytes
+    assert rest == b"xtra"
+
+
+def test_zero_copy_values_are_bytes():
+    data = memoryview(b"\x02ab\x03cde" + bytes(range(8)) + b"\x01\xff")
+
+    (lvbytes, string, ieee, fixed), rest = t.deserialize(
+        data,
+        [t.LVBytes, t.CharacterString, t.EUI64, t.FixedList[t.uint8_t, 1]],
+    )
+
+    # Decoded values never hold a reference into the frame buffer
+    assert type(lvbytes) is t.LVBytes
+    assert lvbytes == b"ab"
+    assert type(string.raw) is bytes
+    assert string == "cde"
+    assert type(ieee) is t.EUI64
+    assert ieee == t.EUI64.convert("07:06:05:04:03:02:01:00")
+    assert fixed == [1]
+    assert bytes(rest) == b"\xff"
+
+
 def test_int_repr():
     class NwkAsHex(t.uint16_t, repr="hex"):
         pass
@@ -587,6 +890,70 @@ def test_eui64_convert():
     assert t.EUI64.convert(None) is None
 
 
+def test_eui64_compat():
+    ieee = t.EUI64.convert("08:07:06:05:04:03:02:01")
+
+    assert ieee == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert ieee != [1, 2, 3, 4, 5, 6, 7, 9]
+    assert ieee == t.EUI64(map(t.uint8_t, [1, 2, 3, 4, 5, 6, 7, 8]))
+    assert list(ieee) == [1, 2, 3, 4, 5, 6, 7, 8]
+    assert len(ieee) == 8
+    assert repr(ieee) == str(ieee) == f"{ieee}" == "08:07:06:05:04:03:02:01"
+    assert hash(ieee) == hash(t.EUI64(b"\x01\x02\x03\x04\x05\x06\x07\x08"))
+    assert {ieee: 1}[t.EUI64([1, 2, 3, 4, 5, 6, 7, 8])] == 1
+
+    with pytest.raises(TypeError):
+        ieee[0] = 0
+
+    with pytest.raises(ValueError):
+        t.EUI64([1, 2, 3]).serialize()
+
+    with pytest.raises(ValueError):
+        t.EUI64.deserialize(b"\x01\x02\x03")
+
+
+def test_eui64_interning():
+    ieee1 = t.EUI64.convert("08:07:06:05:04:03:02:01")
+    ieee2, _ = t.EUI64.deserialize(b"\x01\x02\x03\x04\x05\x06\x07\x08")
+    ieee3 = t.EUI64([1, 2, 3, 4, 5, 6, 7, 8])
+
+    assert ieee1 is ieee2 is ieee3 is t.EUI64(ieee1)
+    assert pickle.loads(pickle.dumps(ieee1)) is ieee1
+
+    # Subclasses have their own canonical instances
+    epid = t.ExtendedPanId(ieee1)
+    assert type(epid) is t.ExtendedPanId
+    assert epid == ieee1
+    assert epid is t.ExtendedPanId.convert("08:07:06:05:04:03:02:01")
+
+
+def test_eui64_interning_weak():
+    key = (t.EUI64, b"\xAA" * 8)
+
+    ieee = t.EUI64(b"\xAA" * 8)
+    assert t.EUI64._interned[key] is ieee
+
+    # Addresses no longer referenced anywhere else are dropped from the table
+    del ieee
+    gc.collect()
+    assert key not in t.EUI64._interned
+
+
+def test_eui64_list_behavior():
+    ieee = t.EUI64.convert("08:07:06:05:04:03:02:01")
+
+    assert type(ieee[0]) is t.uint8_t
+    assert all(type(i) is t.uint8_t for i in ieee)
+    assert ieee[::-1] == [8, 7, 6, 5, 4, 3, 2, 1]
+    assert type(ieee[::-1]) is list
+    assert bytes(ieee) == b"\x01\x02\x03\x04\x05\x06\x07\x08"
+    assert ieee == (1, 2, 3, 4, 5, 6, 7, 8)
+    assert ieee != b"\x01\x02\x03\x04\x05\x06\x07\x08"
+
+    with pytest.raises(AttributeError):
+        ieee.append(9)
+
+
 def test_keydata():
     data = b"\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0A\x0B\x0C\x0D\x0E\x0F"
     extra = b"extra"
@@ -658,6 +1025,24 @@ def test_enum_undef():
     assert r.serialize() == data
     assert isinstance(r, TestEnum)
 
+    # Undefined values are created only once
+    assert TestEnum(0x55) is TestEnum.deserialize(data)[0]
+    assert TestEnum(0xAA) is TestEnum.ALL
+    assert TestEnum(t.uint8_t(0xAA)) is TestEnum.ALL
+    assert TestEnum(0x56) is not TestEnum(0x55)
+    assert len(TestEnum) == 1
+    assert 0x55 not in TestEnum._value2member_map_
+
+    # Undefined values of larger enums are unbounded and are not cached
+    class TestEnum16(t.enum16):
+        ALL = 0xAAAA
+
+    assert TestEnum16(0x5555) == TestEnum16(0x5555)
+    assert TestEnum16(0x5555) is not TestEnum16(0x5555)
+    assert TestEnum16(0x5555).name == "undefined_0x5555"
+    assert "_undefined_members" not in vars(TestEnum16)
+    assert 0x5555 not in TestEnum16._value2member_map_
+
 
 def test_enum():
     class TestEnum(t.enum8):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from unittest import mock
 
 import pytest
@@ -70,6 +71,126 @@ def test_deserialize_cluster_command_unknown(endpoint):
     assert not hdr.is_reply
 
 
+def test_deserialize_frame_lazy(endpoint):
+    data = b"\x18\x01\x0a\x00\x00\x10\x01"
+    frame = endpoint.deserialize_frame(0, data)
+    assert frame.data is data
+    assert frame.hdr.tsn == 1
+    assert frame.hdr.command_id == foundation.GeneralCommand.Report_Attributes
+    assert not frame.is_decoded
+    assert "not decoded" in repr(frame)
+
+    with patch.object(
+        foundation.GENERAL_COMMANDS[0x0A].schema,
+        "deserialize",
+        wraps=foundation.GENERAL_COMMANDS[0x0A].schema.deserialize,
+    ) as deserialize:
+        assert frame.payload.attribute_reports[0].value.value is t.Bool.true
+        assert frame.payload is frame.payload
+
+    assert deserialize.call_count == 1
+    assert frame.is_decoded
+
+    hdr, payload = frame
+    assert hdr is frame.hdr
+    assert payload.serialize() == endpoint.deserialize(0, data)[1].serialize()
+
+
+def test_deserialize_frame_error(endpoint):
+    frame = endpoint.deserialize_frame(0, b"\x18\x01\x01\x00")
+    assert frame.hdr.tsn == 1
+
+    with pytest.raises(ValueError):
+        frame.payload
+
+
+def test_deserialize_frame_custom_deserialize(endpoint):
+    class CustomCluster(zcl.Cluster):
+        cluster_id = 0x1234
+        _skip_registry = True
+
+        def deserialize(self, data):
+            return super().deserialize(data)[0], sentinel.payload
+
+    endpoint.add_input_cluster(0x1234, CustomCluster(endpoint))
+
+    frame = endpoint.deserialize_frame(0x1234, b"\x18\x01\x0a\x00\x00\x10\x01")
+    assert frame.is_decoded
+    assert frame.hdr.tsn == 1
+    assert frame.payload is sentinel.payload
+
+
+def test_handle_frame_not_consumed(endpoint):
+    cluster = endpoint.in_clusters[3]
+    frame = endpoint.deserialize_frame(3, b"\x01\x01\x00\x05\x00")
+
+    with patch.object(cluster, "is_enabled_for", return_value=False):
+        endpoint.handle_frame(260, 3, frame)
+
+    # Nothing handles Identify commands, so they are never decoded
+    assert not frame.is_decoded
+
+
+def test_handle_frame_listener(endpoint):
+    cluster = endpoint.in_clusters[3]
+    listener = MagicMock()
+    cluster.add_listener(listener)
+    frame = endpoint.deserialize_frame(3, b"\x01\x01\x00\x05\x00")
+
+    with patch.object(cluster, "is_enabled_for", return_value=False):
+        endpoint.handle_frame(260, 3, frame)
+
+    assert frame.is_decoded
+    assert listener.cluster_command.call_count == 1
+    assert listener.cluster_command.call_args[0][:2] == (1, 0x00)
+    assert listener.cluster_command.call_args[0][2].identify_time == 5
+
+
+def test_handle_frame_overridden(endpoint):
+    class CustomCluster(zcl.Cluster):
+        cluster_id = 0x1234
+        _skip_registry = True
+        server_commands = {
+            0x00: foundation.ZCLCommandDef("test", {"value": t.uint8_t}, False)
+        }
+
+        def handle_cluster_request(self, hdr, args, *, dst_addressing=None):
+            self.requests.append(args.value)
+
+    cluster = CustomCluster(endpoint)
+    cluster.requests = []
+    endpoint.add_input_cluster(0x1234, cluster)
+
+    with patch.object(cluster, "is_enabled_for", return_value=False):
+        endpoint.handle_frame(
+            260, 0x1234, endpoint.deserialize_frame(0x1234, b"\x01\x01\x00\x07")
+        )
+
+    assert cluster.requests == [7]
+
+
+def test_handle_frame_general(endpoint):
+    cluster = endpoint.in_clusters[0]
+    frame = endpoint.deserialize_frame(0, b"\x18\x01\x0a\x00\x00\x10\x01")
+
+    with patch.object(cluster, "is_enabled_for", return_value=False):
+        endpoint.handle_frame(260, 0, frame)
+
+    # Attribute reports always update the cache
+    assert frame.is_decoded
+    assert cluster._attr_cache[0x0000] == 1
+
+
+def test_handle_frame_error(endpoint):
+    cluster = endpoint.in_clusters[3]
+    cluster.handle_message = MagicMock()
+    frame = endpoint.deserialize_frame(3, b"\x01\x01\x00\x05")
+
+    endpoint.handle_frame(260, 3, frame)
+
+    assert cluster.handle_message.call_count == 0
+
+
 def test_unknown_cluster():
     c = zcl.Cluster.from_id(None, 999)
     assert isinstance(c, zcl.Cluster)
@@ -87,6 +208,56 @@ def test_manufacturer_specific_cluster():
     assert hasattr(c, "cluster_id")
 
 
+def test_registry_range_index():
+    class RangeCluster(zcl.Cluster):
+        cluster_id_range = (0x9000, 0x90FF)
+
+    try:
+        c = zcl.Cluster.from_id(None, 0x9000)
+        assert isinstance(c, RangeCluster)
+        assert c.cluster_id == 0x9000
+        assert isinstance(zcl.Cluster.from_id(None, 0x90FF), RangeCluster)
+        assert type(zcl.Cluster.from_id(None, 0x9100)) is zcl.Cluster
+        assert type(zcl.Cluster.from_id(None, 0x8FFF)) is zcl.Cluster
+    finally:
+        del zcl.Cluster._registry_range[0x9000, 0x90FF]
+        zcl.Cluster._index_registry_range()
+
+    assert type(zcl.Cluster.from_id(None, 0x9000)) is zcl.Cluster
+
+
+def test_lazy_schema_compilation():
+    class TestCluster(zcl.Cluster):
+        cluster_id = 0x1234
+        _skip_registry = True
+        server_commands = {
+            0x00: foundation.ZCLCommandDef("command1", {"param": t.uint8_t}, False),
+        }
+
+    schema = vars(TestCluster)["server_commands"].value[0x00].schema
+    assert schema == {"param": t.uint8_t}
+
+    # Accessing any command attribute compiles every schema of the class
+    command = TestCluster.commands_by_name["command1"]
+    assert issubclass(command.schema, foundation.CommandSchema)
+    assert TestCluster.server_commands[0x00] is command
+    assert "server_commands" in vars(TestCluster)
+
+    class TestCluster2(zcl.Cluster):
+        cluster_id = 0x1234
+        _skip_registry = True
+        client_commands = {
+            0x00: foundation.ZCLCommandDef("command2", {"param": t.uint8_t}, True),
+        }
+
+    # Clusters are compiled before they are first instantiated
+    cluster = TestCluster2(None)
+    assert issubclass(
+        vars(TestCluster2)["client_commands"][0x00].schema, foundation.CommandSchema
+    )
+    assert cluster.command2
+
+
 @pytest.fixture
 def cluster_by_id():
     def _cluster(cluster_id=0):
@@ -241,6 +412,131 @@ def test_handle_cluster_request(cluster):
     assert cluster.handle_cluster_request.call_count == 1
 
 
+def test_dispatch_client_command(endpoint):
+    cluster = endpoint.in_clusters[3]
+    cluster.handle_cluster_request = MagicMock()
+    listener = MagicMock()
+    cluster.add_listener(listener)
+
+    hdr, args = endpoint.deserialize(3, b"\x09\x01\x00\x12\x34")
+    cluster.handle_message(hdr, args)
+
+    assert cluster.handle_cluster_request.mock_calls == [
+        mock.call(hdr, args, dst_addressing=None)
+    ]
+    listener.cluster_command.assert_called_once_with(1, 0x00, args)
+
+
+def test_dispatch_table_per_class():
+    on_off = zcl.clusters.general.OnOff
+    table = on_off._get_dispatch_table()
+    cluster_command = foundation.FrameType.CLUSTER_COMMAND
+    general_command = foundation.FrameType.GLOBAL_COMMAND
+    report = foundation.GeneralCommand.Report_Attributes
+
+    assert table[cluster_command, 0, 0x00].command is on_off.server_commands[0x00]
+    assert table[cluster_command, 0, 0x00].handler == "_handle_cluster_command"
+    assert (cluster_command, 1, 0x00) not in table
+    assert table[general_command, 1, report].handler == "_handle_general_command"
+
+    # Tables are built once and reused until commands change
+    assert on_off._get_dispatch_table() is table
+
+    class CustomOnOff(on_off):
+        _skip_registry = True
+        client_commands = {
+            0x05: foundation.ZCLCommandDef("custom", {"param": t.uint8_t}, False),
+        }
+
+    assert (cluster_command, 1, 0x05) in CustomOnOff._get_dispatch_table()
+    assert (cluster_command, 1, 0x05) not in on_off._get_dispatch_table()
+
+
+def test_dispatch_table_invalidated():
+    class TestCluster(zcl.Cluster):
+        cluster_id = 0x1234
+        _skip_registry = True
+        server_commands = {}
+
+    cluster_command = foundation.FrameType.CLUSTER_COMMAND
+    table = TestCluster._get_dispatch_table()
+    assert (cluster_command, 0, 0x05) not in table
+
+    TestCluster.server_commands[0x05] = foundation.ZCLCommandDef(
+        "custom", {"param": t.uint8_t}, False, id=0x05
+    ).with_compiled_schema()
+    assert TestCluster._get_dispatch_table() is not table
+    assert (cluster_command, 0, 0x05) in TestCluster._get_dispatch_table()
+
+    del TestCluster.server_commands[0x05]
+    assert (cluster_command, 0, 0x05) not in TestCluster._get_dispatch_table()
+
+    # Replacing the commands is picked up as well
+    TestCluster.client_commands = {
+        0x06: foundation.ZCLCommandDef(
+            "other", {"param": t.uint8_t}, True, id=0x06
+        ).with_compiled_schema()
+    }
+    assert (cluster_command, 1, 0x06) in TestCluster._get_dispatch_table()
+
+
+def test_dispatch_commands_changed_later(endpoint):
+    class TestCluster(zcl.Cluster):
+        cluster_id = 0x1234
+        _skip_registry = True
+        server_commands = {}
+
+        def handle_cluster_request(self, hdr, args, *, dst_addressing=None):
+            requests.append((hdr.command_id, args))
+
+    requests = []
+    cluster = TestCluster(endpoint)
+    endpoint.add_input_cluster(0x1234, cluster)
+
+    # Decoding builds the table before the command exists
+    frame = endpoint.deserialize_frame(0x1234, b"\x01\x01\x05\x12")
+    assert frame.payload == b"\x12"
+
+    # Quirks can add commands to an existing cluster class
+    TestCluster.server_commands[0x05] = foundation.ZCLCommandDef(
+        "custom", {"param": t.uint8_t}, False, id=0x05
+    ).with_compiled_schema()
+
+    frame = endpoint.deserialize_frame(0x1234, b"\x01\x01\x05\x12")
+    assert frame.handler == "_handle_cluster_command"
+    endpoint.handle_frame(260, 0x1234, frame)
+
+    assert requests == [(0x05, frame.payload)]
+    assert frame.payload.param == 0x12
+
+
+def test_dispatch_handler_overridden(endpoint):
+    class TestCluster(zcl.Cluster):
+        cluster_id = 0x1234
+        _skip_registry = True
+
+        def _handle_general_command(self, hdr, args, *, dst_addressing=None):
+            handled.append(hdr.command_id)
+
+    handled = []
+    cluster = TestCluster(endpoint)
+    endpoint.add_input_cluster(0x1234, cluster)
+
+    endpoint.handle_frame(
+        260, 0x1234, endpoint.deserialize_frame(0x1234, b"\x18\x01\x0a\x00\x00\x10\x01")
+    )
+    assert handled == [foundation.GeneralCommand.Report_Attributes]
+    assert 0x0000 not in cluster._attr_cache
+
+    # Handlers patched on the instance are used too
+    cluster._handle_general_command = MagicMock()
+    hdr, args = cluster.deserialize(b"\x18\x02\x0a\x00\x00\x10\x01")
+    cluster.handle_message(hdr, args)
+    assert cluster._handle_general_command.call_args_list == [
+        mock.call(hdr, args, dst_addressing=None)
+    ]
+
+
 def _mk_rar(attrid, value, status=0):
     r = zcl.foundation.ReadAttributeRecord()
     r.attrid = attrid
@@ -305,6 +601,34 @@ async def test_read_attributes_mixed_cached(cluster):
     assert failure == {0x0010: zcl.foundation.Status.UNSUPPORTED_ATTRIBUTE}
 
 
+async def test_read_attributes_max_age(cluster):
+    """Only stale cached attributes are read from the device."""
+
+    cluster.request = AsyncMock(return_value=[[_mk_rar(5, "Model 2")]])
+    cluster._update_attribute(4, "Manufacturer")
+    cluster._update_attribute(5, "Model")
+    cluster._attr_last_updated[5] -= 120
+
+    # Attributes cached without a timestamp are stale
+    cluster._attr_cache[0] = 99
+
+    with patch("time.time", return_value=time.time() + 30):
+        success, failure = await cluster.read_attributes(
+            ["manufacturer", "model"], max_age=60
+        )
+
+    assert success == {"manufacturer": "Manufacturer", "model": "Model 2"}
+    assert failure == {}
+    assert cluster.request.await_count == 1
+    assert cluster.request.call_args[0][3] == [0x0005]
+
+    success, failure = await cluster.read_attributes(
+        [0, "model"], only_cache=True, max_age=60
+    )
+    assert success == {"model": "Model 2"}
+    assert cluster.request.await_count == 1
+
+
 async def test_read_attributes_default_response(cluster):
     async def mockrequest(
         foundation, command, schema, args, manufacturer=None, **kwargs
@@ -341,6 +665,69 @@ async def test_read_attributes_value_normalization_error(cluster):
     assert success["model"] == "Model"
 
 
+async def test_read_attributes_concurrent(cluster):
+    responses = {}
+
+    async def mockrequest(
+        foundation, command, schema, args, manufacturer=None, **kwargs
+    ):
+        future = responses[tuple(args)] = asyncio.get_running_loop().create_future()
+        return await future
+
+    cluster.request = MagicMock(side_effect=mockrequest)
+
+    # Concurrent reads are merged into a single request
+    read1 = asyncio.create_task(cluster.read_attributes([4, 5]))
+    read2 = asyncio.create_task(cluster.read_attributes(["model", 0]))
+    await asyncio.sleep(0.01)
+
+    assert cluster.request.call_count == 1
+    assert list(responses) == [(4, 5, 0)]
+
+    # Later reads piggyback on attributes already being read
+    read3 = asyncio.create_task(cluster.read_attributes([5, 6]))
+    await asyncio.sleep(0.01)
+
+    assert cluster.request.call_count == 2
+    assert list(responses) == [(4, 5, 0), (6,)]
+
+    # Cancelling one caller does not cancel the shared read
+    read2.cancel()
+    responses[4, 5, 0].set_result(
+        [[_mk_rar(4, "Manufacturer"), _mk_rar(5, "Model"), _mk_rar(0, 99)]]
+    )
+    responses[
+        6,
+    ].set_result([[_mk_rar(6, None, foundation.Status.FAILURE)]])
+
+    assert await read1 == ({4: "Manufacturer", 5: "Model"}, {})
+    assert await read3 == ({5: "Model"}, {6: foundation.Status.FAILURE})
+
+    with pytest.raises(asyncio.CancelledError):
+        await read2
+
+    assert cluster._pending_reads == {}
+
+
+async def test_read_attributes_concurrent_error(cluster):
+    cluster.request = AsyncMock(side_effect=asyncio.TimeoutError())
+
+    results = await asyncio.gather(
+        cluster.read_attributes([4]),
+        cluster.read_attributes([4, 5]),
+        return_exceptions=True,
+    )
+
+    assert cluster.request.call_count == 1
+    assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+
+    # Failed reads are not shared with later callers
+    with pytest.raises(asyncio.TimeoutError):
+        await cluster.read_attributes([4])
+
+    assert cluster.request.call_count == 2
+
+
 async def test_item_access_attributes(cluster):
     cluster._attr_cache[5] = sentinel.model
 
@@ -671,6 +1058,69 @@ def test_command_invalid_attr(cluster):
         cluster.no_such_command()
 
 
+def test_command_proxy_cached(cluster):
+    assert isinstance(type(cluster).__dict__["reset_fact_default"], zcl._CommandProxy)
+    assert cluster.reset_fact_default is cluster.reset_fact_default
+    assert "command(0x00)" in repr(cluster.reset_fact_default)
+
+    # The cluster's method is looked up on every call
+    cluster.command = MagicMock()
+    cluster.reset_fact_default(tsn=5)
+    cluster.command.assert_called_once_with(0x00, tsn=5)
+
+
+def test_command_proxy_subclass(cluster_by_id):
+    class CustomBasic(zcl.clusters.general.Basic):
+        _skip_registry = True
+        server_commands = {}
+
+    cluster = CustomBasic(cluster_by_id(0)._endpoint)
+
+    with pytest.raises(AttributeError):
+        cluster.reset_fact_default
+
+    class CustomIdentify(zcl.clusters.general.Identify):
+        _skip_registry = True
+
+        def identify_query_response(self):
+            return sentinel.method
+
+    assert "identify_query_response" in CustomIdentify._client_commands_idx
+    assert CustomIdentify(None).identify_query_response() is sentinel.method
+
+
+@pytest.mark.parametrize("general", [True, False])
+@pytest.mark.parametrize("is_reply", [True, False])
+@pytest.mark.parametrize(
+    "manufacturer", [None, 0x1234, foundation.ZCLHeader.NO_MANUFACTURER_ID]
+)
+def test_encode_frame(general, is_reply, manufacturer):
+    if general:
+        hdr = foundation.ZCLHeader.general(0xAB, 0x0A, manufacturer, is_reply)
+    else:
+        hdr = foundation.ZCLHeader.cluster(0xAB, 0x0A, manufacturer, is_reply)
+
+    data = zcl.encode_frame(
+        general, 0x0A, 0xAB, b"\x01\x02", manufacturer=manufacturer, is_reply=is_reply
+    )
+    assert data == hdr.serialize() + b"\x01\x02"
+
+
+async def test_command_template(cluster_by_id):
+    on_off = cluster_by_id(0x0006)
+    await on_off.on(tsn=0x12)
+    await on_off.off(tsn=0x34, manufacturer=0x1234)
+
+    assert on_off._endpoint.request.mock_calls == [
+        mock.call(6, 0x12, b"\x01\x12\x01", expect_reply=True, command_id=0x01),
+        mock.call(6, 0x34, b"\x05\x34\x12\x34\x00", expect_reply=True, command_id=0x00),
+    ]
+
+    # Argument-free commands still reject arguments
+    with pytest.raises(TypeError):
+        await on_off.on(1)
+
+
 async def test_invalid_arguments_cluster_command(cluster):
     res = cluster.command(0x00, 1)
     assert isinstance(res.exception(), TypeError)
@@ -763,6 +1213,65 @@ async def test_handle_cluster_general_request_disable_default_rsp(endpoint):
         assert general_cmd_mock.call_args[1]["tsn"] == hdr.tsn
 
 
+@pytest.mark.parametrize("suppress_unchanged", [False, True])
+async def test_attribute_update_coalescing(endpoint, suppress_unchanged):
+    cluster = endpoint.in_clusters[0]
+    cluster.attribute_coalescing_window = 0.01
+    cluster.suppress_unchanged_attributes = suppress_unchanged
+    cluster._attr_cache[0x0004] = "Manufacturer"
+
+    listener = MagicMock()
+    cluster.add_listener(listener)
+
+    hdr, values = endpoint.deserialize(
+        0, b"\x18\x01\x0a\x04\x00\x42\x0cManufacturer\x05\x00\x42\x01A"
+    )
+    cluster.handle_message(hdr, values)
+
+    hdr, values = endpoint.deserialize(0, b"\x18\x02\x0a\x05\x00\x42\x01B")
+    cluster.handle_message(hdr, values)
+
+    # The cache is updated immediately but listeners are only notified once
+    assert cluster.get("model") == "B"
+    assert listener.attributes_updated.call_count == 0
+
+    await asyncio.sleep(0.05)
+
+    assert listener.attribute_updated.call_count == 0
+
+    if suppress_unchanged:
+        listener.attributes_updated.assert_called_once_with({0x0005: "B"})
+    else:
+        listener.attributes_updated.assert_called_once_with(
+            {0x0004: "Manufacturer", 0x0005: "B"}
+        )
+
+    # Nothing is emitted when every coalesced value is unchanged
+    cluster.suppress_unchanged_attributes = True
+    cluster._update_attribute(0x0005, "C")
+    cluster._update_attribute(0x0005, "B")
+    await asyncio.sleep(0.05)
+
+    assert listener.attributes_updated.call_count == 1
+
+
+def test_attribute_update_coalescing_no_loop(cluster):
+    cluster.attribute_coalescing_window = 0.01
+    listener = MagicMock()
+    cluster.add_listener(listener)
+
+    # Without a running event loop updates are emitted immediately
+    cluster._update_attribute(0x0005, "A")
+    cluster._update_attribute(0x0005, "B")
+
+    assert listener.attributes_updated.call_args_list == [
+        mock.call({0x0005: "A"}),
+        mock.call({0x0005: "B"}),
+    ]
+    assert cluster._attr_cache[0x0005] == "B"
+    assert cluster._flush_updates_handle is None
+
+
 async def test_handle_cluster_general_request_not_attr_report(cluster):
     hdr = foundation.ZCLHeader.general(1, foundation.GeneralCommand.Write_Attributes)
     p1 = patch.object(cluster, "_update_attribute")
@@ -871,6 +1380,184 @@ async def test_configure_reporting_multiple_both_unsupp(cluster):
     assert cluster.unsupported_attributes == {"hw_version", 3, "manufacturer", 4}
 
 
+def test_split_records():
+    records = [t.uint16_t(1), t.uint16_t(2), t.LVBytes(b"abcdef"), t.uint16_t(3)]
+
+    assert zcl.split_records([], 4) == []
+    assert zcl.split_records(records, 4) == [[1, 2], [b"abcdef"], [3]]
+    assert zcl.split_records(records, 100) == [records]
+
+
+def test_max_payload_size(cluster):
+    app = cluster.endpoint.device.application
+    node_desc = cluster.endpoint.device.node_desc
+
+    # Nothing is split when neither the radio nor the device report a limit
+    app.max_zcl_frame_size = None
+    node_desc.maximum_incoming_transfer_size = None
+    assert cluster._max_payload_size() is None
+    assert zcl.split_records([t.uint16_t(1), t.uint16_t(2)], None) == [[1, 2]]
+
+    app.max_zcl_frame_size = 82
+    assert cluster._max_payload_size() == 82 - zcl.MAX_HEADER_SIZE
+
+    node_desc.maximum_incoming_transfer_size = 40
+    assert cluster._max_payload_size() == 40 - zcl.MAX_HEADER_SIZE
+
+    # Some devices advertise a transfer size of zero
+    node_desc.maximum_incoming_transfer_size = 0
+    assert cluster._max_payload_size() == 82 - zcl.MAX_HEADER_SIZE
+
+
+async def test_read_attributes_not_split(cluster):
+    cluster.endpoint.device.application.max_zcl_frame_size = None
+    cluster.endpoint.device.node_desc = None
+    cluster.request = AsyncMock(return_value=[[]])
+    await cluster.read_attributes(list(range(100)))
+
+    assert cluster.request.await_count == 1
+    assert len(cluster.request.call_args[0][3]) == 100
+
+
+async def test_read_attributes_split(cluster):
+    cluster.endpoint.device.application.max_zcl_frame_size = zcl.MAX_HEADER_SIZE + 4
+
+    async def mockrequest(
+        foundation, command, schema, args, manufacturer=None, **kwargs
+    ):
+        if 4 in args:
+            return [zcl.foundation.Status.UNSUP_GENERAL_COMMAND]
+
+        return [[_mk_rar(attrid, attrid) for attrid in args]]
+
+    cluster.request = MagicMock(side_effect=mockrequest)
+    success, failure = await cluster.read_attributes([0, 1, 2, 3, 4])
+
+    assert [c[0][3] for c in cluster.request.call_args_list] == [[0, 1], [2, 3], [4]]
+
+    # Every frame of a split request gets its own TSN
+    assert all(c[1].get("tsn") is None for c in cluster.request.call_args_list)
+    assert success == {0: 0, 1: 1, 2: 2, 3: 3}
+    assert failure == {4: zcl.foundation.Status.UNSUP_GENERAL_COMMAND}
+
+
+async def test_write_attributes_split(cluster):
+    cluster.endpoint.device.application.max_zcl_frame_size = zcl.MAX_HEADER_SIZE + 8
+    cluster._write_attributes = AsyncMock(
+        side_effect=[
+            [[foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]],
+            [[foundation.WriteAttributesStatusRecord(foundation.Status.FAILURE, 2)]],
+        ]
+    )
+
+    result = await cluster.write_attributes({0: 1, 1: 2, 2: 3})
+
+    assert [len(c[0][0]) for c in cluster._write_attributes.call_args_list] == [2, 1]
+    assert result.status_records == [
+        foundation.WriteAttributesStatusRecord(foundation.Status.FAILURE, 2)
+    ]
+    assert cluster._attr_cache == {0: 1, 1: 2}
+
+
+async def test_write_attributes_split_success(cluster):
+    cluster.endpoint.device.application.max_zcl_frame_size = zcl.MAX_HEADER_SIZE + 8
+    cluster._write_attributes = AsyncMock(
+        return_value=[
+            [foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]
+        ]
+    )
+
+    result = await cluster.write_attributes({0: 1, 1: 2, 2: 3})
+
+    assert cluster._write_attributes.await_count == 2
+    assert result[0] == [
+        foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)
+    ]
+    assert cluster._attr_cache == {0: 1, 1: 2, 2: 3}
+
+
+async def test_write_attributes_batched(cluster):
+    cluster.write_batching_window = 0.01
+    cluster._write_attributes = AsyncMock(
+        return_value=[
+            [
+                foundation.WriteAttributesStatusRecord(
+                    foundation.Status.READ_ONLY, 0x0001
+                )
+            ]
+        ]
+    )
+
+    cluster["zcl_version"] = 1
+    cluster["zcl_version"] = 2
+    write1 = asyncio.create_task(cluster.write_attributes_batched({1: 3}))
+    write2 = asyncio.create_task(cluster.write_attributes_batched({2: 4}))
+    await asyncio.sleep(0.05)
+
+    # All writes are sent in a single request, the most recent value wins
+    assert cluster._write_attributes.await_count == 1
+    attrs = cluster._write_attributes.call_args[0][0]
+    assert [(a.attrid, a.value.value) for a in attrs] == [(0, 2), (1, 3), (2, 4)]
+
+    # Each caller only sees the status of its own attributes
+    assert (await write1)[0] == [
+        foundation.WriteAttributesStatusRecord(foundation.Status.READ_ONLY, 0x0001)
+    ]
+    assert (await write2)[0] == [
+        foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)
+    ]
+    assert cluster._attr_cache == {0: 2, 2: 4}
+
+
+async def test_write_attributes_batched_error(cluster):
+    cluster._write_attributes = AsyncMock(side_effect=asyncio.TimeoutError())
+
+    write1 = asyncio.create_task(cluster.write_attributes_batched({0: 1}))
+    write2 = asyncio.create_task(cluster.write_attributes_batched({1: 2}))
+
+    with pytest.raises(asyncio.TimeoutError):
+        await write1
+
+    with pytest.raises(asyncio.TimeoutError):
+        await write2
+
+    assert cluster._write_attributes.await_count == 1
+    assert cluster._attr_cache == {}
+
+
+async def test_configure_reporting_multiple_split(cluster):
+    cluster.endpoint.device.application.max_zcl_frame_size = zcl.MAX_HEADER_SIZE + 20
+    cluster.endpoint.request.side_effect = [
+        _mk_cfg_rsp({3: zcl.foundation.Status.UNSUPPORTED_ATTRIBUTE}),
+        [zcl.foundation.Status.UNSUP_GENERAL_COMMAND],
+    ]
+
+    res = await cluster.configure_reporting_multiple(
+        {3: (5, 15, 20), 4: (6, 16, 26), 5: (7, 17, 27)}
+    )
+
+    assert cluster.endpoint.request.await_count == 2
+    assert [(r.status, r.attrid) for r in res[0]] == [
+        (zcl.foundation.Status.UNSUPPORTED_ATTRIBUTE, 3),
+        (zcl.foundation.Status.UNSUP_GENERAL_COMMAND, 5),
+    ]
+    assert cluster.unsupported_attributes == {3, "hw_version"}
+
+
+def test_read_attributes_rsp_truncated(cluster, caplog):
+    cluster.endpoint.device.application.max_zcl_frame_size = zcl.MAX_HEADER_SIZE + 12
+    cluster.read_attributes_rsp({0: 1, 1: 2, 2: 3}, tsn=0x12)
+
+    # Responses are never split, records that do not fit are left out
+    assert cluster.endpoint.reply.call_count == 1
+    assert cluster.endpoint.reply.call_args[0][1] == 0x12
+
+    hdr, rsp = cluster.deserialize(cluster.endpoint.reply.call_args[0][2])
+    assert hdr.tsn == 0x12
+    assert [r.attrid for r in rsp.status_records] == [0, 1]
+    assert "dropping 1 of 3 records: [2]" in caplog.text
+
+
 def test_unsupported_attr_add(cluster):
     """Test adding unsupported attributes."""
 
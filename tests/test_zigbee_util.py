@@ -100,6 +100,33 @@ def test_log_stacklevel():
     assert direct.lineno == indirect.lineno + 1
 
 
+def test_log_disabled_level():
+    LOGGER = logging.getLogger("test_log_disabled_level")
+    LOGGER.setLevel(logging.WARNING)
+
+    class TestClass(util.LocalLogMixin):
+        logger = LOGGER
+        log = MagicMock()
+
+    obj = TestClass()
+    obj.debug("Test %s", "debug")
+    obj.info("Test %s", "info")
+
+    assert not obj.is_enabled_for(logging.DEBUG)
+    assert obj.is_enabled_for(logging.WARNING)
+    assert obj.log.call_count == 0
+
+    obj.warning("Test %s", "warning")
+    assert obj.log.call_count == 1
+
+    # Without a logger every message is passed on to `log`
+    TestClass.logger = None
+    obj.debug("Test %s", "debug")
+
+    assert obj.is_enabled_for(logging.DEBUG)
+    assert obj.log.call_count == 2
+
+
 async def _test_retry(exception, retry_exceptions, n):
     counter = 0
 
@@ -22,7 +22,7 @@ from zigpy.zdo import types as zdo_t
 
 LOGGER = logging.getLogger(__name__)
 
-DB_VERSION = 7
+DB_VERSION = 8
 DB_V = f"_v{DB_VERSION}"
 MIN_SQLITE_VERSION = (3, 24, 0)
 
@@ -235,6 +235,22 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
             cluster.cluster_id,
             attrid,
             value,
+            cluster._attr_last_updated.get(attrid, 0),
+        )
+
+    def attributes_updated(
+        self, cluster: zigpy.typing.ClusterType, updates: dict[int, Any]
+    ) -> None:
+        if not cluster.endpoint.device.is_initialized:
+            return
+
+        self.enqueue(
+            "_save_attributes",
+            cluster.endpoint.device.ieee,
+            cluster.endpoint.endpoint_id,
+            cluster.cluster_id,
+            updates,
+            {attrid: cluster._attr_last_updated.get(attrid, 0) for attrid in updates},
         )
 
     def unsupported_attribute_added(
@@ -411,13 +427,22 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
 
     async def _save_attribute_cache(self, ep: zigpy.typing.EndpointType) -> None:
         clusters = [
-            (ep.device.ieee, ep.endpoint_id, cluster.cluster_id, attrid, value)
+            (
+                ep.device.ieee,
+                ep.endpoint_id,
+                cluster.cluster_id,
+                attrid,
+                value,
+                cluster._attr_last_updated.get(attrid, 0),
+            )
             for cluster in ep.in_clusters.values()
             for attrid, value in cluster._attr_cache.items()
         ]
-        q = f"""INSERT INTO attributes_cache{DB_V} VALUES (?, ?, ?, ?, ?)
+        q = f"""INSERT INTO attributes_cache{DB_V} VALUES (?, ?, ?, ?, ?, ?)
                     ON CONFLICT (ieee, endpoint_id, cluster, attrid)
-                    DO UPDATE SET value=excluded.value"""
+                    DO UPDATE SET
+                        value=excluded.value,
+                        last_updated=excluded.last_updated"""
         await self._db.executemany(q, clusters)
 
     async def _save_unsupported_attributes(self, ep: zigpy.typing.EndpointType) -> None:
@@ -443,13 +468,44 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
         await self._db.executemany(q, clusters)
 
     async def _save_attribute(
-        self, ieee: t.EUI64, endpoint_id: int, cluster_id: int, attrid: int, value: Any
+        self,
+        ieee: t.EUI64,
+        endpoint_id: int,
+        cluster_id: int,
+        attrid: int,
+        value: Any,
+        last_updated: float,
+    ) -> None:
+        q = f"""INSERT INTO attributes_cache{DB_V} VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (ieee, endpoint_id, cluster, attrid)
+                    DO UPDATE SET
+                        value=excluded.value,
+                        last_updated=excluded.last_updated"""
+        await self.execute(
+            q, (ieee, endpoint_id, cluster_id, attrid, value, last_updated)
+        )
+        await self._db.commit()
+
+    async def _save_attributes(
+        self,
+        ieee: t.EUI64,
+        endpoint_id: int,
+        cluster_id: int,
+        updates: dict[int, Any],
+        last_updated: dict[int, float],
     ) -> None:
-        q = f"""INSERT INTO attributes_cache{DB_V} VALUES (?, ?, ?, ?, ?)
+        q = f"""INSERT INTO attributes_cache{DB_V} VALUES (?, ?, ?, ?, ?, ?)
                     ON CONFLICT (ieee, endpoint_id, cluster, attrid)
                     DO UPDATE SET
-                        value=excluded.value"""
-        await self.execute(q, (ieee, endpoint_id, cluster_id, attrid, value))
+                        value=excluded.value,
+                        last_updated=excluded.last_updated"""
+        await self._db.executemany(
+            q,
+            [
+                (ieee, endpoint_id, cluster_id, attrid, value, last_updated[attrid])
+                for attrid, value in updates.items()
+            ],
+        )
         await self._db.commit()
 
     async def load(self) -> None:
@@ -463,8 +519,12 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
         await self._load_attributes("attrid=4 OR attrid=5")
 
         for device in self._application.devices.values():
+            if device.is_initialized:
+                self._application._add_interview_template(device)
+
             device = zigpy.quirks.get_device(device)
             self._application.devices[device.ieee] = device
+            self._application._index_device_nwk(device)
 
         await self._load_attributes()
         await self._load_unsupported_attributes()
@@ -481,7 +541,14 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
             query = f"SELECT * FROM attributes_cache{DB_V}"
 
         async with self.execute(query) as cursor:
-            async for (ieee, endpoint_id, cluster, attrid, value) in cursor:
+            async for (
+                ieee,
+                endpoint_id,
+                cluster,
+                attrid,
+                value,
+                last_updated,
+            ) in cursor:
                 dev = self._application.get_device(ieee)
 
                 # Some quirks create endpoints and clusters that do not exist
@@ -494,6 +561,7 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
                     continue
 
                 ep.in_clusters[cluster]._attr_cache[attrid] = value
+                ep.in_clusters[cluster]._attr_last_updated[attrid] = last_updated
 
                 LOGGER.debug(
                     "[0x%04x:%s:0x%04x] Attribute id: %s value: %s",
@@ -640,6 +708,7 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
                 (self._migrate_to_v5, 5),
                 (self._migrate_to_v6, 6),
                 (self._migrate_to_v7, 7),
+                (self._migrate_to_v8, 8),
             ]:
                 if db_version >= min(to_db_version, DB_VERSION):
                     continue
@@ -799,3 +868,27 @@ class PersistingListener(zigpy.util.CatchingTaskMixin):
                 "node_descriptors_v6": "node_descriptors_v7",
             }
         )
+
+    async def _migrate_to_v8(self):
+        """Schema v8 added the `last_updated` column to the `attributes_cache` table"""
+
+        # Copy the devices table first, it should have no conflicts
+        await self.execute("INSERT INTO devices_v8 SELECT * FROM devices_v7")
+        await self._migrate_tables(
+            {
+                "endpoints_v7": "endpoints_v8",
+                "in_clusters_v7": "in_clusters_v8",
+                "out_clusters_v7": "out_clusters_v8",
+                "groups_v7": "groups_v8",
+                "group_members_v7": "group_members_v8",
+                "relays_v7": "relays_v8",
+                "neighbors_v7": "neighbors_v8",
+                "node_descriptors_v7": "node_descriptors_v8",
+                "unsupported_attributes_v7": "unsupported_attributes_v8",
+            }
+        )
+
+        # The age of previously cached attributes is unknown
+        await self.execute(
+            "INSERT INTO attributes_cache_v8 SELECT *, 0 FROM attributes_cache_v7"
+        )
@@ -2,6 +2,9 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import collections
+import contextvars
+import functools
 import logging
 from typing import Any
 
@@ -12,6 +15,7 @@ import zigpy.exceptions
 import zigpy.group
 import zigpy.ota
 import zigpy.quirks
+import zigpy.scheduler
 import zigpy.state
 import zigpy.topology
 import zigpy.types as t
@@ -23,14 +27,67 @@ import zigpy.zdo.types as zdo_types
 DEFAULT_ENDPOINT_ID = 1
 LOGGER = logging.getLogger(__name__)
 
+# Set while a transmission holds a slot of the transmit scheduler, so that radio
+# libraries calling `super().request()` or sending through another method are not
+# admitted a second time
+_admitted: contextvars.ContextVar[bool] = contextvars.ContextVar(
+    "admitted", default=False
+)
+
+
+def _admit_transmission(method, profile_index: int):
+    """Wrap a send method to wait for a slot of the app's transmit scheduler."""
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        if _admitted.get():
+            return await method(self, *args, **kwargs)
+
+        if "profile" in kwargs:
+            profile = kwargs["profile"]
+        else:
+            profile = args[profile_index]
+
+        if "cluster" in kwargs:
+            cluster = kwargs["cluster"]
+        else:
+            cluster = args[profile_index + 1]
+
+        priority = zigpy.scheduler.get_priority(profile, cluster)
+
+        async with self.transmit_scheduler.admit(priority):
+            token = _admitted.set(True)
+
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                _admitted.reset(token)
+
+    return wrapper
+
 
 class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
     SCHEMA = zigpy.config.CONFIG_SCHEMA
     SCHEMA_DEVICE = zigpy.config.SCHEMA_DEVICE
 
+    # Index of the `profile` argument of every send method
+    _SEND_METHODS = {"request": 1, "mrequest": 1, "broadcast": 0}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Every transmission goes through the transmit scheduler, whichever radio
+        # library implements it
+        for name, profile_index in cls._SEND_METHODS.items():
+            if name in vars(cls):
+                setattr(cls, name, _admit_transmission(vars(cls)[name], profile_index))
+
     def __init__(self, config: dict):
         self._send_sequence = 0
+        # Sequence numbers of requests in flight to any device, skipped by `get_sequence`
+        self._tsns_in_flight: collections.Counter[int] = collections.Counter()
         self.devices: dict[t.EUI64, zigpy.device.Device] = {}
+        self._nwk_index: dict[t.NWK, zigpy.device.Device] = {}
         self.state: zigpy.state.State = zigpy.state.State()
         self.topology = None
         self._listeners = {}
@@ -41,6 +98,26 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
         self._ota = zigpy.ota.OTA(self)
         self._send_sequence = 0
 
+        counters = self.state.counters
+        assert counters is not None
+
+        self.transmit_scheduler = zigpy.scheduler.TransmitScheduler(
+            config.get(
+                zigpy.config.CONF_MAX_CONCURRENT_REQUESTS,
+                zigpy.config.defaults.CONF_MAX_CONCURRENT_REQUESTS_DEFAULT,
+            ),
+            counters=counters["transmit"],
+        )
+        self.interview_scheduler = zigpy.scheduler.InterviewScheduler(
+            config.get(
+                zigpy.config.CONF_MAX_CONCURRENT_INTERVIEWS,
+                zigpy.config.defaults.CONF_MAX_CONCURRENT_INTERVIEWS_DEFAULT,
+            ),
+            counters=counters["interview"],
+        )
+        self.add_listener(self.interview_scheduler)
+        self._interview_templates = zigpy.device.InterviewTemplates()
+
     async def _load_db(self) -> None:
         """Restore save state."""
         database_file = self.config[zigpy.config.CONF_DATABASE]
@@ -102,8 +179,12 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
         assert isinstance(ieee, t.EUI64)
         # TODO: Shut down existing device
 
+        if ieee in self.devices:
+            self._unindex_device_nwk(self.devices[ieee])
+
         dev = zigpy.device.Device(self, ieee, nwk)
         self.devices[ieee] = dev
+        self._index_device_nwk(dev)
         return dev
 
     async def update_network(
@@ -134,13 +215,31 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
         LOGGER.debug("Device is initialized %s", device)
 
         self.listener_event("raw_device_initialized", device)
+        self._add_interview_template(device)
         device = zigpy.quirks.get_device(device)
         self.devices[device.ieee] = device
+        self._index_device_nwk(device)
         if self._dblistener is not None:
             device.add_context_listener(self._dblistener)
             device.neighbors.add_context_listener(self._dblistener)
         self.listener_event("device_initialized", device)
 
+    def _add_interview_template(self, device: zigpy.device.Device) -> None:
+        """Remember the endpoints of an initialized device, before quirks apply."""
+        if self.config.get(
+            zigpy.config.CONF_INTERVIEW_TEMPLATES,
+            zigpy.config.defaults.CONF_INTERVIEW_TEMPLATES_DEFAULT,
+        ):
+            self._interview_templates.add_device(device)
+
+    async def apply_interview_template(self, device: zigpy.device.Device) -> None:
+        """Clone the endpoints of an identical device into a device being interviewed."""
+        if self.config.get(
+            zigpy.config.CONF_INTERVIEW_TEMPLATES,
+            zigpy.config.defaults.CONF_INTERVIEW_TEMPLATES_DEFAULT,
+        ):
+            await self._interview_templates.apply(device)
+
     async def remove(
         self, ieee: t.EUI64, remove_children: bool = True, rejoin: bool = False
     ) -> None:
@@ -197,7 +296,11 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
         except (zigpy.exceptions.DeliveryError, asyncio.TimeoutError) as ex:
             LOGGER.debug("Sending 'zdo_leave_req' failed: %s", ex)
 
-        self.devices.pop(device.ieee, None)
+        removed = self.devices.pop(device.ieee, None)
+        self._unindex_device_nwk(device)
+
+        if removed is not None:
+            self._unindex_device_nwk(removed)
 
     async def force_remove(self, dev):
         raise NotImplementedError
@@ -295,12 +398,15 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
             new_join = True
 
         if dev.nwk != nwk:
+            self._unindex_device_nwk(dev)
             dev.nwk = nwk
+            self._index_device_nwk(dev)
             LOGGER.debug("Device %s changed id (0x%04x => 0x%04x)", ieee, dev.nwk, nwk)
             new_join = True
 
         if new_join:
             self.listener_event("device_joined", dev)
+            dev._interview_priority = zigpy.scheduler.InterviewPriority.JOIN
             dev.schedule_initialize()
         elif not dev.is_initialized:
             # Re-initialize partially-initialized devices but don't emit "device_joined"
@@ -444,9 +550,32 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
     def permit_with_key(self, node, code, time_s=60):
         raise NotImplementedError
 
-    def get_sequence(self):
-        self._send_sequence = (self._send_sequence + 1) % 256
-        return self._send_sequence
+    def get_sequence(self) -> t.uint8_t:
+        """
+        Get the next TSN of the counter shared by all ZCL and ZDO requests. TSNs of
+        requests still in flight to any device are skipped, there is no separate TSN
+        space per destination.
+        """
+        assert self.state.counters is not None
+        counters = self.state.counters["tsn"]
+        in_flight = self._tsns_in_flight
+
+        if len(in_flight) > counters["max_in_flight"].value:
+            counters["max_in_flight"].update(len(in_flight))
+
+        for _ in range(256):
+            self._send_sequence = (self._send_sequence + 1) % 256
+            counters["allocated"].increment()
+
+            if self._send_sequence not in in_flight:
+                break
+
+            counters["in_flight_skipped"].increment()
+        else:
+            # Every TSN is in flight, the request will fail as a duplicate
+            counters["exhausted"].increment()
+
+        return t.uint8_t(self._send_sequence)
 
     def get_device(self, ieee=None, nwk=None):
         if ieee is not None:
@@ -455,13 +584,47 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
         if nwk == self.nwk:
             return self.devices[self.ieee]
 
+        dev = self._nwk_index.get(nwk)
+
+        if dev is not None and self._is_indexed_device(dev, nwk):
+            return dev
+
+        # Devices can be added or re-addressed without going through the application
         for dev in self.devices.values():
-            # TODO: Make this not terrible
             if dev.nwk == nwk:
+                self._nwk_index[nwk] = dev
                 return dev
 
         raise KeyError
 
+    def _is_indexed_device(self, device: zigpy.device.Device, nwk: t.NWK) -> bool:
+        """Check if an entry of the NWK index is still current."""
+        return device.nwk == nwk and self.devices.get(device.ieee) is device
+
+    def _index_device_nwk(self, device: zigpy.device.Device) -> None:
+        """Index a device by its NWK address, reporting address conflicts."""
+        existing = self._nwk_index.get(device.nwk)
+
+        if (
+            existing is not None
+            and existing.ieee != device.ieee
+            and self._is_indexed_device(existing, device.nwk)
+        ):
+            LOGGER.warning(
+                "NWK address conflict: 0x%04x is used by both %s and %s",
+                device.nwk,
+                existing.ieee,
+                device.ieee,
+            )
+            self.listener_event("nwk_address_conflict", device.nwk, existing, device)
+
+        self._nwk_index[device.nwk] = device
+
+    def _unindex_device_nwk(self, device: zigpy.device.Device) -> None:
+        """Remove the NWK index entry of a device."""
+        if self._nwk_index.get(device.nwk) is device:
+            del self._nwk_index[device.nwk]
+
     def get_endpoint_id(self, cluster_id: int, is_server_cluster: bool = False):
         """Returns coordinator endpoint id for specified cluster id."""
         return DEFAULT_ENDPOINT_ID
@@ -542,6 +705,18 @@ class ControllerApplication(zigpy.util.ListenableMixin, abc.ABC):
         """NWK Update ID."""
         return self.state.network_information.nwk_update_id
 
+    @property
+    def max_zcl_frame_size(self) -> int | None:
+        """
+        Largest ZCL frame the radio sends unfragmented, if known. Radio libraries
+        override this with the limit of their APS layer. Requests with more records
+        than fit in one frame are split into several.
+        """
+        return self.config.get(
+            zigpy.config.CONF_MAX_ZCL_FRAME_SIZE,
+            zigpy.config.defaults.CONF_MAX_ZCL_FRAME_SIZE_DEFAULT,
+        )
+
     @property
     def ota(self):
         return self._ota
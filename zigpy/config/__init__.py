@@ -3,6 +3,10 @@
 import voluptuous as vol
 
 from zigpy.config.defaults import (
+    CONF_INTERVIEW_TEMPLATES_DEFAULT,
+    CONF_MAX_CONCURRENT_INTERVIEWS_DEFAULT,
+    CONF_MAX_CONCURRENT_REQUESTS_DEFAULT,
+    CONF_MAX_ZCL_FRAME_SIZE_DEFAULT,
     CONF_NWK_CHANNEL_DEFAULT,
     CONF_NWK_CHANNELS_DEFAULT,
     CONF_NWK_EXTENDED_PAN_ID_DEFAULT,
@@ -26,6 +30,10 @@ import zigpy.types as t
 CONF_DATABASE = "database_path"
 CONF_DEVICE = "device"
 CONF_DEVICE_PATH = "path"
+CONF_INTERVIEW_TEMPLATES = "interview_templates"
+CONF_MAX_CONCURRENT_INTERVIEWS = "max_concurrent_interviews"
+CONF_MAX_CONCURRENT_REQUESTS = "max_concurrent_requests"
+CONF_MAX_ZCL_FRAME_SIZE = "max_zcl_frame_size"
 CONF_NWK = "network"
 CONF_NWK_CHANNEL = "channel"
 CONF_NWK_CHANNELS = "channels"
@@ -90,6 +98,19 @@ ZIGPY_SCHEMA = vol.Schema(
         vol.Optional(CONF_DATABASE, default=None): vol.Any(None, str),
         vol.Optional(CONF_NWK, default={}): SCHEMA_NETWORK,
         vol.Optional(CONF_OTA, default={}): SCHEMA_OTA,
+        vol.Optional(
+            CONF_MAX_CONCURRENT_REQUESTS, default=CONF_MAX_CONCURRENT_REQUESTS_DEFAULT
+        ): vol.All(int, vol.Range(min=1)),
+        vol.Optional(
+            CONF_MAX_CONCURRENT_INTERVIEWS,
+            default=CONF_MAX_CONCURRENT_INTERVIEWS_DEFAULT,
+        ): vol.All(int, vol.Range(min=1)),
+        vol.Optional(
+            CONF_INTERVIEW_TEMPLATES, default=CONF_INTERVIEW_TEMPLATES_DEFAULT
+        ): cv_boolean,
+        vol.Optional(
+            CONF_MAX_ZCL_FRAME_SIZE, default=CONF_MAX_ZCL_FRAME_SIZE_DEFAULT
+        ): vol.Any(None, vol.All(int, vol.Range(min=8))),
         vol.Optional(
             CONF_TOPO_SCAN_PERIOD, default=CONF_TOPO_SCAN_PERIOD_DEFAULT
         ): vol.All(int, vol.Range(min=20)),
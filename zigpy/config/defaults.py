@@ -28,6 +28,10 @@ CONF_NWK_TC_LINK_KEY_DEFAULT = t.KeyData(
     ]
 )
 CONF_NWK_UPDATE_ID_DEFAULT = 0x00
+CONF_INTERVIEW_TEMPLATES_DEFAULT = False
+CONF_MAX_CONCURRENT_INTERVIEWS_DEFAULT = 4
+CONF_MAX_CONCURRENT_REQUESTS_DEFAULT = 8
+CONF_MAX_ZCL_FRAME_SIZE_DEFAULT = None
 CONF_OTA_IKEA_DEFAULT = False
 CONF_OTA_LEDVANCE_DEFAULT = False
 CONF_OTA_SALUS_DEFAULT = False
@@ -5,7 +5,7 @@ import binascii
 import enum
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, NamedTuple
 
 from zigpy.const import (
     SIG_ENDPOINTS,
@@ -20,6 +20,7 @@ from zigpy.const import (
 import zigpy.endpoint
 import zigpy.exceptions
 import zigpy.neighbor
+import zigpy.scheduler
 from zigpy.types import NWK, Addressing, BroadcastAddress, Relays
 from zigpy.types.named import EUI64
 import zigpy.util
@@ -31,6 +32,8 @@ if TYPE_CHECKING:
 
 APS_REPLY_TIMEOUT = 5
 APS_REPLY_TIMEOUT_EXTENDED = 28
+# Endpoints of a device that are queried at the same time during initialization
+MAX_CONCURRENT_ENDPOINT_REQUESTS = 2
 LOGGER = logging.getLogger(__name__)
 
 
@@ -48,6 +51,7 @@ class Status(enum.IntEnum):
 class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
     """A device on the network"""
 
+    logger = LOGGER
     manufacturer_id_override = None
 
     def __init__(self, application, ieee, nwk):
@@ -61,12 +65,16 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
         self.last_seen: float | None = None
         self._initialize_task: asyncio.Task | None = None
         self._group_scan_task: asyncio.Task | None = None
+        # Priority of the next interview, raised by the application for new joins
+        self._interview_priority = zigpy.scheduler.InterviewPriority.RESUME
         self._listeners = {}
         self._manufacturer: str | None = None
         self._model: str | None = None
         self.node_desc: zdo.types.NodeDescriptor | None = None
         self.neighbors: zigpy.neighbor.Neighbors = zigpy.neighbor.Neighbors(self)
-        self._pending: zigpy.util.Requests = zigpy.util.Requests()
+        self._pending: zigpy.util.Requests = zigpy.util.Requests(
+            in_flight=application._tsns_in_flight
+        )
         self._relays: Relays | None = None
         self._skip_configuration: bool = False
 
@@ -108,8 +116,9 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
 
     async def group_membership_scan(self) -> None:
         """Sync up group membership."""
-        for ep in self.non_zdo_endpoints:
-            await ep.group_membership_scan()
+        with zigpy.scheduler.transmit_priority(zigpy.scheduler.Priority.MAINTENANCE):
+            for ep in self.non_zdo_endpoints:
+                await ep.group_membership_scan()
 
     @property
     def initializing(self) -> bool:
@@ -131,11 +140,23 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
 
         self.debug("Scheduling initialization")
 
+        priority = self._interview_priority
+        self._interview_priority = zigpy.scheduler.InterviewPriority.RESUME
+
         self.cancel_initialization()
-        self._initialize_task = asyncio.create_task(self.initialize())
+        self._initialize_task = asyncio.create_task(
+            self._scheduled_initialize(priority)
+        )
 
         return self._initialize_task
 
+    async def _scheduled_initialize(
+        self, priority: zigpy.scheduler.InterviewPriority
+    ) -> None:
+        """Initialize the device once the application allows it to be interviewed."""
+        async with self._application.interview_scheduler.interview(self, priority):
+            await self.initialize()
+
     async def get_node_descriptor(self) -> zdo.types.NodeDescriptor:
         self.info("Requesting 'Node Descriptor'")
 
@@ -204,6 +225,10 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
 
         self.status = Status.ZDO_INIT
 
+        # Identical devices can share their endpoints instead of interviewing them all
+        if not self.all_endpoints_init:
+            await self._application.apply_interview_template(self)
+
         # Initialize all of the discovered endpoints
         if self.all_endpoints_init:
             self.info(
@@ -212,16 +237,37 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
         else:
             self.info("Initializing endpoints %s", self.non_zdo_endpoints)
 
-            for ep in self.non_zdo_endpoints:
-                await ep.initialize()
+            results = await self._gather_endpoints(
+                self.non_zdo_endpoints, lambda ep: ep.initialize()
+            )
+
+            # Raise the error of the first endpoint that failed
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
         # Query model info
         if self.model is not None and self.manufacturer is not None:
             self.info("Already have model and manufacturer info")
         else:
-            for ep in self.non_zdo_endpoints:
-                if self.model is None or self.manufacturer is None:
-                    model, manufacturer = await ep.get_model_info()
+            endpoints = self.non_zdo_endpoints
+            step = MAX_CONCURRENT_ENDPOINT_REQUESTS
+
+            # Endpoints are read a window at a time until both values are found
+            for start in range(0, len(endpoints), step):
+                window = endpoints[start : start + step]
+                results = await self._gather_endpoints(
+                    window, lambda ep: ep.get_model_info()
+                )
+
+                for ep, result in zip(window, results):
+                    if self.model is not None and self.manufacturer is not None:
+                        break
+
+                    if isinstance(result, BaseException):
+                        raise result
+
+                    model, manufacturer = result
                     self.info(
                         "Read model %r and manufacturer %r from %s",
                         model,
@@ -235,6 +281,9 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
                     if manufacturer is not None:
                         self.manufacturer = manufacturer
 
+                if self.model is not None and self.manufacturer is not None:
+                    break
+
         self.status = Status.ENDPOINTS_INIT
 
         self.info("Discovered basic device information for %s", self)
@@ -242,6 +291,25 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
         # Signal to the application that the device is ready
         self._application.device_initialized(self)
 
+    async def _gather_endpoints(
+        self,
+        endpoints: list[zigpy.endpoint.Endpoint],
+        func: Callable[[zigpy.endpoint.Endpoint], Awaitable[Any]],
+    ) -> list:
+        """Call `func` for every endpoint, a few at a time.
+
+        Results and exceptions are returned in the order of the endpoints.
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_ENDPOINT_REQUESTS)
+
+        async def call(ep: zigpy.endpoint.Endpoint) -> Any:
+            async with semaphore:
+                return await func(ep)
+
+        return await asyncio.gather(
+            *(call(ep) for ep in endpoints), return_exceptions=True
+        )
+
     def add_endpoint(self, endpoint_id) -> zigpy.endpoint.Endpoint:
         ep = zigpy.endpoint.Endpoint(self, endpoint_id)
         self.endpoints[endpoint_id] = ep
@@ -309,6 +377,20 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
     def deserialize(self, endpoint_id, cluster_id, data):
         return self.endpoints[endpoint_id].deserialize(cluster_id, data)
 
+    def deserialize_frame(
+        self, endpoint_id: int, cluster_id: int, data: bytes
+    ) -> foundation.ZCLFrame:
+        endpoint = self.endpoints[endpoint_id]
+
+        # ZDO frames and devices with custom decoding are decoded eagerly
+        if endpoint_id == 0 or (
+            getattr(self.deserialize, "__func__", None) is not Device.deserialize
+        ):
+            hdr, args = self.deserialize(endpoint_id, cluster_id, data)
+            return foundation.ZCLFrame(data, hdr, payload=args)
+
+        return endpoint.deserialize_frame(cluster_id, data)
+
     def handle_message(
         self,
         profile: int,
@@ -323,7 +405,14 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
         self.last_seen = time.time()
 
         try:
-            hdr, args = self.deserialize(src_ep, cluster, message)
+            frame = self.deserialize_frame(src_ep, cluster, message)
+            hdr = frame.hdr
+            request = self._pending.get(hdr.tsn) if hdr.is_reply else None
+
+            # Only replies to pending requests are decoded here, everything else is
+            # decoded by the cluster it is for, if anything consumes it
+            if request is not None:
+                args = frame.payload
         except ValueError as e:
             LOGGER.error(
                 "Failed to parse message (%s) on cluster %d, because %s",
@@ -344,10 +433,9 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
             )
             return
 
-        if hdr.tsn in self._pending and hdr.is_reply:
+        if request is not None:
             try:
-                self._pending[hdr.tsn].result.set_result(args)
-                return
+                request.result.set_result(args)
             except asyncio.InvalidStateError:
                 self.debug(
                     (
@@ -356,11 +444,18 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
                     ),
                     hdr.tsn,
                 )
-                return
+            return
 
         endpoint = self.endpoints[src_ep]
-        return endpoint.handle_message(
-            profile, cluster, hdr, args, dst_addressing=dst_addressing
+
+        if src_ep == 0:
+            # ZDO frames are always decoded eagerly
+            return endpoint.handle_message(
+                profile, cluster, hdr, frame.payload, dst_addressing=dst_addressing
+            )
+
+        return endpoint.handle_frame(
+            profile, cluster, frame, dst_addressing=dst_addressing
         )
 
     def reply(self, profile, cluster, src_ep, dst_ep, sequence, data, use_ieee=False):
@@ -490,6 +585,134 @@ class Device(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
         )
 
 
+class EndpointTemplate(NamedTuple):
+    """Simple descriptor of an endpoint, as discovered during an interview."""
+
+    profile_id: int
+    device_type: int
+    input_clusters: tuple[int, ...]
+    output_clusters: tuple[int, ...]
+
+    @classmethod
+    def from_endpoint(cls, ep: zigpy.endpoint.Endpoint) -> EndpointTemplate:
+        return cls(
+            profile_id=ep.profile_id,
+            device_type=ep.device_type,
+            input_clusters=tuple(ep.in_clusters),
+            output_clusters=tuple(ep.out_clusters),
+        )
+
+    def apply(self, ep: zigpy.endpoint.Endpoint) -> None:
+        """Set up an endpoint as if its simple descriptor was just queried."""
+        ep.profile_id = self.profile_id
+        ep.device_type = self.device_type
+
+        for cluster_id in self.input_clusters:
+            ep.add_input_cluster(cluster_id)
+
+        for cluster_id in self.output_clusters:
+            ep.add_output_cluster(cluster_id)
+
+        ep.status = zigpy.endpoint.Status.ZDO_INIT
+
+
+class InterviewTemplates:
+    """Endpoints of initialized devices, to be cloned into identical new devices.
+
+    Templates are keyed by the node descriptor and active endpoints of a device, which
+    are known before any endpoint is interviewed, and then by manufacturer and model.
+    """
+
+    def __init__(self) -> None:
+        self._templates: dict[
+            tuple[bytes, tuple[int, ...]],
+            dict[tuple[str, str], dict[int, EndpointTemplate]],
+        ] = {}
+
+    @staticmethod
+    def _signature(device: Device) -> tuple[bytes, tuple[int, ...]] | None:
+        # Node descriptors loaded from older databases can be incomplete
+        if device.node_desc is None or not device.node_desc.is_valid:
+            return None
+
+        return (
+            device.node_desc.serialize(),
+            tuple(sorted(ep.endpoint_id for ep in device.non_zdo_endpoints)),
+        )
+
+    def add_device(self, device: Device) -> None:
+        """Add the endpoints of an initialized device as a template."""
+        if device.model is None or device.manufacturer is None:
+            return
+
+        signature = self._signature(device)
+
+        if signature is None or not signature[1]:
+            return
+
+        endpoints = {}
+
+        for ep in device.non_zdo_endpoints:
+            # Inactive endpoints have nothing to clone
+            if ep.status != zigpy.endpoint.Status.ZDO_INIT or ep.profile_id is None:
+                return
+
+            endpoints[ep.endpoint_id] = EndpointTemplate.from_endpoint(ep)
+
+        self._templates.setdefault(signature, {})[
+            device.manufacturer, device.model
+        ] = endpoints
+
+    async def apply(self, device: Device) -> bool:
+        """Clone the endpoints of an identical device into a device being interviewed.
+
+        One endpoint is interviewed to verify the template and to read the model and
+        manufacturer of the device. Returns whether the endpoints were cloned.
+        """
+        candidates = self._templates.get(self._signature(device))
+
+        if not candidates:
+            return False
+
+        verify_ep = device.non_zdo_endpoints[0]
+        await verify_ep.initialize()
+
+        if verify_ep.status != zigpy.endpoint.Status.ZDO_INIT:
+            return False
+
+        descriptor = EndpointTemplate.from_endpoint(verify_ep)
+
+        if not any(
+            endpoints[verify_ep.endpoint_id] == descriptor
+            for endpoints in candidates.values()
+        ):
+            return False
+
+        model, manufacturer = await verify_ep.get_model_info()
+
+        # Keep what was read even without a match, so that it is not read again
+        if model is not None:
+            device.model = model
+
+        if manufacturer is not None:
+            device.manufacturer = manufacturer
+
+        endpoints = candidates.get((manufacturer, model))
+
+        if endpoints is None or endpoints[verify_ep.endpoint_id] != descriptor:
+            return False
+
+        device.info(
+            "Cloning endpoints of an initialized %r %r device", manufacturer, model
+        )
+
+        for ep in device.non_zdo_endpoints:
+            if ep is not verify_ep:
+                endpoints[ep.endpoint_id].apply(ep)
+
+        return True
+
+
 async def broadcast(
     app,
     profile,
@@ -13,7 +13,7 @@ from zigpy.typing import DeviceType
 import zigpy.util
 import zigpy.zcl
 from zigpy.zcl.clusters.general import Basic
-from zigpy.zcl.foundation import Status as ZCLStatus, ZCLHeader
+from zigpy.zcl.foundation import Status as ZCLStatus, ZCLFrame, ZCLHeader
 from zigpy.zdo.types import Status as zdo_status
 
 LOGGER = logging.getLogger(__name__)
@@ -33,6 +33,8 @@ class Status(enum.IntEnum):
 class Endpoint(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
     """An endpoint on a device on the network"""
 
+    logger = LOGGER
+
     def __init__(self, device: DeviceType, endpoint_id: int):
         self._device: DeviceType = device
         self._endpoint_id: int = endpoint_id
@@ -204,6 +206,60 @@ class Endpoint(zigpy.util.LocalLogMixin, zigpy.util.ListenableMixin):
         cluster = self.in_clusters.get(cluster_id, self.out_clusters.get(cluster_id))
         return cluster.deserialize(data)
 
+    def deserialize_frame(self, cluster_id, data):
+        """Deserialize ZCL header, leaving the payload to be decoded on demand"""
+        if getattr(self.deserialize, "__func__", None) is not Endpoint.deserialize:
+            # Endpoints with custom decoding have to be decoded eagerly
+            hdr, args = self.deserialize(cluster_id, data)
+            return ZCLFrame(data, hdr, payload=args)
+
+        if cluster_id not in self.in_clusters and cluster_id not in self.out_clusters:
+            raise KeyError(f"No cluster ID 0x{cluster_id:04x} on {self.unique_id}")
+
+        cluster = self.in_clusters.get(cluster_id, self.out_clusters.get(cluster_id))
+        return cluster.deserialize_frame(data)
+
+    def handle_frame(
+        self,
+        profile: int,
+        cluster: int,
+        frame: ZCLFrame,
+        *,
+        dst_addressing: None
+        | (Addressing.Group | Addressing.IEEE | Addressing.NWK) = None,
+    ) -> None:
+        """Pass a received frame to its cluster, which decodes the payload if needed"""
+        if (
+            getattr(self.handle_message, "__func__", None)
+            is not Endpoint.handle_message
+        ):
+            # Endpoints with custom handling receive decoded payloads
+            try:
+                args = frame.payload
+            except ValueError as e:
+                self.error(
+                    "Failed to parse message (%s), because %s", frame.data.hex(), e
+                )
+                return
+
+            self.handle_message(
+                profile, cluster, frame.hdr, args, dst_addressing=dst_addressing
+            )
+            return
+
+        if cluster in self.in_clusters:
+            handler = self.in_clusters[cluster].handle_frame
+        elif cluster in self.out_clusters:
+            handler = self.out_clusters[cluster].handle_frame
+        else:
+            self.debug("Message on unknown cluster 0x%04x", cluster)
+            self.listener_event(
+                "unknown_cluster_message", frame.hdr.command_id, frame.payload
+            )
+            return
+
+        handler(frame, dst_addressing=dst_addressing)
+
     def handle_message(
         self,
         profile: int,
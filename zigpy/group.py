@@ -191,6 +191,8 @@ class GroupEndpoint(LocalLogMixin):
     wrapper for virtual clusters.
     """
 
+    logger = LOGGER
+
     def __init__(self, group: Group):
         """Instantiate GroupRequest."""
         self._group: Group = group
@@ -41,6 +41,8 @@ class Neighbor:
 class Neighbors(zigpy.util.ListenableMixin, zigpy.util.LocalLogMixin):
     """Neighbor list for a device."""
 
+    logger = LOGGER
+
     def __init__(self, device: DeviceType) -> None:
         """Initialize instance."""
         self._device: DeviceType = device
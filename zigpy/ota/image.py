@@ -39,7 +39,7 @@ class HeaderString(str):
     def deserialize(cls, data):
         if len(data) < cls._size:
             raise ValueError(f"Data is too short. Should be at least {cls._size}")
-        raw = data[: cls._size].split(b"\x00")[0]
+        raw = bytes(data[: cls._size]).split(b"\x00")[0]
         return cls(raw.decode("utf8", errors="replace")), data[cls._size :]
 
     def serialize(self):
@@ -157,6 +157,7 @@ class OTAImage(t.Struct, BaseOTAImage):
     subelements: t.List[SubElement]
 
     @classmethod
+    @t.zero_copy_deserialize
     def deserialize(cls, data) -> tuple[OTAImage, bytes]:
         hdr, data = OTAImageHeader.deserialize(data)
         elements_len = hdr.image_size - hdr.header_length
@@ -196,9 +197,10 @@ class HueSBLOTAImage(BaseOTAImage):
         return self.header.serialize() + self.data
 
     @classmethod
+    @t.zero_copy_deserialize
     def deserialize(cls, data) -> tuple[HueSBLOTAImage, bytes]:
         header, remaining_data = OTAImageHeader.deserialize(data)
-        firmware = remaining_data[: header.image_size - len(header.serialize())]
+        firmware = bytes(remaining_data[: header.image_size - len(header.serialize())])
 
         if len(data) < header.image_size:
             raise ValueError(
@@ -30,6 +30,7 @@ SKIP_OTA_FILES = (ENABLE_IKEA_OTA, ENABLE_LEDVANCE_OTA)
 class Basic(zigpy.util.LocalLogMixin, ABC):
     """Skeleton OTA Firmware provider."""
 
+    logger = LOGGER
     REFRESH = datetime.timedelta(hours=12)
 
     def __init__(self):
@@ -0,0 +1,244 @@
+"""Scheduling of outgoing transmissions and device interviews."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import contextvars
+import enum
+import heapq
+import itertools
+import logging
+import time
+from typing import TYPE_CHECKING, AsyncIterator, Iterator
+
+import zigpy.state
+import zigpy.types as t
+
+if TYPE_CHECKING:
+    from zigpy.device import Device
+
+LOGGER = logging.getLogger(__name__)
+
+OTA_CLUSTER_ID = 0x0019
+SECURITY_CLUSTER_IDS = frozenset({0x0500, 0x0501, 0x0502})
+
+# Delay before re-interviewing a device, doubled after every consecutive failure
+INTERVIEW_BACKOFF_INITIAL = 5
+INTERVIEW_BACKOFF_MAX = 10 * 60
+
+
+class Priority(enum.IntEnum):
+    """Priority classes of outgoing transmissions, lower values are sent first."""
+
+    INTERACTIVE = 0
+    SECURITY = 1
+    MAINTENANCE = 2
+    OTA = 3
+
+
+class InterviewPriority(enum.IntEnum):
+    """Priority classes of device interviews, lower values are started first."""
+
+    JOIN = 0
+    RESUME = 1
+
+
+_transmit_priority: contextvars.ContextVar[Priority | None] = contextvars.ContextVar(
+    "transmit_priority", default=None
+)
+
+
+@contextlib.contextmanager
+def transmit_priority(priority: Priority) -> Iterator[None]:
+    """Send all transmissions made within the context with the given priority."""
+    token = _transmit_priority.set(priority)
+
+    try:
+        yield
+    finally:
+        _transmit_priority.reset(token)
+
+
+def get_priority(profile: int, cluster: int) -> Priority:
+    """Priority of a transmission, unless one was set with `transmit_priority`."""
+    priority = _transmit_priority.get()
+
+    if priority is not None:
+        return priority
+
+    # ZDO cluster IDs overlap with ZCL ones
+    if profile == 0x0000:
+        return Priority.INTERACTIVE
+    elif cluster == OTA_CLUSTER_ID:
+        return Priority.OTA
+    elif cluster in SECURITY_CLUSTER_IDS:
+        return Priority.SECURITY
+
+    return Priority.INTERACTIVE
+
+
+class PriorityScheduler:
+    """Admit tasks by priority into a window of a limited number of running tasks.
+
+    Tasks of the same priority are admitted in the order they were queued.
+    """
+
+    priorities: type[enum.IntEnum]
+
+    def __init__(
+        self, max_in_flight: int, counters: zigpy.state.CounterGroup | None = None
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self._in_flight = 0
+        self._queue: list[tuple[enum.IntEnum, int, asyncio.Future]] = []
+        self._order = itertools.count()
+        self._counters = (
+            counters if counters is not None else zigpy.state.CounterGroup()
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of admitted tasks that are still running."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> dict[enum.IntEnum, int]:
+        """Number of tasks waiting for admission, by priority."""
+        depth: dict[enum.IntEnum, int] = dict.fromkeys(self.priorities, 0)
+
+        for priority, _, _ in self._queue:
+            depth[priority] += 1
+
+        return depth
+
+    @property
+    def counters(self) -> zigpy.state.CounterGroup:
+        """Admission and wait time counters."""
+        return self._counters
+
+    @contextlib.asynccontextmanager
+    async def admit(self, priority: enum.IntEnum) -> AsyncIterator[None]:
+        """Wait until a task can run and hold its slot while it runs."""
+        await self._acquire(priority)
+
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: enum.IntEnum) -> None:
+        name = priority.name.lower()
+        self._counters[f"{name}_requests"].increment()
+
+        if self._in_flight < self.max_in_flight and not self._queue:
+            self._in_flight += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        entry = (priority, next(self._order), future)
+        heapq.heappush(self._queue, entry)
+
+        self._counters[f"{name}_queued"].increment()
+
+        if len(self._queue) > self._counters["max_queue_depth"].value:
+            self._counters["max_queue_depth"].update(len(self._queue))
+
+        started = loop.time()
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done():
+                future.cancel()
+
+            if future.cancelled():
+                self._queue.remove(entry)
+                heapq.heapify(self._queue)
+            else:
+                # The slot was handed over just as the waiter was cancelled
+                self._release()
+
+            raise
+        finally:
+            wait_ms = int((loop.time() - started) * 1000)
+            self._counters[f"{name}_wait_ms"].increment(wait_ms)
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+
+        if self._queue and self._in_flight < self.max_in_flight:
+            _, _, future = heapq.heappop(self._queue)
+            self._in_flight += 1
+            future.set_result(None)
+
+
+class TransmitScheduler(PriorityScheduler):
+    """Admit outgoing transmissions by priority into a window of in-flight requests."""
+
+    priorities = Priority
+
+
+class InterviewScheduler(PriorityScheduler):
+    """Limit the number of concurrent device interviews.
+
+    Freshly joined devices are interviewed first and devices that failed their
+    interview are only interviewed again after an exponentially increasing delay.
+    """
+
+    priorities = InterviewPriority
+
+    def __init__(
+        self, max_in_flight: int, counters: zigpy.state.CounterGroup | None = None
+    ) -> None:
+        super().__init__(max_in_flight, counters)
+
+        # Consecutive interview failures and the time of the last one, by device
+        self._failures: dict[t.EUI64, tuple[int, float]] = {}
+
+    def backoff_delay(self, ieee: t.EUI64) -> float:
+        """Seconds to wait before the device can be interviewed again."""
+        if ieee not in self._failures:
+            return 0
+
+        failures, last_failure = self._failures[ieee]
+        delay = min(
+            INTERVIEW_BACKOFF_INITIAL * 2 ** (failures - 1), INTERVIEW_BACKOFF_MAX
+        )
+
+        return max(0, last_failure + delay - time.monotonic())
+
+    @contextlib.asynccontextmanager
+    async def interview(
+        self, device: Device, priority: InterviewPriority
+    ) -> AsyncIterator[None]:
+        """Wait for the backoff delay of the device and then for an interview slot."""
+        delay = self.backoff_delay(device.ieee)
+
+        if delay > 0:
+            self._counters["backoff"].increment()
+            device.debug("Delaying interview by %0.1fs after failures", delay)
+            await asyncio.sleep(delay)
+
+        async with self.admit(priority):
+            device.debug(
+                "Starting interview, %d running and %d queued",
+                self.in_flight,
+                len(self._queue),
+            )
+            yield
+
+    def device_initialized(self, device: Device) -> None:
+        if self._failures.pop(device.ieee, None) is not None:
+            LOGGER.debug("Device %s was interviewed after failures", device.ieee)
+
+        self._counters["initialized"].increment()
+
+    def device_init_failure(self, device: Device) -> None:
+        failures, _ = self._failures.get(device.ieee, (0, 0))
+        self._failures[device.ieee] = (failures + 1, time.monotonic())
+        self._counters["failed"].increment()
+
+    def device_removed(self, device: Device) -> None:
+        self._failures.pop(device.ieee, None)
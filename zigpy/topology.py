@@ -7,6 +7,7 @@ from typing import Dict, Optional
 
 import zigpy.config
 import zigpy.neighbor
+import zigpy.scheduler
 import zigpy.types as t
 import zigpy.typing
 import zigpy.util
@@ -67,6 +68,10 @@ class Topology(zigpy.util.ListenableMixin):
     async def _scan(self) -> None:
         """Scan topology."""
 
+        with zigpy.scheduler.transmit_priority(zigpy.scheduler.Priority.MAINTENANCE):
+            await self._scan_devices()
+
+    async def _scan_devices(self) -> None:
         devices_to_scan = [
             dev
             for dev in self._app.devices.values()
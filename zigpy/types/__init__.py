@@ -4,6 +4,10 @@ from .struct import *  # noqa: F401,F403
 
 
 def deserialize(data, schema):
+    if type(data) is not memoryview:
+        result, data = deserialize(memoryview(data), schema)
+        return result, bytes(data)
+
     result = []
     for type_ in schema:
         value, data = type_.deserialize(data)
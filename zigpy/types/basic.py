@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import enum
+import functools
 import inspect
 import struct
 from typing import Callable, TypeVar
@@ -8,42 +9,83 @@ from typing import Callable, TypeVar
 CALLABLE_T = TypeVar("CALLABLE_T", bound=Callable)  # pylint: disable=invalid-name
 
 
-class Bits(list):
-    @classmethod
-    def from_bitfields(cls, fields):
-        instance = cls()
+def zero_copy_deserialize(func: CALLABLE_T) -> CALLABLE_T:
+    """
+    Decorator for `deserialize` classmethods that decode multiple values. Data is
+    decoded from a `memoryview` so that slicing off each value does not copy the rest
+    of the buffer. Callers passing a `memoryview` get one back, other callers get the
+    remaining data as `bytes`.
+    """
 
-        # Little endian, so [11, 1000, 00] will be packed as 00_1000_11
-        for field in fields[::-1]:
-            instance.extend(field.bits())
+    @functools.wraps(func)
+    def wrapper(cls, data, *args, **kwargs):
+        if type(data) is memoryview:
+            return func(cls, data, *args, **kwargs)
 
-        return instance
+        value, remaining = func(cls, memoryview(data), *args, **kwargs)
+        return value, bytes(remaining)
 
-    def serialize(self) -> bytes:
-        if len(self) % 8 != 0:
-            raise ValueError(f"Cannot serialize {len(self)} bits into bytes: {self}")
+    return wrapper
+
+
+def pack_bitfields(fields) -> tuple[int, int]:
+    """
+    Packs a sequence of integer bitfields into a single integer, returning it along
+    with its size in bits. The first field occupies the least significant bits.
+    """
+
+    n = 0
+    offset = 0
+
+    for field in fields:
+        n |= (int(field) & ((1 << field._bits) - 1)) << offset
+        offset += field._bits
+
+    return n, offset
+
+
+def unpack_bitfields(n: int, types) -> list:
+    """
+    Unpacks an integer produced by `pack_bitfields` into instances of the given types.
+    """
+
+    values = []
 
-        serialized_bytes = []
+    for type_ in types:
+        bits = type_._bits
+        value = n & ((1 << bits) - 1)
+        n >>= bits
 
-        for index in range(0, len(self), 8):
-            byte = 0x00
+        if type_._signed and value >> (bits - 1):
+            value -= 1 << bits
 
-            for bit in self[index : index + 8]:
-                byte <<= 1
-                byte |= bit
+        values.append(type_(value))
 
-            serialized_bytes.append(byte)
+    return values
 
-        return bytes(serialized_bytes)
 
+class Bits(list):
     @classmethod
-    def deserialize(cls, data) -> tuple[Bits, bytes]:
-        bits: list[int] = []
+    def from_int(cls, n: int, size: int) -> Bits:
+        return cls(map(int, f"{n:0{size}b}")) if size else cls()
+
+    def to_int(self) -> int:
+        return int("".join(["1" if bit & 1 else "0" for bit in self]) or "0", 2)
+
+    @classmethod
+    def from_bitfields(cls, fields):
+        # Little endian, so [11, 1000, 00] will be packed as 00_1000_11
+        return cls.from_int(*pack_bitfields(fields))
 
-        for byte in data:
-            bits.extend((byte >> i) & 1 for i in range(7, -1, -1))
+    def serialize(self) -> bytes:
+        if len(self) % 8 != 0:
+            raise ValueError(f"Cannot serialize {len(self)} bits into bytes: {self}")
 
-        return cls(bits), b""
+        return self.to_int().to_bytes(len(self) // 8, "big")
+
+    @classmethod
+    def deserialize(cls, data) -> tuple[Bits, bytes]:
+        return cls.from_int(int.from_bytes(data, "big"), 8 * len(data)), b""
 
 
 NOT_SET = object()
@@ -54,18 +96,30 @@ class FixedIntType(int):
     _bits = None
     _size = None  # Only for backwards compatibility, not set for smaller ints
 
+    # Computed once per class
+    _min_value = None
+    _max_value = None
+
+    # Every possible instance of small integer types, indexed by `n - _min_value`
+    _cache = None
+
     def __new__(cls, *args, **kwargs):
+        if cls._cache is not None and len(args) == 1 and not kwargs:
+            value = args[0]
+
+            if type(value) is int and cls._min_value <= value <= cls._max_value:
+                return cls._cache[value - cls._min_value]
+
         if cls._signed is None or cls._bits is None:
             raise TypeError(f"{cls} is abstract and cannot be created")
 
         n = super().__new__(cls, *args, **kwargs)
 
-        if not cls._signed and not 0 <= n <= 2**cls._bits - 1:
-            raise ValueError(f"{int(n)} is not an unsigned {cls._bits} bit integer")
-        elif (
-            cls._signed and not -(2 ** (cls._bits - 1)) <= n <= 2 ** (cls._bits - 1) - 1
-        ):
-            raise ValueError(f"{int(n)} is not a signed {cls._bits} bit integer")
+        if not cls._min_value <= n <= cls._max_value:
+            if cls._signed:
+                raise ValueError(f"{int(n)} is not a signed {cls._bits} bit integer")
+            else:
+                raise ValueError(f"{int(n)} is not an unsigned {cls._bits} bit integer")
 
         return n
 
@@ -106,24 +160,40 @@ class FixedIntType(int):
         if "__new__" not in cls.__dict__:
             cls.__new__ = cls.__new__
 
+        if cls._signed is not None and cls._bits is not None:
+            if cls._signed:
+                cls._min_value = -(1 << (cls._bits - 1))
+                cls._max_value = (1 << (cls._bits - 1)) - 1
+            else:
+                cls._min_value = 0
+                cls._max_value = (1 << cls._bits) - 1
+
+        # Instances of small types are immutable and can be shared. Enum members are
+        # handled by the enum module and other subclasses may carry state of their own.
+        if (
+            cls._bits is not None
+            and cls._bits <= 8
+            and cls._signed is not None
+            and cls.__new__ is FixedIntType.__new__
+            and not issubclass(cls, enum.Enum)
+        ):
+            cls._cache = tuple(
+                int.__new__(cls, n) for n in range(cls._min_value, cls._max_value + 1)
+            )
+        else:
+            cls._cache = None
+
     def bits(self) -> Bits:
-        return Bits([(self >> n) & 0b1 for n in range(self._bits - 1, -1, -1)])
+        return Bits.from_int(int(self) & ((1 << self._bits) - 1), self._bits)
 
     @classmethod
     def from_bits(cls, bits: Bits) -> tuple[FixedIntType, Bits]:
         if len(bits) < cls._bits:
             raise ValueError(f"Not enough bits to decode {cls}: {bits}")
 
-        n = 0
+        (n,) = unpack_bitfields(Bits(bits[-cls._bits :]).to_int(), [cls])
 
-        for bit in bits[-cls._bits :]:
-            n <<= 1
-            n |= bit & 1
-
-        if cls._signed and n >= 2 ** (cls._bits - 1):
-            n -= 2**cls._bits
-
-        return cls(n), bits[: -cls._bits]
+        return n, bits[: -cls._bits]
 
     def serialize(self) -> bytes:
         if self._bits % 8 != 0:
@@ -145,6 +215,18 @@ class FixedIntType(int):
         data = data[byte_size:]
         return r, data
 
+    @classmethod
+    def from_byte_array(cls, data: bytes) -> list[FixedIntType]:
+        """
+        Creates one instance per byte of `data`. Only unsigned 8-bit types are supported
+        and no new objects are allocated for the items.
+        """
+
+        if cls._cache is None or cls._bits != 8 or cls._signed:
+            raise TypeError(f"{cls} is not an unsigned 8 bit integer type")
+
+        return list(map(cls._cache.__getitem__, data))
+
 
 class uint_t(FixedIntType, signed=False):
     pass
@@ -248,6 +330,13 @@ class uint64_t(uint_t, bits=64):
 
 class _IntEnumMeta(enum.EnumMeta):
     def __call__(cls, value, names=None, *args, **kwargs):
+        # Existing members are returned directly, bypassing `Enum.__new__`
+        if names is None and not args and not kwargs:
+            try:
+                return cls._value2member_map_[value]
+            except (KeyError, TypeError):
+                pass
+
         if isinstance(value, str) and value.startswith("0x"):
             value = int(value, base=16)
         else:
@@ -285,6 +374,11 @@ def enum_factory(int_type: CALLABLE_T, undefined: str = "undefined") -> CALLABLE
     class _NewEnum(int_type, enum.Enum, metaclass=_IntEnumMeta):
         @classmethod
         def _missing_(cls, value):
+            cache = vars(cls).get("_undefined_members")
+
+            if cache is not None and value in cache:
+                return cache[value]
+
             new = cls._member_type_.__new__(cls, value)
 
             if cls._bits % 8 == 0:
@@ -294,6 +388,17 @@ def enum_factory(int_type: CALLABLE_T, undefined: str = "undefined") -> CALLABLE
 
             new._name_ = name.format(value)
             new._value_ = value
+
+            # Only small enums cache their undefined values, since the values of larger
+            # ones come from devices and are unbounded. They are kept out of the members
+            # so that `value in cls` is unaffected.
+            if cls._bits <= 8:
+                if cache is None:
+                    cache = {}
+                    cls._undefined_members = cache
+
+                cache[value] = new
+
             return new
 
     return _NewEnum
@@ -387,11 +492,24 @@ class bitmap64(bitmap_factory(uint64_t)):
     pass
 
 
+# Native `struct` formats of the IEEE 754 binary16, binary32 and binary64 layouts
+_FLOAT_FORMATS = {(5, 10): "e", (8, 23): "f", (11, 52): "d"}
+
+
 class BaseFloat(float):
     _exponent_bits = None
     _fraction_bits = None
     _size = None
 
+    # `struct` format character, if the layout has a native equivalent
+    _format = None
+
+    # Magnitude of the smallest non-zero values for which `struct` and `_convert_format`
+    # produce identical results: the converter truncates instead of rounding, never
+    # emits subnormals and clamps the lowest normal exponent.
+    _native_serialize_min = None
+    _native_deserialize_min = None
+
     def __init_subclass__(cls, exponent_bits, fraction_bits):
         size_bits = 1 + exponent_bits + fraction_bits
         assert size_bits % 8 == 0
@@ -399,6 +517,13 @@ class BaseFloat(float):
         cls._exponent_bits = exponent_bits
         cls._fraction_bits = fraction_bits
         cls._size = size_bits // 8
+        cls._format = _FLOAT_FORMATS.get((exponent_bits, fraction_bits))
+
+        bias = 2 ** (exponent_bits - 1) - 1
+        cls._native_serialize_min = 2.0 ** (2 - bias)
+
+        # Everything is converted through a double, which has its own exponent clamp
+        cls._native_deserialize_min = max(2.0 ** (1 - bias), 2.0 ** (2 - 1023))
 
     @staticmethod
     def _convert_format(*, src: BaseFloat, dst: BaseFloat, n: int) -> int:
@@ -439,21 +564,107 @@ class BaseFloat(float):
             | dst_frac
         )
 
-    def serialize(self) -> bytes:
+    @classmethod
+    def _is_native_serialized(cls, value: float, packed_value: float) -> bool:
+        return packed_value == value and (
+            packed_value == 0 or abs(packed_value) >= cls._native_serialize_min
+        )
+
+    @classmethod
+    def _is_native_deserialized(cls, value: float) -> bool:
+        return value == 0 or abs(value) >= cls._native_deserialize_min
+
+    def _serialize_converted(self) -> bytes:
         return self._convert_format(
             src=Double, dst=self, n=int.from_bytes(struct.pack("<d", self), "little")
         ).to_bytes(self._size, "little")
 
+    @classmethod
+    def _deserialize_converted(cls, data: bytes) -> BaseFloat:
+        double_bytes = cls._convert_format(
+            src=cls, dst=Double, n=int.from_bytes(data[: cls._size], "little")
+        ).to_bytes(Double._size, "little")
+
+        return cls(struct.unpack("<d", double_bytes)[0])
+
+    def serialize(self) -> bytes:
+        if self._format is not None:
+            try:
+                data = struct.pack(f"<{self._format}", self)
+            except OverflowError:
+                pass
+            else:
+                (packed,) = struct.unpack(f"<{self._format}", data)
+
+                # `struct` rounds to the nearest value but the converter truncates,
+                # which is always the next representable value towards zero
+                if abs(packed) > abs(self):
+                    n = int.from_bytes(data, "little") - 1
+                    data = n.to_bytes(self._size, "little")
+                    (packed,) = struct.unpack(f"<{self._format}", data)
+
+                if abs(packed) >= self._native_serialize_min or packed == self == 0:
+                    return data
+
+        return self._serialize_converted()
+
     @classmethod
     def deserialize(cls, data: bytes) -> tuple[BaseFloat, bytes]:
         if len(data) < cls._size:
             raise ValueError(f"Data is too short to contain {cls._size} bytes")
 
-        double_bytes = cls._convert_format(
-            src=cls, dst=Double, n=int.from_bytes(data[: cls._size], "little")
-        ).to_bytes(Double._size, "little")
+        if cls._format is not None:
+            (value,) = struct.unpack_from(f"<{cls._format}", data)
+
+            if cls._is_native_deserialized(value):
+                return cls(value), data[cls._size :]
+
+        return cls._deserialize_converted(data), data[cls._size :]
+
+    @classmethod
+    def serialize_array(cls, values) -> bytes:
+        """
+        Serializes a sequence of values, packing them all with a single `struct` call if
+        every value can be represented natively.
+        """
+
+        if cls._format is not None:
+            try:
+                data = struct.pack(f"<{len(values)}{cls._format}", *values)
+            except (struct.error, OverflowError):
+                pass
+            else:
+                packed = struct.unpack(f"<{len(values)}{cls._format}", data)
+
+                if all(map(cls._is_native_serialized, values, packed)):
+                    return data
+
+        return b"".join([cls(v).serialize() for v in values])
+
+    @classmethod
+    def deserialize_array(
+        cls, data: bytes, count: int
+    ) -> tuple[list[BaseFloat], bytes]:
+        """
+        Deserializes `count` consecutive values with a single `struct` call.
+        """
+
+        size = count * cls._size
+
+        if len(data) < size:
+            raise ValueError(f"Data is too short to contain {count} items of {cls}")
+
+        if cls._format is None:
+            values = [None] * count
+        else:
+            values = struct.unpack_from(f"<{count}{cls._format}", data)
 
-        return cls(struct.unpack("<d", double_bytes)[0]), data[cls._size :]
+        return [
+            cls(value)
+            if value is not None and cls._is_native_deserialized(value)
+            else cls._deserialize_converted(data[i * cls._size : (i + 1) * cls._size])
+            for i, value in enumerate(values)
+        ], data[size:]
 
 
 class Half(BaseFloat, exponent_bits=5, fraction_bits=10):
@@ -522,6 +733,76 @@ class LongOctetString(LVBytes):
     _prefix_length = 2
 
 
+def _item_format(item_type: type) -> str | None:
+    """
+    Returns the `struct` format character of list items that are plain fixed-width
+    integers or floats, allowing the entire list to be packed and unpacked at once.
+    """
+
+    if not isinstance(item_type, type):
+        return None
+
+    if issubclass(item_type, BaseFloat):
+        if (
+            item_type.serialize is BaseFloat.serialize
+            and item_type.deserialize.__func__ is BaseFloat.deserialize.__func__
+        ):
+            return item_type._format
+
+        return None
+
+    if not (
+        issubclass(item_type, FixedIntType)
+        and item_type._min_value is not None
+        and item_type.serialize is FixedIntType.serialize
+        and item_type.deserialize.__func__ is FixedIntType.deserialize.__func__
+    ):
+        return None
+
+    fmt = {8: "b", 16: "h", 32: "i", 64: "q"}.get(item_type._bits)
+
+    if fmt is None or item_type._signed:
+        return fmt
+
+    return fmt.upper()
+
+
+def _serialize_items(lst: list) -> bytes:
+    if lst._item_format is not None:
+        if issubclass(lst._item_type, BaseFloat):
+            return lst._item_type.serialize_array(lst)
+
+        try:
+            return struct.pack(f"<{len(lst)}{lst._item_format}", *lst)
+        except struct.error:
+            pass  # Let the item type convert and validate anything unusual
+
+    return b"".join([lst._item_type(i).serialize() for i in lst])
+
+
+def _deserialize_items(cls: type, data: bytes, count: int) -> tuple[list, bytes]:
+    item_type = cls._item_type
+
+    if issubclass(item_type, BaseFloat):
+        items, data = item_type.deserialize_array(data, count)
+        return cls(items), data
+
+    size = count * item_type._size
+
+    if len(data) < size:
+        raise ValueError(f"Data is too short to contain {count} items of {item_type}")
+
+    values = struct.unpack_from(f"<{count}{cls._item_format}", data)
+
+    if item_type._cache is not None and not item_type._signed:
+        return cls(map(item_type._cache.__getitem__, values)), data[size:]
+    elif item_type.__new__ is FixedIntType.__new__:
+        # Unpacked values are always within bounds and do not need to be checked again
+        return cls([int.__new__(item_type, v) for v in values]), data[size:]
+
+    return cls(map(item_type, values)), data[size:]
+
+
 class KwargTypeMeta(type):
     # So things like `LVList[NWK, t.uint8_t]` are singletons
     _anonymous_classes = {}  # type:ignore[var-annotated]
@@ -541,7 +822,12 @@ class KwargTypeMeta(type):
         if "__init_subclass__" not in namespaces:
             namespaces["__init_subclass__"] = __init_subclass__
 
-        return type.__new__(metaclass, name, bases, namespaces, **kwargs)
+        cls = type.__new__(metaclass, name, bases, namespaces, **kwargs)
+
+        # Items of fixed-width integer types are packed in bulk
+        cls._item_format = _item_format(getattr(cls, "_item_type", None))
+
+        return cls
 
     def __getitem__(cls, key):
         # Make sure Foo[a] is the same as Foo[a,]
@@ -616,12 +902,21 @@ class List(list, metaclass=KwargTypeMeta):
 
     def serialize(self) -> bytes:
         assert self._item_type is not None
-        return b"".join([self._item_type(i).serialize() for i in self])
+        return _serialize_items(self)
 
     @classmethod
+    @zero_copy_deserialize
     def deserialize(cls, data: bytes) -> tuple[LVList, bytes]:
         assert cls._item_type is not None
 
+        if cls._item_format is not None:
+            count, remainder = divmod(len(data), cls._item_type._size)
+
+            if remainder:
+                raise ValueError(f"Data is too short to contain {cls._item_type}")
+
+            return _deserialize_items(cls, data, count)
+
         lst = cls()
         while data:
             item, data = cls._item_type.deserialize(data)
@@ -638,14 +933,17 @@ class LVList(list, metaclass=KwargTypeMeta):
 
     def serialize(self) -> bytes:
         assert self._item_type is not None
-        return self._length_type(len(self)).serialize() + b"".join(
-            [self._item_type(i).serialize() for i in self]
-        )
+        return self._length_type(len(self)).serialize() + _serialize_items(self)
 
     @classmethod
+    @zero_copy_deserialize
     def deserialize(cls, data: bytes) -> tuple[LVList, bytes]:
         assert cls._item_type is not None
         length, data = cls._length_type.deserialize(data)
+
+        if cls._item_format is not None:
+            return _deserialize_items(cls, data, length)
+
         r = cls()
         for i in range(length):
             item, data = cls._item_type.deserialize(data)
@@ -667,11 +965,16 @@ class FixedList(list, metaclass=KwargTypeMeta):
                 f"Invalid length for {self!r}: expected {self._length}, got {len(self)}"
             )
 
-        return b"".join([self._item_type(i).serialize() for i in self])
+        return _serialize_items(self)
 
     @classmethod
+    @zero_copy_deserialize
     def deserialize(cls, data: bytes) -> tuple[FixedList, bytes]:
         assert cls._item_type is not None
+
+        if cls._item_format is not None:
+            return _deserialize_items(cls, data, cls._length)
+
         r = cls()
         for i in range(cls._length):
             item, data = cls._item_type.deserialize(data)
@@ -699,7 +1002,7 @@ class CharacterString(str):
         if len(data) < cls._prefix_length + length:
             raise ValueError("Data is too short")
 
-        raw = data[cls._prefix_length : cls._prefix_length + length]
+        raw = bytes(data[cls._prefix_length : cls._prefix_length + length])
         r = cls(raw.split(b"\x00")[0].decode("utf8", errors="replace"))
         r.raw = raw
         return r, data[cls._prefix_length + length :]
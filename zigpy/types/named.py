@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from typing import Iterable
+import weakref
 
 from . import basic
 from .struct import Struct
@@ -17,19 +18,103 @@ class BroadcastAddress(basic.enum16):
     RESERVED_FFF8 = 0xFFF8
 
 
-class EUI64(basic.FixedList, item_type=basic.uint8_t, length=8):
-    # EUI 64-bit ID (an IEEE address).
-    def __repr__(self):
-        return ":".join("%02x" % i for i in self[::-1])
+class EUI64:
+    """
+    EUI 64-bit ID (an IEEE address), stored as its eight little endian bytes.
+
+    Instances are interned: constructing an address that is still referenced elsewhere
+    returns the existing object, so the references held by devices, groups and the
+    database share one instance and dictionary lookups usually match on identity.
+
+    Addresses still behave like the list of `uint8_t` they used to be: indexing returns
+    a `uint8_t`, slicing returns a list and they compare equal to lists and tuples of
+    the same bytes, but not to `bytes`. Unlike lists, they are immutable.
+    """
+
+    __slots__ = ("_bytes", "_hash", "__weakref__")
+
+    _length = 8
+
+    # Canonical instances, keyed by class and address. Unused ones drop out by themselves.
+    _interned: weakref.WeakValueDictionary[
+        tuple[type, bytes], EUI64
+    ] = weakref.WeakValueDictionary()
+
+    _bytes: bytes
+    _hash: int
+
+    def __new__(cls, value: Iterable[int] = b""):
+        if type(value) is cls:
+            return value
+
+        raw = bytes(value)
+        key = (cls, raw)
+        instance = cls._interned.get(key)
+
+        if instance is None:
+            instance = super().__new__(cls)
+            instance._bytes = raw
+            instance._hash = hash(raw)
+            cls._interned[key] = instance
+
+        return instance
+
+    def __repr__(self) -> str:
+        return ":".join("%02x" % i for i in self._bytes[::-1])
+
+    __str__ = __repr__
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other):
+        if isinstance(other, EUI64):
+            return self._bytes == other._bytes
+
+        # Addresses used to be lists of bytes, keep comparing equal to them
+        if isinstance(other, (list, tuple)):
+            return list(self._bytes) == list(other)
+
+        return NotImplemented
+
+    def __len__(self) -> int:
+        return len(self._bytes)
+
+    def __iter__(self):
+        return iter(basic.uint8_t.from_byte_array(self._bytes))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return basic.uint8_t.from_byte_array(self._bytes[index])
+
+        return basic.uint8_t(self._bytes[index])
+
+    def __bytes__(self) -> bytes:
+        return self._bytes
+
+    def __reduce__(self):
+        return type(self), (self._bytes,)
+
+    def serialize(self) -> bytes:
+        if len(self._bytes) != self._length:
+            raise ValueError(
+                f"Invalid length for {self!r}: expected {self._length}, got {len(self)}"
+            )
+
+        return self._bytes
+
+    @classmethod
+    def deserialize(cls, data: bytes) -> tuple[EUI64, bytes]:
+        if len(data) < cls._length:
+            raise ValueError(f"Data is too short to contain {cls._length} bytes")
 
-    def __hash__(self):
-        return hash(repr(self))
+        return cls(data[: cls._length]), data[cls._length :]
 
     @classmethod
     def convert(cls, ieee: str):
         if ieee is None:
             return None
-        ieee = [basic.uint8_t(p, base=16) for p in ieee.split(":")[::-1]]
+        ieee = bytes(int(p, base=16) for p in ieee.split(":")[::-1])
         assert len(ieee) == cls._length
         return cls(ieee)
 
@@ -40,9 +125,9 @@ class KeyData(basic.FixedList, item_type=basic.uint8_t, length=16):
 
     @classmethod
     def convert(cls, key: str) -> KeyData:
-        key = [basic.uint8_t(p, base=16) for p in key.split(":")]
+        key = bytes(int(p, base=16) for p in key.split(":"))
         assert len(key) == cls._length
-        return cls(key)
+        return cls(basic.uint8_t.from_byte_array(key))
 
 
 class Bool(basic.enum8):
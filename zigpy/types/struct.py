@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import dataclasses
-import inspect
+import struct
 import typing
 
 import zigpy.types as t
@@ -46,14 +46,401 @@ class StructField:
 
 _STRUCT = typing.TypeVar("_STRUCT", bound="Struct")
 
+# `struct` format characters for byte-aligned integers, keyed by (size, signed)
+_INT_FORMATS = {
+    (1, False): "B",
+    (2, False): "H",
+    (4, False): "I",
+    (8, False): "Q",
+    (1, True): "b",
+    (2, True): "h",
+    (4, True): "i",
+    (8, True): "q",
+}
+
+
+def _has_stock_int_codec(field_type: type) -> bool:
+    """
+    Checks if an integer field type uses the unmodified `FixedIntType` codec and can
+    therefore be packed directly.
+    """
+
+    return (
+        issubclass(field_type, t.FixedIntType)
+        and field_type.serialize is t.FixedIntType.serialize
+        and field_type.deserialize.__func__ is t.FixedIntType.deserialize.__func__
+        and field_type.bits is t.FixedIntType.bits
+        and field_type.from_bits.__func__ is t.FixedIntType.from_bits.__func__
+    )
+
+
+def _has_stock_float_codec(field_type: type) -> bool:
+    """
+    Checks if a float field type uses the unmodified `BaseFloat` codec and can therefore
+    be packed in bulk.
+    """
+
+    return (
+        isinstance(field_type, type)
+        and issubclass(field_type, t.BaseFloat)
+        and field_type._format is not None
+        and field_type.serialize is t.BaseFloat.serialize
+        and field_type.deserialize.__func__ is t.BaseFloat.deserialize.__func__
+    )
+
+
+@dataclasses.dataclass(frozen=True)
+class _IntRun:
+    """Consecutive byte-aligned integer fields packed with a single `struct` call."""
+
+    fields: tuple[StructField, ...]
+    types: tuple[type[t.FixedIntType], ...]
+    format: struct.Struct
+
+
+@dataclasses.dataclass(frozen=True)
+class _BitRun:
+    """Consecutive bitfields that together start and end on a byte boundary."""
+
+    fields: tuple[StructField, ...]
+    types: tuple[type, ...]
+    size: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _FloatRun:
+    """Consecutive floats of the same type, packed in bulk."""
+
+    fields: tuple[StructField, ...]
+    type: type[t.BaseFloat]
+
+
+@dataclasses.dataclass(frozen=True)
+class _FieldStep:
+    """Any other field, serialized by its own type."""
+
+    field: StructField
+    type: type
+
+
+class _StructCodec:
+    """
+    Serializer and deserializer specialized for a single `Struct` subclass. The field
+    layout is analyzed once, when the class is created, instead of on every frame.
+    """
+
+    def __init__(self, fields: list[StructField], steps: list) -> None:
+        self.fields = tuple(fields)
+        self.steps = tuple(steps)
+
+    @classmethod
+    def compile(cls, fields: list[StructField]) -> _StructCodec | None:
+        """
+        Compiles a codec for the given fields. Returns `None` if the layout depends on
+        field values, in which case the generic implementation must be used.
+        """
+
+        steps: list = []
+        bitfields: list[StructField] = []
+        bit_offset = 0
+
+        for field in fields:
+            ftype = field.type
+            assert ftype is not None
+
+            int_type = (
+                ftype
+                if isinstance(ftype, type) and issubclass(ftype, t.FixedIntType)
+                else None
+            )
+
+            if int_type is not None and not (
+                int_type._bits % 8 == 0 and bit_offset % 8 == 0
+            ):
+                # Bitfield segments cannot be laid out in advance if their members can
+                # disappear and they must be packable with plain integer arithmetic
+                if (
+                    field.requires is not None
+                    or field.optional
+                    or not _has_stock_int_codec(int_type)
+                ):
+                    return None
+
+                bitfields.append(field)
+                bit_offset += int_type._bits
+
+                if bit_offset % 8 == 0:
+                    steps.append(
+                        _BitRun(
+                            fields=tuple(bitfields),
+                            types=tuple(f.type for f in bitfields),
+                            size=bit_offset // 8,
+                        )
+                    )
+                    bitfields = []
+                    bit_offset = 0
+
+                continue
+            elif bitfields:
+                # Invalid segment, let the generic implementation raise the error
+                return None
+
+            fmt = (
+                _INT_FORMATS.get((int_type._bits // 8, int_type._signed))
+                if int_type is not None and _has_stock_int_codec(int_type)
+                else None
+            )
+
+            if (
+                _has_stock_float_codec(ftype)
+                and field.requires is None
+                and not field.optional
+            ):
+                if (
+                    steps
+                    and isinstance(steps[-1], _FloatRun)
+                    and steps[-1].type is ftype
+                ):
+                    prev = steps.pop()
+                    steps.append(_FloatRun(fields=prev.fields + (field,), type=ftype))
+                else:
+                    steps.append(_FloatRun(fields=(field,), type=ftype))
+            elif fmt is None or field.requires is not None or field.optional:
+                steps.append(_FieldStep(field=field, type=ftype))
+            elif steps and isinstance(steps[-1], _IntRun):
+                prev = steps.pop()
+                steps.append(
+                    _IntRun(
+                        fields=prev.fields + (field,),
+                        types=prev.types + (int_type,),
+                        format=struct.Struct(prev.format.format + fmt),
+                    )
+                )
+            else:
+                steps.append(
+                    _IntRun(
+                        fields=(field,),
+                        types=(int_type,),
+                        format=struct.Struct("<" + fmt),
+                    )
+                )
+
+        if bitfields:
+            return None
+
+        return cls(fields, steps)
+
+    def serialize(self, obj: Struct) -> bytes:
+        values = {}
+
+        # Mirrors `assigned_fields(strict=True)`: requirements are checked up front
+        for field in self.fields:
+            value = getattr(obj, field.name)
+
+            if field.requires is not None and not field.requires(obj):
+                continue
+
+            if value is None and not field.optional:
+                raise ValueError(f"Value for field {field.name!r} is required")
+
+            values[field.name] = value
+
+        chunks = []
+
+        for step in self.steps:
+            if type(step) is _IntRun:
+                chunks.append(
+                    step.format.pack(
+                        *[
+                            f._convert_type(values[f.name])
+                            if type(values[f.name]) is not f.type
+                            else values[f.name]
+                            for f in step.fields
+                        ]
+                    )
+                )
+            elif type(step) is _BitRun:
+                n, _ = t.pack_bitfields(
+                    [
+                        f._convert_type(values[f.name])
+                        if type(values[f.name]) is not f.type
+                        else values[f.name]
+                        for f in step.fields
+                    ]
+                )
+                chunks.append(n.to_bytes(step.size, "big"))
+            elif type(step) is _FloatRun:
+                chunks.append(
+                    step.type.serialize_array([values[f.name] for f in step.fields])
+                )
+            else:
+                field = step.field
+
+                if field.name not in values:
+                    continue
+
+                value = values[field.name]
+
+                if value is None and field.optional:
+                    continue
+
+                chunks.append(field._convert_type(value).serialize())
+
+        return b"".join(chunks)
+
+    def deserialize(self, cls: type[_STRUCT], data: bytes) -> tuple[_STRUCT, bytes]:
+        instance = cls()
+
+        for step in self.steps:
+            if type(step) is _IntRun:
+                if len(data) < step.format.size:
+                    # Let the field types raise their usual errors
+                    for f, int_type in zip(step.fields, step.types):
+                        value, data = int_type.deserialize(data)
+                        setattr(instance, f.name, value)
+
+                    continue  # pragma: no cover
+
+                for f, int_type, value in zip(
+                    step.fields, step.types, step.format.unpack_from(data)
+                ):
+                    setattr(instance, f.name, int_type(value))
+
+                data = data[step.format.size :]
+            elif type(step) is _BitRun:
+                if len(data) < step.size:
+                    raise ValueError(
+                        f"Data is too short to contain {list(step.fields)}"
+                    )
+
+                values = t.unpack_bitfields(
+                    int.from_bytes(data[: step.size], "big"), step.types
+                )
+                data = data[step.size :]
+
+                for f, value in zip(step.fields, values):
+                    setattr(instance, f.name, value)
+            elif type(step) is _FloatRun:
+                values, data = step.type.deserialize_array(data, len(step.fields))
+
+                for f, value in zip(step.fields, values):
+                    setattr(instance, f.name, value)
+            else:
+                field = step.field
+
+                if field.requires is not None and not field.requires(instance):
+                    continue
+                elif not data and field.optional:
+                    continue
+
+                value, data = step.type.deserialize(data)
+                setattr(instance, field.name, value)
+
+        return instance, data
+
+
+def _unique_name(name: str, taken: typing.Collection[str]) -> str:
+    while name in taken:
+        name = f"_{name}"
+
+    return name
+
+
+def _compile_initializer(fields: list[StructField]) -> typing.Callable[..., None]:
+    """
+    Generates a function with the signature `(instance, field1=None, field2=None, ...)`
+    that converts and assigns every field, avoiding `inspect.Signature.bind` and
+    per-field lookups when constructing instances.
+    """
+
+    names = [f.name for f in fields]
+    instance = _unique_name("self", names)
+    # Fields can shadow the builtin, e.g. a field named `type`
+    builtin_type = _unique_name("_builtin_type", names)
+    namespace: dict[str, typing.Any] = {builtin_type: type}
+    lines = []
+
+    for index, field in enumerate(fields):
+        type_name = _unique_name(f"_type_{index}", names)
+        convert_name = _unique_name(f"_convert_{index}", names)
+        namespace[type_name] = field.type
+        namespace[convert_name] = field._convert_type
+
+        lines.append(
+            f"    {instance}.{field.name} = ({field.name}"
+            f" if {field.name} is None"
+            f" or {builtin_type}({field.name}) is {type_name}"
+            f" else {convert_name}({field.name}))"
+        )
+
+    params = "".join(f", {name}=None" for name in names)
+    source = f"def __init_fields__({instance}{params}):\n" + (
+        "\n".join(lines) or "    pass"
+    )
+
+    exec(source, namespace)  # noqa: S102
+
+    return namespace["__init_fields__"]
+
+
+class StructMeta(type):
+    """
+    Gives every `Struct` subclass `__slots__` for its annotated fields. `StructField`
+    definitions would conflict with the slots so they are moved into
+    `_declared_fields`.
+    """
+
+    def __new__(metaclass, name, bases, namespace, **kwargs):
+        # Variable-size builtins like `int` and `tuple` cannot have non-empty slots
+        if "__slots__" not in namespace and not any(b.__itemsize__ for b in bases):
+            inherited_slots = {
+                slot
+                for base in bases
+                for c in base.__mro__
+                for slot in vars(c).get("__slots__", ())
+            }
+            annotated = namespace.get("__annotations__", {})
+            declared_fields = {
+                attr: namespace.pop(attr)
+                for attr, value in list(namespace.items())
+                if isinstance(value, StructField)
+                and (attr in annotated or attr in inherited_slots)
+            }
+            slots = tuple(
+                attr
+                for attr in annotated
+                if attr not in namespace and attr not in inherited_slots
+            )
+
+            for attr in slots:
+                declared_fields.setdefault(attr, StructField())
+
+            namespace["__slots__"] = slots
+            namespace["_declared_fields"] = declared_fields
+
+        return super().__new__(metaclass, name, bases, namespace, **kwargs)
+
+
+class Struct(metaclass=StructMeta):
+    _codec = None
 
-class Struct:
     @classmethod
     def _real_cls(cls) -> type:
         # The "Optional" subclass is dynamically created and breaks types.
         # We have to use a little introspection to find our real class.
         return next(c for c in cls.__mro__ if c.__name__ != "Optional")
 
+    @classmethod
+    def _declared_field(cls, name: str) -> typing.Any:
+        # Slotted fields have their definitions moved out of the class namespace
+        for c in cls.__mro__:
+            if name in vars(c).get("_declared_fields", {}):
+                return vars(c)["_declared_fields"][name]
+            elif name in vars(c):
+                return vars(c)[name]
+
+        return StructField()
+
     def __init_subclass__(cls):
         super().__init_subclass__()
 
@@ -67,6 +454,10 @@ class Struct:
         # We generate fields up here to fail early and cache it
         cls.fields = cls._real_cls()._get_fields()
 
+        # Specialize construction and serialization for this exact field layout
+        cls._init_fields = _compile_initializer(cls.fields)
+        cls._codec = _StructCodec.compile(cls.fields)
+
         # Check to see if the Struct is also an integer
         cls._int_type = next(
             (
@@ -91,28 +482,10 @@ class Struct:
             # Integer constructor
             return cls.deserialize(cls._int_type(args[0]).serialize())[0]
 
-        # Pretend our signature is `__new__(cls, p1: t1, p2: t2, ...)`
-        signature = inspect.Signature(
-            parameters=[
-                inspect.Parameter(
-                    name=f.name,
-                    kind=inspect.Parameter.POSITIONAL_OR_KEYWORD,
-                    default=None,
-                    annotation=f.type,
-                )
-                for f in cls.fields
-            ]
-        )
-
-        bound = signature.bind(*args, **kwargs)
-        bound.apply_defaults()
-
         instance = super().__new__(cls)
 
-        # Set each attributes on the instance
-        for name, value in bound.arguments.items():
-            field = getattr(cls.fields, name)
-            setattr(instance, name, field._convert_type(value))
+        # Our signature is effectively `__new__(cls, p1: t1 = None, p2: t2 = None, ...)`
+        cls._init_fields(instance, *args, **kwargs)
 
         return instance
 
@@ -137,7 +510,7 @@ class Struct:
         #      order them with respect to annotation-only fields.
         #      Every struct field must be annotated.
         for name, annotation in annotations.items():
-            field = getattr(cls, name, StructField())
+            field = cls._declared_field(name)
 
             if not isinstance(field, StructField):
                 continue
@@ -191,6 +564,9 @@ class Struct:
         return tuple(getattr(self, f.name) for f in self.fields)
 
     def serialize(self) -> bytes:
+        if self._codec is not None:
+            return self._codec.serialize(self)
+
         chunks = []
 
         bit_offset = 0
@@ -233,7 +609,11 @@ class Struct:
         return b"".join(chunks)
 
     @classmethod
+    @t.zero_copy_deserialize
     def deserialize(cls: type[_STRUCT], data: bytes) -> tuple[_STRUCT, bytes]:
+        if cls._codec is not None:
+            return cls._codec.deserialize(cls, data)
+
         instance = cls()
 
         bit_length = 0
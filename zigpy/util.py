@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import abc
 import asyncio
+import collections
 import functools
 import inspect
 import logging
@@ -73,13 +74,29 @@ class ListenableMixin:
         return results
 
 
+_LOG_STACKLEVEL = sys.version_info >= (3, 8)
+
+
 class LocalLogMixin:
+    # Logger that `log` writes to. Messages it would discard are dropped before `log`
+    # builds its prefixed message and arguments.
+    logger: logging.Logger | None = None
+
     @abc.abstractmethod
     def log(self, lvl: int, msg: str, *args, **kwargs):  # pragma: no cover
         pass
 
+    def is_enabled_for(self, lvl: int) -> bool:
+        """Check if a message of this level would be logged."""
+        return self.logger is None or self.logger.isEnabledFor(lvl)
+
     def _log(self, lvl: int, msg: str, *args, **kwargs):
-        if sys.version_info >= (3, 8):
+        logger = self.logger
+
+        if logger is not None and not logger.isEnabledFor(lvl):
+            return None
+
+        if _LOG_STACKLEVEL:
             # We have to exclude log, _log, and info
             return self.log(lvl, msg, *args, stacklevel=4, **kwargs)
 
@@ -255,6 +272,26 @@ class Request:
 
 
 class Requests(dict):
+    def __init__(self, *, in_flight: collections.Counter | None = None) -> None:
+        super().__init__()
+        # Sequence numbers in flight, shared by the requests of every device
+        self._in_flight = in_flight
+
+    def __setitem__(self, sequence: t.uint8_t, request: Request) -> None:
+        super().__setitem__(sequence, request)
+
+        if self._in_flight is not None:
+            self._in_flight[sequence] += 1
+
+    def pop(self, sequence: t.uint8_t, *args) -> Request:
+        if self._in_flight is not None and sequence in self:
+            self._in_flight[sequence] -= 1
+
+            if not self._in_flight[sequence]:
+                del self._in_flight[sequence]
+
+        return super().pop(sequence, *args)
+
     def new(self, sequence: t.uint8_t) -> Request:
         """Wrap new request into a context manager."""
         try:
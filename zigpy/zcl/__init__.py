@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import enum
 import functools
 import logging
-from typing import Any, Sequence, Union
+import time
+from typing import Any, Callable, Coroutine, NamedTuple, Sequence, Union
 import warnings
 
 from zigpy import util
@@ -38,6 +40,39 @@ def convert_list_schema(
     return temp.with_compiled_schema().schema
 
 
+# Frame control, manufacturer code, TSN and command ID
+MAX_HEADER_SIZE = 5
+
+# Frames of a split request that are sent at the same time
+MAX_CONCURRENT_FRAMES = 2
+
+
+def split_records(records: Sequence, max_size: int | None) -> list[list]:
+    """
+    Split records into the fewest in-order groups whose serialized size does not
+    exceed `max_size`. Records larger than `max_size` are put in a group of their own.
+    Without a `max_size`, all records are put in a single group.
+    """
+
+    if max_size is None:
+        return [list(records)] if records else []
+
+    groups: list[list] = []
+    size = 0
+
+    for record in records:
+        record_size = len(record.serialize())
+
+        if groups and size + record_size <= max_size:
+            groups[-1].append(record)
+            size += record_size
+        else:
+            groups.append([record])
+            size = record_size
+
+    return groups
+
+
 def future_exception(e):
     future = asyncio.Future()
     future.set_exception(e)
@@ -45,6 +80,210 @@ def future_exception(e):
     return future
 
 
+@functools.lru_cache(maxsize=1024)
+def _header_template(
+    general: bool,
+    command_id: int,
+    manufacturer: int | None,
+    is_reply: bool,
+) -> tuple[bytes, bytes]:
+    """Serialized ZCL header fields preceding and following the TSN."""
+
+    if manufacturer is foundation.ZCLHeader.NO_MANUFACTURER_ID:
+        manufacturer = None
+
+    if general:
+        hdr = foundation.ZCLHeader.general(0, command_id, manufacturer, is_reply)
+    else:
+        hdr = foundation.ZCLHeader.cluster(0, command_id, manufacturer, is_reply)
+
+    data = hdr.serialize()
+
+    # The TSN is the second to last byte of the header
+    return data[:-2], data[-1:]
+
+
+def encode_frame(
+    general: bool,
+    command_id: int,
+    tsn: int,
+    payload: bytes,
+    *,
+    manufacturer: int | None = None,
+    is_reply: bool = False,
+) -> bytes:
+    """Serialize a ZCL header and its payload into a single buffer."""
+
+    prefix, suffix = _header_template(general, command_id, manufacturer, is_reply)
+
+    return b"".join([prefix, t.uint8_t(tsn).serialize(), suffix, payload])
+
+
+class _CommandProxy:
+    """Exposes commands as methods of cluster instances."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Cluster | None, owner: type[Cluster]) -> Any:
+        if instance is None:
+            return self
+
+        # Subclasses may have removed the command or changed its ID
+        if self.name in owner._client_commands_idx:
+            proxy = _BoundCommand(
+                instance, "client_command", owner._client_commands_idx[self.name]
+            )
+        elif self.name in owner._server_commands_idx:
+            proxy = _BoundCommand(
+                instance, "command", owner._server_commands_idx[self.name]
+            )
+        else:
+            raise AttributeError(f"No such command name: {self.name}")
+
+        # Cache the proxy on the instance so later lookups don't allocate
+        instance.__dict__[self.name] = proxy
+
+        return proxy
+
+
+class _BoundCommand:
+    __slots__ = ("_cluster", "_method", "_command_id")
+
+    def __init__(self, cluster: Cluster, method: str, command_id: int) -> None:
+        self._cluster = cluster
+        self._method = method
+        self._command_id = command_id
+
+    def __call__(self, *args, **kwargs):
+        # Resolved on every call so that patching `command` keeps working
+        method = getattr(self._cluster, self._method)
+        return method(self._command_id, *args, **kwargs)
+
+    def __repr__(self) -> str:
+        return (
+            f"<{type(self).__name__} {self._method}(0x{self._command_id:02X})"
+            f" of {self._cluster!r}>"
+        )
+
+
+# Marks attributes that had no cached value before a coalesced update
+_NO_VALUE = object()
+
+
+# Class attributes holding command definitions, whose schemas are compiled lazily
+_LAZY_COMMAND_ATTRIBUTES = (
+    "server_commands",
+    "client_commands",
+    "commands_by_name",
+)
+
+
+class _UncompiledCommands:
+    """
+    Placeholder for a command attribute of a cluster class whose command schemas have
+    not been compiled yet. Accessing it compiles them and restores the attribute.
+    """
+
+    def __init__(self, cluster: type[Cluster], name: str, value: Any) -> None:
+        self.cluster = cluster
+        self.name = name
+        self.value = value
+
+    def __get__(self, instance: Cluster | None, owner: type[Cluster]) -> Any:
+        self.cluster._compile_schemas()
+
+        return getattr(owner, self.name)
+
+
+class _CommandDefs(dict):
+    """
+    Command definitions of a cluster class. Changing any of them invalidates the
+    dispatch tables of every cluster class, which are rebuilt when next used.
+    """
+
+    # Incremented whenever any command definitions change
+    generation = 0
+
+    def __setitem__(self, key, value) -> None:
+        super().__setitem__(key, value)
+        _CommandDefs.generation += 1
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        _CommandDefs.generation += 1
+
+    def update(self, *args, **kwargs) -> None:
+        super().update(*args, **kwargs)
+        _CommandDefs.generation += 1
+
+    def setdefault(self, key, default=None):
+        _CommandDefs.generation += 1
+        return super().setdefault(key, default)
+
+    def pop(self, *args):
+        _CommandDefs.generation += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        _CommandDefs.generation += 1
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        _CommandDefs.generation += 1
+
+
+class _DispatchEntry(NamedTuple):
+    """Decoder and handler of a received command."""
+
+    command: foundation.ZCLCommandDef
+    handler: str
+
+
+# General commands are valid in both directions and every non-cluster frame type
+_GENERAL_DISPATCH = {
+    (frame_type, is_reply, command_id): _DispatchEntry(
+        command, "_handle_general_command"
+    )
+    for frame_type in foundation.FrameType
+    if frame_type != foundation.FrameType.CLUSTER_COMMAND
+    for is_reply in (0, 1)
+    for command_id, command in foundation.GENERAL_COMMANDS.items()
+}
+
+
+class _DispatchTable(dict):
+    """
+    Received commands of a cluster class, keyed by the frame type, direction and
+    command ID of their header.
+    """
+
+    def __init__(self, cluster: type[Cluster]) -> None:
+        super().__init__(_GENERAL_DISPATCH)
+
+        # Reading the commands compiles their schemas, which changes the generation
+        self.server_commands = cluster.server_commands
+        self.client_commands = cluster.client_commands
+        self.generation = _CommandDefs.generation
+
+        for is_reply, commands in [
+            (0, self.server_commands),
+            (1, self.client_commands),
+        ]:
+            for command_id, command in commands.items():
+                self[
+                    foundation.FrameType.CLUSTER_COMMAND, is_reply, command_id
+                ] = _DispatchEntry(command, "_handle_cluster_command")
+
+    def is_current(self, cluster: type[Cluster]) -> bool:
+        return (
+            self.generation == _CommandDefs.generation
+            and self.server_commands is cluster.server_commands
+            and self.client_commands is cluster.client_commands
+        )
+
+
 class ClusterType(enum.IntEnum):
     Server = 0
     Client = 1
@@ -53,6 +292,8 @@ class ClusterType(enum.IntEnum):
 class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
     """A cluster on an endpoint"""
 
+    logger = LOGGER
+
     # Custom clusters for quirks subclass Cluster but should not be stored in any global
     # registries, since they're device-specific and collide with existing clusters.
     _skip_registry: bool = False
@@ -67,10 +308,21 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
     # to remove the need to create 1024 "ManufacturerSpecificCluster" instances.
     cluster_id_range: tuple[t.uint16_t, t.uint16_t] = None
 
+    # Attribute updates within this many seconds of the first pending one are emitted
+    # together as a single `attributes_updated` event. `None` disables coalescing.
+    attribute_coalescing_window: float | None = None
+
+    # Drop coalesced updates whose value is the same as before the window started
+    suppress_unchanged_attributes: bool = False
+
+    # Attribute assignments within this many seconds of the first pending one are
+    # written with a single `Write_Attributes` request. `None` writes each immediately.
+    write_batching_window: float | None = None
+
     # Clusters contain attributes and both client and server commands
     attributes: dict[int, foundation.ZCLAttributeDef] = {}
-    client_commands: dict[int, foundation.ZCLCommandDef] = {}
-    server_commands: dict[int, foundation.ZCLCommandDef] = {}
+    client_commands: dict[int, foundation.ZCLCommandDef] = _CommandDefs()
+    server_commands: dict[int, foundation.ZCLCommandDef] = _CommandDefs()
 
     # Internal caches and indices
     _registry: dict = {}
@@ -82,6 +334,13 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
     attributes_by_name: dict[str, foundation.ZCLAttributeDef] = {}
     commands_by_name: dict[str, foundation.ZCLCommandDef] = {}
 
+    # `_registry_range` entries as sorted `(start, end, cluster)` tuples and their starts
+    _registry_range_index: list[tuple[int, int, type[Cluster]]] = []
+    _registry_range_starts: list[int] = []
+
+    # Received commands of this class, built by `_get_dispatch_table` when first used
+    _dispatch_table: _DispatchTable | None = None
+
     def __init_subclass__(cls):
         # Fail on deprecated attribute presence
         for a in ("attributes", "client_commands", "server_commands"):
@@ -98,6 +357,11 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         if cls.cluster_id is not None:
             cls.cluster_id = t.ClusterId(cls.cluster_id)
 
+        # Track changes to the commands defined by this class, to keep dispatching current
+        for name in ("server_commands", "client_commands"):
+            if name in vars(cls) and not isinstance(vars(cls)[name], _CommandDefs):
+                setattr(cls, name, _CommandDefs(vars(cls)[name]))
+
         # Clear the caches and lookup tables. Their contents should correspond exactly
         # to what's in their respective command/attribute dictionaries.
         cls.attributes_by_name = {}
@@ -130,7 +394,7 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
 
                 index[command.name] = command.id
 
-                command = command.with_compiled_schema()
+                # Schemas are compiled by `_compile_schemas` when the class is used
                 commands[command.id] = command
                 cls.commands_by_name[command.name] = command
 
@@ -155,6 +419,13 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
             cls.attributes[attr.id] = attr
             cls.attributes_by_name[attr.name] = attr
 
+        for name in cls.commands_by_name:
+            cls._add_command_proxy(name)
+
+        # Defer compiling command schemas into structs until the commands are used
+        for name in _LAZY_COMMAND_ATTRIBUTES:
+            setattr(cls, name, _UncompiledCommands(cls, name, getattr(cls, name)))
+
         if cls._skip_registry:
             return
 
@@ -163,16 +434,83 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
 
         if cls.cluster_id_range is not None:
             cls._registry_range[cls.cluster_id_range] = cls
+            Cluster._index_registry_range()
+
+    @classmethod
+    def _compile_schemas(cls) -> None:
+        """Compile the command schemas of this class, if they aren't yet."""
+        if not isinstance(vars(cls).get("commands_by_name"), _UncompiledCommands):
+            return
+
+        # Restore the plain attributes first so that nothing below recurses
+        for name in _LAZY_COMMAND_ATTRIBUTES:
+            value = vars(cls)[name]
+
+            if isinstance(value, _UncompiledCommands):
+                setattr(cls, name, value.value)
+
+        for commands in (cls.server_commands, cls.client_commands):
+            for command_id, command in list(commands.items()):
+                command = command.with_compiled_schema()
+                commands[command_id] = command
+                cls.commands_by_name[command.name] = command
+
+    @classmethod
+    def _get_dispatch_table(cls) -> _DispatchTable:
+        """Dispatch table of this class, rebuilt if its commands have changed."""
+        table = vars(cls).get("_dispatch_table")
+
+        if table is None or not table.is_current(cls):
+            table = cls._dispatch_table = _DispatchTable(cls)
+
+        return table
+
+    @classmethod
+    def _index_registry_range(cls) -> None:
+        # Sorted by start, ranges of manufacturer-specific clusters should not overlap
+        cls._registry_range_index = sorted(
+            (start, end, cluster)
+            for (start, end), cluster in cls._registry_range.items()
+        )
+        cls._registry_range_starts = [
+            start for start, _, _ in cls._registry_range_index
+        ]
+
+    @classmethod
+    def _add_command_proxy(cls, name: str) -> None:
+        # Never shadow methods. Inherited proxies look up the command by name.
+        if any(name in vars(base) for base in cls.__mro__):
+            return
+
+        setattr(cls, name, _CommandProxy(name))
 
     def __init__(self, endpoint: EndpointType, is_server: bool = True):
+        type(self)._compile_schemas()
+
         self._endpoint: EndpointType = endpoint
         self._attr_cache: dict[int, Any] = {}
+        # Unix timestamp of the last update of each cached attribute
+        self._attr_last_updated: dict[int, float] = {}
         self.unsupported_attributes: set[int | str] = set()
         self._listeners = {}
         self._type: ClusterType = (
             ClusterType.Server if is_server else ClusterType.Client
         )
 
+        # Attribute reads in flight, keyed by `(manufacturer, attrid)`, and attributes
+        # waiting to be sent in the next read request for each manufacturer
+        self._pending_reads: dict[tuple[int | None, int], asyncio.Future] = {}
+        self._read_batches: dict[int | None, list[int]] = {}
+
+        # Coalesced attribute updates, as `attrid: (previous value, new value)`
+        self._pending_updates: dict[int, tuple[Any, Any]] = {}
+        self._flush_updates_handle: asyncio.TimerHandle | None = None
+
+        # Attribute writes waiting to be sent together, for each manufacturer
+        self._write_batches: dict[
+            int | None, list[tuple[list[foundation.Attribute], asyncio.Future]]
+        ] = {}
+
     @property
     def attridx(self):
         warnings.warn(
@@ -201,8 +539,12 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         if cluster_id in cls._registry:
             return cls._registry[cluster_id](endpoint, is_server)
 
-        for (start, end), cluster in cls._registry_range.items():
-            if start <= cluster_id <= end:
+        index = bisect.bisect_right(cls._registry_range_starts, cluster_id)
+
+        if index > 0:
+            _, end, cluster = cls._registry_range_index[index - 1]
+
+            if cluster_id <= end:
                 cluster = cluster(endpoint, is_server)
                 cluster.cluster_id = cluster_id
                 return cluster
@@ -214,40 +556,78 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         return cluster
 
     def deserialize(self, data: bytes) -> tuple[foundation.ZCLHeader, ...]:
+        frame = self._deserialize_frame(data)
+
+        return frame.hdr, frame.payload
+
+    def deserialize_frame(self, data: bytes) -> foundation.ZCLFrame:
+        """Decode the header of a frame, deferring payload decoding until it is used."""
+
+        if getattr(self.deserialize, "__func__", None) is not Cluster.deserialize:
+            # Clusters with custom decoding have to be decoded eagerly
+            hdr, payload = self.deserialize(data)
+            return foundation.ZCLFrame(data, hdr, payload=payload)
+
+        return self._deserialize_frame(data)
+
+    def _deserialize_frame(self, data: bytes) -> foundation.ZCLFrame:
         self.debug("Received ZCL frame: %r", data)
 
-        hdr, data = foundation.ZCLHeader.deserialize(data)
+        # Decode the whole frame from one buffer without copying it at each field
+        hdr, payload = foundation.ZCLHeader.deserialize(memoryview(data))
         self.debug("Decoded ZCL frame header: %r", hdr)
 
-        if hdr.frame_control.frame_type == foundation.FrameType.CLUSTER_COMMAND:
-            # Cluster command
-            if hdr.is_reply:
-                commands = self.client_commands
+        frame_control = hdr.frame_control
+        entry = self._get_dispatch_table().get(
+            (frame_control.frame_type, frame_control.is_reply, hdr.command_id)
+        )
+
+        if entry is None:
+            payload = bytes(payload)
+
+            if frame_control.frame_type == foundation.FrameType.CLUSTER_COMMAND:
+                self.warning("Unknown cluster command %s %s", hdr.command_id, payload)
             else:
-                commands = self.server_commands
+                self.warning(
+                    "Unknown foundation command %s %s", hdr.command_id, payload
+                )
 
-            if hdr.command_id not in commands:
-                self.warning("Unknown cluster command %s %s", hdr.command_id, data)
-                return hdr, data
+            return foundation.ZCLFrame(data, hdr, payload=payload)
 
-            command = commands[hdr.command_id]
-        else:
-            # General command
-            if hdr.command_id not in foundation.GENERAL_COMMANDS:
-                self.warning("Unknown foundation command %s %s", hdr.command_id, data)
-                return hdr, data
+        frame_control.is_reply = entry.command.is_reply
 
-            command = foundation.GENERAL_COMMANDS[hdr.command_id]
+        return foundation.ZCLFrame(
+            data,
+            hdr,
+            decoder=functools.partial(
+                self._deserialize_payload, entry.command.schema, payload
+            ),
+            handler=entry.handler,
+        )
 
-        hdr.frame_control.is_reply = command.is_reply
-        response, data = command.schema.deserialize(data)
+    def _deserialize_payload(
+        self, schema: type[foundation.CommandSchema], data: memoryview
+    ) -> foundation.CommandSchema:
+        response, data = schema.deserialize(data)
 
         self.debug("Decoded ZCL frame: %s:%r", type(self).__name__, response)
 
         if data:
-            self.warning("Data remains after deserializing ZCL frame: %r", data)
+            self.warning("Data remains after deserializing ZCL frame: %r", bytes(data))
+
+        return response
+
+    @staticmethod
+    def _serialize_payload(
+        schema: type[t.Struct], args: tuple, kwargs: dict
+    ) -> tuple[t.Struct | None, bytes]:
+        # Commands without arguments share a single empty payload
+        if not args and not kwargs and not schema.fields:
+            return None, b""
+
+        request = schema(*args, **kwargs)  # type:ignore[operator]
 
-        return hdr, response
+        return request, request.serialize()
 
     @util.retryable_request
     def request(
@@ -268,22 +648,17 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
             )
 
         try:
-            request = schema(*args, **kwargs)  # type:ignore[operator]
-            payload = request.serialize()
+            request, payload = self._serialize_payload(schema, args, kwargs)
         except (ValueError, TypeError) as e:
             return future_exception(e)
 
         if tsn is None:
             tsn = self._endpoint.device.application.get_sequence()
 
-        if general:
-            hdr = foundation.ZCLHeader.general(tsn, command_id, manufacturer)
-        else:
-            hdr = foundation.ZCLHeader.cluster(tsn, command_id, manufacturer)
-
-        self.debug("Sending request header: %r", hdr)
-        self.debug("Sending request: %r", request)
-        data = hdr.serialize() + payload
+        data = encode_frame(
+            general, command_id, tsn, payload, manufacturer=manufacturer
+        )
+        self.debug("Sending request: %r (%s)", request, data)
 
         return self._endpoint.request(
             self.cluster_id, tsn, data, expect_reply=expect_reply, command_id=command_id
@@ -306,28 +681,74 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
             )
 
         try:
-            request = schema(*args, **kwargs)  # type:ignore[operator]
-            payload = request.serialize()
+            request, payload = self._serialize_payload(schema, args, kwargs)
         except (ValueError, TypeError) as e:
             return future_exception(e)
 
         if tsn is None:
             tsn = self._endpoint.device.application.get_sequence()
 
-        if general:
-            hdr = foundation.ZCLHeader.general(
-                tsn, command_id, manufacturer, is_reply=True
-            )
-        else:
-            hdr = foundation.ZCLHeader.cluster(
-                tsn, command_id, manufacturer, is_reply=True
+        data = encode_frame(
+            general, command_id, tsn, payload, manufacturer=manufacturer, is_reply=True
+        )
+        self.debug("Sending reply: %r (%s)", request, data)
+
+        return self._endpoint.reply(self.cluster_id, tsn, data, command_id=command_id)
+
+    def handle_frame(
+        self,
+        frame: foundation.ZCLFrame,
+        *,
+        dst_addressing: AddressingMode | None = None,
+    ) -> None:
+        """
+        Dispatch a received frame to its handler, decoding its payload only if
+        something consumes it.
+        """
+
+        if not self._consumes_frame(frame.hdr):
+            self.debug(
+                "Dropping unhandled command 0x%02X (TSN %d) without decoding it",
+                frame.hdr.command_id,
+                frame.hdr.tsn,
             )
+            return
 
-        self.debug("Sending reply header: %r", hdr)
-        self.debug("Sending reply: %r", request)
-        data = hdr.serialize() + payload
+        try:
+            args = frame.payload
+        except ValueError as e:
+            self.error("Failed to parse message (%s), because %s", frame.data.hex(), e)
+            return
 
-        return self._endpoint.reply(self.cluster_id, tsn, data, command_id=command_id)
+        if getattr(self.handle_message, "__func__", None) is not Cluster.handle_message:
+            # Subclasses overriding `handle_message` still receive every frame
+            self.handle_message(frame.hdr, args, dst_addressing=dst_addressing)
+            return
+
+        self._dispatch(frame.hdr, args, frame.handler, dst_addressing=dst_addressing)
+
+    def _consumes_frame(self, hdr: foundation.ZCLHeader) -> bool:
+        """Check if the payload of a received frame is used by anything."""
+
+        # Foundation commands update the attribute cache and are always handled
+        if not hdr.frame_control.is_cluster or self.is_enabled_for(logging.DEBUG):
+            return True
+
+        # Subclasses, like quirks, handle cluster commands by overriding these
+        for name in (
+            "handle_message",
+            "_handle_cluster_command",
+            "handle_cluster_request",
+        ):
+            if getattr(getattr(self, name), "__func__", None) is not getattr(
+                Cluster, name
+            ):
+                return True
+
+        return any(
+            hasattr(listener, "cluster_command")
+            for listener, _ in self._listeners.values()
+        )
 
     def handle_message(
         self,
@@ -336,13 +757,52 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         *,
         dst_addressing: AddressingMode | None = None,
     ):
+        entry = self._get_dispatch_table().get(
+            (hdr.frame_control.frame_type, hdr.frame_control.is_reply, hdr.command_id)
+        )
+        handler = entry.handler if entry is not None else None
+
+        self._dispatch(hdr, args, handler, dst_addressing=dst_addressing)
+
+    def _dispatch(
+        self,
+        hdr: foundation.ZCLHeader,
+        args: list[Any],
+        handler: str | None,
+        *,
+        dst_addressing: AddressingMode | None = None,
+    ) -> None:
         self.debug(
             "Received command 0x%02X (TSN %d): %s", hdr.command_id, hdr.tsn, args
         )
-        if hdr.frame_control.is_cluster:
-            self.handle_cluster_request(hdr, args, dst_addressing=dst_addressing)
-            self.listener_event("cluster_command", hdr.tsn, hdr.command_id, args)
-            return
+
+        # Commands missing from the dispatch table are handled by their frame type
+        if handler is None:
+            if hdr.frame_control.is_cluster:
+                handler = "_handle_cluster_command"
+            else:
+                handler = "_handle_general_command"
+
+        # Handlers are looked up on the instance, so that subclasses can override them
+        getattr(self, handler)(hdr, args, dst_addressing=dst_addressing)
+
+    def _handle_cluster_command(
+        self,
+        hdr: foundation.ZCLHeader,
+        args: list[Any],
+        *,
+        dst_addressing: AddressingMode | None = None,
+    ) -> None:
+        self.handle_cluster_request(hdr, args, dst_addressing=dst_addressing)
+        self.listener_event("cluster_command", hdr.tsn, hdr.command_id, args)
+
+    def _handle_general_command(
+        self,
+        hdr: foundation.ZCLHeader,
+        args: list[Any],
+        *,
+        dst_addressing: AddressingMode | None = None,
+    ) -> None:
         self.listener_event("general_command", hdr, args)
         self.handle_cluster_general_request(hdr, args, dst_addressing=dst_addressing)
 
@@ -367,15 +827,17 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         dst_addressing: AddressingMode | None = None,
     ) -> None:
         if hdr.command_id == foundation.GeneralCommand.Report_Attributes:
-            values = []
+            if self.is_enabled_for(logging.DEBUG):
+                values = []
 
-            for a in args.attribute_reports:
-                if a.attrid in self.attributes:
-                    values.append(f"{self.attributes[a.attrid].name}={a.value.value!r}")
-                else:
-                    values.append(f"0x{a.attrid:04X}={a.value.value!r}")
+                for a in args.attribute_reports:
+                    if a.attrid in self.attributes:
+                        name = self.attributes[a.attrid].name
+                        values.append(f"{name}={a.value.value!r}")
+                    else:
+                        values.append(f"0x{a.attrid:04X}={a.value.value!r}")
 
-            self.debug("Attribute report received: %s", ", ".join(values))
+                self.debug("Attribute report received: %s", ", ".join(values))
 
             for attr in args.attribute_reports:
                 try:
@@ -408,7 +870,13 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         allow_cache: bool = False,
         only_cache: bool = False,
         manufacturer: int | t.uint16_t | None = None,
+        max_age: float | None = None,
     ):
+        """Read attributes, optionally from the attribute cache.
+
+        With `max_age`, cached values updated at most `max_age` seconds ago are used
+        and only stale or missing attributes are read from the device.
+        """
         success, failure = {}, {}
         attribute_ids: list[int] = []
         orig_attributes: dict[int, int | str] = {}
@@ -424,9 +892,11 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
             orig_attributes[attrid] = attribute
 
         to_read = []
-        if allow_cache or only_cache:
+        if allow_cache or only_cache or max_age is not None:
             for idx, attribute in enumerate(attribute_ids):
-                if attribute in self._attr_cache:
+                if attribute in self._attr_cache and not self._attr_is_stale(
+                    attribute, max_age
+                ):
                     success[attributes[idx]] = self._attr_cache[attribute]
                 elif attribute in self.unsupported_attributes:
                     failure[attributes[idx]] = foundation.Status.UNSUPPORTED_ATTRIBUTE
@@ -438,36 +908,121 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         if not to_read or only_cache:
             return success, failure
 
-        result = await self.read_attributes_raw(to_read, manufacturer=manufacturer)
-        if not isinstance(result[0], list):
-            for attrid in to_read:
-                orig_attribute = orig_attributes[attrid]
-                failure[orig_attribute] = result[0]  # Assume default response
-        else:
-            for record in result[0]:
-                orig_attribute = orig_attributes[record.attrid]
-                if record.status == foundation.Status.SUCCESS:
-                    try:
-                        value = self.attributes[record.attrid].type(record.value.value)
-                    except KeyError:
-                        value = record.value.value
-                    except ValueError:
-                        value = record.value.value
-                        self.debug(
-                            "Couldn't normalize %a attribute with %s value",
-                            record.attrid,
-                            value,
-                            exc_info=True,
-                        )
-                    self._update_attribute(record.attrid, value)
-                    success[orig_attribute] = value
-                else:
-                    if record.status == foundation.Status.UNSUPPORTED_ATTRIBUTE:
-                        self.add_unsupported_attribute(record.attrid)
-                    failure[orig_attribute] = record.status
+        results = await self._read_attributes_shared(to_read, manufacturer)
+
+        for attrid in to_read:
+            # Attributes missing from the response are neither a success nor a failure
+            if results[attrid] is None:
+                continue
+
+            is_success, value = results[attrid]
+
+            if is_success:
+                success[orig_attributes[attrid]] = value
+            else:
+                failure[orig_attributes[attrid]] = value
 
         return success, failure
 
+    async def _read_attributes_shared(
+        self, attribute_ids: list[int], manufacturer: int | t.uint16_t | None
+    ) -> dict[int, tuple[bool, Any] | None]:
+        """
+        Read attributes, sharing requests with concurrent reads. Attributes already
+        being read are not requested again and the rest are merged with attributes
+        requested by other callers during the same event loop iteration.
+        """
+
+        loop = asyncio.get_running_loop()
+        futures = {}
+
+        for attrid in attribute_ids:
+            key = (manufacturer, attrid)
+
+            if key not in self._pending_reads:
+                self._pending_reads[key] = loop.create_future()
+
+                if manufacturer not in self._read_batches:
+                    self._read_batches[manufacturer] = []
+                    self.create_catching_task(self._send_read_batch(manufacturer))
+
+                self._read_batches[manufacturer].append(attrid)
+
+            futures[attrid] = self._pending_reads[key]
+
+        # Don't cancel a read that other callers are waiting for
+        results = await asyncio.shield(asyncio.gather(*futures.values()))
+
+        return dict(zip(futures, results))
+
+    async def _send_read_batch(self, manufacturer: int | t.uint16_t | None) -> None:
+        # Let concurrent callers add their attributes to this batch
+        await asyncio.sleep(0)
+
+        attribute_ids = self._read_batches.pop(manufacturer)
+        futures = {
+            attrid: self._pending_reads[manufacturer, attrid]
+            for attrid in attribute_ids
+        }
+
+        results: dict[int, tuple[bool, Any] | None] = dict.fromkeys(futures)
+
+        try:
+            groups = split_records(
+                [t.uint16_t(a) for a in attribute_ids], self._max_payload_size()
+            )
+            responses = await self._send_split(
+                groups,
+                functools.partial(self.read_attributes_raw, manufacturer=manufacturer),
+            )
+
+            for group, result in zip(groups, responses):
+                if not isinstance(result[0], list):
+                    for attrid in group:
+                        results[attrid] = (False, result[0])  # Assume default response
+
+                    continue
+
+                for record in result[0]:
+                    if record.status == foundation.Status.SUCCESS:
+                        try:
+                            value = self.attributes[record.attrid].type(
+                                record.value.value
+                            )
+                        except KeyError:
+                            value = record.value.value
+                        except ValueError:
+                            value = record.value.value
+                            self.debug(
+                                "Couldn't normalize %a attribute with %s value",
+                                record.attrid,
+                                value,
+                                exc_info=True,
+                            )
+                        self._update_attribute(record.attrid, value)
+                        results[record.attrid] = (True, value)
+                    else:
+                        if record.status == foundation.Status.UNSUPPORTED_ATTRIBUTE:
+                            self.add_unsupported_attribute(record.attrid)
+                        results[record.attrid] = (False, record.status)
+        except asyncio.CancelledError:
+            for future in futures.values():
+                future.cancel()
+
+            raise
+        except Exception as exc:
+            for future in futures.values():
+                future.set_exception(exc)
+
+            return
+        finally:
+            # Reads started after the response arrived must send a new request
+            for attrid in attribute_ids:
+                del self._pending_reads[manufacturer, attrid]
+
+        for attrid, future in futures.items():
+            future.set_result(results[attrid])
+
     def read_attributes_rsp(self, attributes, manufacturer=None, *, tsn=None):
         args = []
         for attrid, value in attributes.items():
@@ -491,6 +1046,18 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
                 a.status = foundation.Status.UNSUPPORTED_ATTRIBUTE
                 self.error(str(e))
 
+        groups = split_records(args, self._max_payload_size())
+
+        # A response has a single frame, the requester reads the missing records again
+        if len(groups) > 1:
+            self.warning(
+                "Read attributes response is too large, dropping %d of %d records: %s",
+                len(args) - len(groups[0]),
+                len(args),
+                [record.attrid for group in groups[1:] for record in group],
+            )
+            args = groups[0]
+
         return self._read_attributes_rsp(args, manufacturer=manufacturer, tsn=tsn)
 
     def _write_attr_records(
@@ -539,21 +1106,147 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         self, attrs: list[foundation.Attribute], manufacturer: int | None = None
     ) -> list:
         """Write attributes to device without internal 'attributes' validation"""
-        result = await self._write_attributes(attrs, manufacturer=manufacturer)
-        if not isinstance(result[0], list):
+        # Unvalidated attributes that aren't a list of records are sent as they are
+        if isinstance(attrs, list):
+            groups = split_records(attrs, self._max_payload_size())
+        else:
+            groups = [attrs]
+
+        if len(groups) <= 1:
+            result = await self._write_attributes(attrs, manufacturer=manufacturer)
+            self._cache_written_attributes(attrs, result)
+
             return result
 
+        results = await self._send_split(
+            groups, functools.partial(self._write_attributes, manufacturer=manufacturer)
+        )
+        records = foundation.WriteAttributesResponse()
+
+        for group, result in zip(groups, results):
+            self._cache_written_attributes(group, result)
+
+            if not isinstance(result[0], list):
+                records.extend(
+                    foundation.WriteAttributesStatusRecord(result[0], attr_rec.attrid)
+                    for attr_rec in group
+                )
+            else:
+                records.extend(
+                    rec for rec in result[0] if rec.status != foundation.Status.SUCCESS
+                )
+
+        return self._write_attributes_result(records)
+
+    def _write_attributes_result(
+        self, records: list[foundation.WriteAttributesStatusRecord]
+    ) -> list:
+        """Build a `Write_Attributes_rsp` from the failed status records."""
+        if not records:
+            records = foundation.WriteAttributesResponse(
+                [foundation.WriteAttributesStatusRecord(foundation.Status.SUCCESS)]
+            )
+
+        schema = foundation.GENERAL_COMMANDS[
+            foundation.GeneralCommand.Write_Attributes_rsp
+        ].schema
+
+        return schema(status_records=records)
+
+    async def write_attributes_batched(
+        self, attributes: dict[str | int, Any], manufacturer: int | None = None
+    ) -> list:
+        """Write attributes together with other writes made within the batching window.
+
+        The response only contains the status of the attributes written by this call.
+        """
+        attrs = self._write_attr_records(attributes)
+        future = asyncio.get_running_loop().create_future()
+
+        if manufacturer not in self._write_batches:
+            self._write_batches[manufacturer] = []
+            self.create_catching_task(self._send_write_batch(manufacturer))
+
+        self._write_batches[manufacturer].append((attrs, future))
+
+        return await future
+
+    async def _send_write_batch(self, manufacturer: int | None) -> None:
+        await asyncio.sleep(self.write_batching_window or 0)
+
+        batch = self._write_batches.pop(manufacturer)
+        records: dict[int, foundation.Attribute] = {}
+
+        # The most recent write of an attribute wins
+        for attrs, _ in batch:
+            for attr_rec in attrs:
+                records[attr_rec.attrid] = attr_rec
+
+        try:
+            result = await self.write_attributes_raw(
+                list(records.values()), manufacturer
+            )
+        except asyncio.CancelledError:
+            for _, future in batch:
+                future.cancel()
+
+            raise
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+
+            return
+
+        for attrs, future in batch:
+            if future.done():
+                continue
+
+            # Default responses apply to every attribute
+            if not isinstance(result[0], list):
+                future.set_result(result)
+                continue
+
+            attrids = {attr_rec.attrid for attr_rec in attrs}
+            future.set_result(
+                self._write_attributes_result(
+                    [
+                        rec
+                        for rec in result[0]
+                        if rec.status != foundation.Status.SUCCESS
+                        and rec.attrid in attrids
+                    ]
+                )
+            )
+
+    def _attr_is_stale(self, attrid: int, max_age: float | None) -> bool:
+        """Check if a cached attribute was last updated more than `max_age` ago."""
+        if max_age is None:
+            return False
+
+        # Attributes cached without a timestamp are of unknown age
+        last_updated = self._attr_last_updated.get(attrid, 0)
+
+        return time.time() - last_updated > max_age
+
+    def _cache_written_attributes(
+        self, attrs: list[foundation.Attribute], result: list
+    ) -> None:
+        if not isinstance(result[0], list):
+            return
+
         records = result[0]
+        now = time.time()
         if len(records) == 1 and records[0].status == foundation.Status.SUCCESS:
             for attr_rec in attrs:
                 self._attr_cache[attr_rec.attrid] = attr_rec.value.value
+                self._attr_last_updated[attr_rec.attrid] = now
         else:
             failed = [rec.attrid for rec in records]
             for attr_rec in attrs:
                 if attr_rec.attrid not in failed:
                     self._attr_cache[attr_rec.attrid] = attr_rec.value.value
-
-        return result
+                    self._attr_last_updated[attr_rec.attrid] = now
 
     def write_attributes_undivided(
         self, attributes: dict[str | int, Any], manufacturer: int | None = None
@@ -625,7 +1318,12 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
             self._attr_reporting_rec(attr, rep[0], rep[1], rep[2])
             for attr, rep in attributes.items()
         ]
-        res = await self._configure_reporting(cfg, manufacturer=manufacturer)
+        groups = split_records(cfg, self._max_payload_size())
+
+        if len(groups) <= 1:
+            res = await self._configure_reporting(cfg, manufacturer=manufacturer)
+        else:
+            res = await self._configure_reporting_split(groups, manufacturer)
 
         # Parse configure reporting result for unsupported attributes
         records = res[0]
@@ -645,6 +1343,74 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
                 self.add_unsupported_attribute(attr)
         return res
 
+    async def _configure_reporting_split(
+        self,
+        groups: list[list[foundation.AttributeReportingConfig]],
+        manufacturer: int | None,
+    ) -> list:
+        results = await self._send_split(
+            groups,
+            functools.partial(self._configure_reporting, manufacturer=manufacturer),
+        )
+        records = foundation.ConfigureReportingResponse()
+
+        for group, result in zip(groups, results):
+            if not isinstance(result[0], list):
+                records.extend(
+                    foundation.ConfigureReportingResponseRecord(
+                        result[0], cfg.direction, cfg.attrid
+                    )
+                    for cfg in group
+                )
+            else:
+                records.extend(
+                    rec for rec in result[0] if rec.status != foundation.Status.SUCCESS
+                )
+
+        if not records:
+            records.append(
+                foundation.ConfigureReportingResponseRecord(foundation.Status.SUCCESS)
+            )
+
+        schema = foundation.GENERAL_COMMANDS[
+            foundation.GeneralCommand.Configure_Reporting_rsp
+        ].schema
+
+        return schema(status_records=records)
+
+    def _max_payload_size(self) -> int | None:
+        """
+        Largest ZCL payload that fits in a single frame to the device. `None` if
+        neither the radio nor the device report a limit, to send everything in one.
+        """
+        device = self._endpoint.device
+        node_desc = device.node_desc
+        limits = [
+            device.application.max_zcl_frame_size,
+            getattr(node_desc, "maximum_incoming_transfer_size", None),
+        ]
+
+        # Some devices advertise a transfer size of zero
+        limits = [size for size in limits if isinstance(size, int) and size > 0]
+
+        if not limits:
+            return None
+
+        # Quirks may add a manufacturer code to the header later
+        return min(limits) - MAX_HEADER_SIZE
+
+    async def _send_split(
+        self, groups: list[list], send: Callable[[list], Coroutine]
+    ) -> list:
+        """Send each group of records in its own frame, a few frames at a time."""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_FRAMES)
+
+        async def send_group(group: list) -> Any:
+            async with semaphore:
+                return await send(group)
+
+        return await asyncio.gather(*(send_group(group) for group in groups))
+
     def command(
         self,
         command_id: foundation.GeneralCommand | int | t.uint8_t,
@@ -716,9 +1482,57 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         self._update_attribute(attrid, value)
 
     def _update_attribute(self, attrid, value):
+        if self.attribute_coalescing_window is not None:
+            self._coalesce_attribute_update(attrid, value)
+            return
+
         self._attr_cache[attrid] = value
+        self._attr_last_updated[attrid] = time.time()
         self.listener_event("attribute_updated", attrid, value)
 
+    def _coalesce_attribute_update(self, attrid: int, value: Any) -> None:
+        """Update the attribute cache now but only notify listeners once per window."""
+        if attrid in self._pending_updates:
+            previous, _ = self._pending_updates[attrid]
+        else:
+            previous = self._attr_cache.get(attrid, _NO_VALUE)
+
+        self._attr_cache[attrid] = value
+        self._attr_last_updated[attrid] = time.time()
+        self._pending_updates[attrid] = (previous, value)
+
+        if self._flush_updates_handle is not None:
+            return
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # Updates made outside of the event loop cannot be delayed
+            self._flush_attribute_updates()
+            return
+
+        self._flush_updates_handle = loop.call_later(
+            self.attribute_coalescing_window, self._flush_attribute_updates
+        )
+
+    def _flush_attribute_updates(self) -> None:
+        """Emit all pending attribute updates as a single event."""
+        pending = self._pending_updates
+        self._pending_updates = {}
+        self._flush_updates_handle = None
+
+        updates = {
+            attrid: value
+            for attrid, (previous, value) in pending.items()
+            if not self.suppress_unchanged_attributes or previous != value
+        }
+
+        if not updates:
+            return
+
+        self.debug("Coalesced %d attribute updates", len(updates))
+        self.listener_event("attributes_updated", updates)
+
     def log(self, lvl, msg, *args, **kwargs):
         msg = "[%s:%s:0x%04x] " + msg
         args = (
@@ -755,7 +1569,11 @@ class Cluster(util.ListenableMixin, util.CatchingTaskMixin):
         """Set cached value through attribute write."""
         if not isinstance(key, (int, str)):
             raise ValueError("attr_name or attr_id are accepted only")
-        self.create_catching_task(self.write_attributes({key: value}))
+
+        if self.write_batching_window is not None:
+            self.create_catching_task(self.write_attributes_batched({key: value}))
+        else:
+            self.create_catching_task(self.write_attributes({key: value}))
 
     def general_command(
         self,
@@ -868,11 +1686,11 @@ class ClusterPersistingListener:
     def attribute_updated(self, attrid, value):
         self._applistener.attribute_updated(self._cluster, attrid, value)
 
-    def cluster_command(self, *args, **kwargs):
-        pass
+    def attributes_updated(self, updates: dict[int, Any]) -> None:
+        self._applistener.attributes_updated(self._cluster, updates)
 
-    def general_command(self, *args, **kwargs):
-        pass
+    # Commands are not persisted. Not listening for them lets clusters skip decoding
+    # commands that nothing else consumes.
 
     def unsupported_attribute_added(self, attrid: int) -> None:
         """An unsupported attribute was added."""
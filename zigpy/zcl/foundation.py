@@ -100,6 +100,7 @@ class TypeValue:
         return self.type.to_bytes(1, "little") + self.value.serialize()
 
     @classmethod
+    @t.zero_copy_deserialize
     def deserialize(cls, data):
         self = cls()
         self.type, data = t.uint8_t.deserialize(data)
@@ -117,6 +118,7 @@ class TypeValue:
 
 class TypedCollection(TypeValue):
     @classmethod
+    @t.zero_copy_deserialize
     def deserialize(cls, data):
         self = cls()
         self.type, data = data[0], data[1:]
@@ -253,6 +255,7 @@ class WriteAttributesResponse(list):
     """
 
     @classmethod
+    @t.zero_copy_deserialize
     def deserialize(cls, data: bytes) -> tuple[WriteAttributesResponse, bytes]:
         record, data = WriteAttributesStatusRecord.deserialize(data)
         r = cls([record])
@@ -586,6 +589,52 @@ class ZCLHeader(t.Struct):
         )
 
 
+class ZCLFrame:
+    """
+    Received ZCL frame with an eagerly decoded header. The payload is only decoded
+    when it is first accessed, so frames that are dropped are never fully parsed.
+    """
+
+    __slots__ = ("data", "hdr", "handler", "_decoder", "_payload")
+
+    def __init__(
+        self,
+        data: bytes,
+        hdr: ZCLHeader,
+        *,
+        decoder: typing.Callable[[], typing.Any] | None = None,
+        payload: typing.Any = None,
+        handler: str | None = None,
+    ) -> None:
+        self.data = data
+        self.hdr = hdr
+        # Name of the cluster method handling the frame, if known when it was decoded
+        self.handler = handler
+        self._decoder = decoder
+        self._payload = payload
+
+    @property
+    def payload(self) -> typing.Any:
+        """Decoded payload. Decoding errors are raised here, not on reception."""
+        if self._decoder is not None:
+            self._payload = self._decoder()
+            self._decoder = None
+
+        return self._payload
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._decoder is None
+
+    def __iter__(self) -> typing.Iterator:
+        # Allow unpacking into the `(hdr, payload)` tuple returned by `deserialize`
+        return iter((self.hdr, self.payload))
+
+    def __repr__(self) -> str:
+        payload = self._payload if self.is_decoded else "<not decoded>"
+        return f"{type(self).__name__}(hdr={self.hdr!r}, payload={payload!r})"
+
+
 @dataclasses.dataclass(frozen=True)
 class ZCLCommandDef:
     name: str = None
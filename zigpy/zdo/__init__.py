@@ -16,6 +16,8 @@ LOGGER = logging.getLogger(__name__)
 class ZDO(zigpy.util.CatchingTaskMixin, zigpy.util.ListenableMixin):
     """The ZDO endpoint of a device"""
 
+    logger = LOGGER
+
     class LeaveOptions(t.bitmap8):
         """ZDO Mgmt_Leave_req Options."""
 
@@ -33,12 +35,12 @@ class ZDO(zigpy.util.CatchingTaskMixin, zigpy.util.ListenableMixin):
         return data
 
     def deserialize(self, cluster_id, data):
-        hdr, data = types.ZDOHeader.deserialize(cluster_id, data)
+        hdr, data = types.ZDOHeader.deserialize(cluster_id, memoryview(data))
         try:
             cluster_details = types.CLUSTERS[cluster_id]
         except KeyError:
             self.warning("Unknown ZDO cluster 0x%04x", cluster_id)
-            return hdr, data
+            return hdr, bytes(data)
 
         args, data = t.deserialize(data, cluster_details[1])
         if data != b"":